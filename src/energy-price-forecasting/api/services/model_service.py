@@ -13,6 +13,7 @@ Supports:
 """
 
 from typing import Optional, Dict, Any, List
+import importlib.util
 import logging
 from pathlib import Path
 import pickle
@@ -25,19 +26,23 @@ logger = get_logger(__name__)
 # Global model cache
 _model_cache: Dict[str, Any] = {}
 
-# Try to import MLflow components
-try:
-    import mlflow
-    from mlflow.tracking import MlflowClient
+# MLflow itself is imported on first model load (see _load_mlflow); the
+# registry wrapper defers its own import the same way
+MLFLOW_AVAILABLE = importlib.util.find_spec('mlflow') is not None
+mlflow = None
+if MLFLOW_AVAILABLE:
     from mlflow_tracking.model_registry import ModelRegistry
-    MLFLOW_AVAILABLE = True
-except ImportError:
-    MLFLOW_AVAILABLE = False
-    mlflow = None
-    MlflowClient = None
+else:
     ModelRegistry = None
 
 
+def _load_mlflow():
+    """Import MLflow into this module on first use."""
+    global mlflow
+    if mlflow is None:
+        import mlflow
+
+
 class ModelService:
     """
     Service for loading and managing ML models.
@@ -187,6 +192,7 @@ class ModelService:
             )
             
             # Load model using MLflow
+            _load_mlflow()
             model = mlflow.pyfunc.load_model(model_uri)
             
             logger.info(f"Loaded model from MLflow: {model_uri}")
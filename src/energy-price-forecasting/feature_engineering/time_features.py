@@ -13,7 +13,7 @@ Version: 1.0
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import logging
 
 try:
@@ -25,6 +25,238 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DATE_FEATURE_COLUMNS = [
+    'day_of_week',
+    'month',
+    'quarter',
+    'year',
+    'day_of_month',
+    'week_of_year',
+    'is_weekend',
+]
+
+
+def _attach_features(
+    df: pd.DataFrame,
+    features: Dict[str, Union[pd.Series, np.ndarray, float]]
+) -> pd.DataFrame:
+    """
+    Return a copy of df with the given feature columns attached.
+    
+    New columns are concatenated in one operation; columns that already exist
+    in df are overwritten in place on the result, preserving their position.
+    """
+    new_cols = {name: values for name, values in features.items() if name not in df.columns}
+    
+    if new_cols:
+        df_result = pd.concat([df, pd.DataFrame(new_cols, index=df.index)], axis=1)
+    else:
+        df_result = df.copy()
+    
+    for name, values in features.items():
+        if name not in new_cols:
+            df_result[name] = values
+    
+    return df_result
+
+
+def _create_lag_arrays(
+    series: pd.Series,
+    column: str,
+    lags: List[int]
+) -> Dict[str, pd.Series]:
+    """Build lag columns for series without touching the parent DataFrame."""
+    features = {}
+    
+    for lag in lags:
+        col_name = f'{column}_lag_{lag}'
+        features[col_name] = series.shift(lag)
+        logger.debug(f"Created {col_name} with lag period {lag}")
+    
+    logger.info(f"Created {len(lags)} lag features for '{column}'")
+    
+    return features
+
+
+def _rolling_arrays(
+    series: pd.Series,
+    column: str,
+    windows: List[int],
+    statistics: List[str]
+) -> Dict[str, pd.Series]:
+    """Build rolling statistic columns for series."""
+    features = {}
+    
+    # Convert once to a contiguous float64 buffer so each rolling kernel
+    # reads it directly instead of re-coercing the column per window
+    values = pd.Series(
+        np.ascontiguousarray(series.to_numpy(dtype=np.float64)),
+        index=series.index
+    )
+    
+    for window in windows:
+        rolling_window = values.rolling(window=window, min_periods=1)
+        
+        for stat in statistics:
+            col_name = f'{column}_roll_{window}_{stat}'
+            
+            if stat == 'mean':
+                features[col_name] = rolling_window.mean()
+            elif stat == 'std':
+                features[col_name] = rolling_window.std()
+            elif stat == 'min':
+                features[col_name] = rolling_window.min()
+            elif stat == 'max':
+                features[col_name] = rolling_window.max()
+            elif stat == 'median':
+                features[col_name] = rolling_window.median()
+            elif stat == 'var':
+                features[col_name] = rolling_window.var()
+            elif stat == 'skew':
+                features[col_name] = rolling_window.skew()
+            elif stat == 'kurt':
+                features[col_name] = rolling_window.kurt()
+            else:
+                logger.warning(f"Unknown statistic '{stat}', skipping...")
+                continue
+            
+            logger.debug(f"Calculated {col_name} with window size {window}")
+    
+    logger.info(f"Created {len(features)} rolling statistic features for '{column}'")
+    
+    return features
+
+
+def _seasonal_arrays(
+    series: pd.Series,
+    column: str,
+    model: str = 'additive',
+    period: Optional[int] = None,
+    extrapolate_trend: str = 'freq'
+) -> Dict[str, pd.Series]:
+    """Build trend/seasonal/residual columns for series (NaN on failure)."""
+    nan_features = {
+        f'{column}_trend': np.nan,
+        f'{column}_seasonal': np.nan,
+        f'{column}_residual': np.nan,
+    }
+    
+    # If statsmodels is not available, log and fill with NaNs
+    if not SEASONAL_DECOMPOSE_AVAILABLE:
+        logger.warning(
+            "statsmodels is not installed; skipping seasonal decomposition and "
+            "filling trend/seasonal/residual with NaN. "
+            "Install 'statsmodels' for full functionality."
+        )
+        return nan_features
+    
+    # Check if we have enough data points
+    min_points = period * 2 if period else 20
+    if len(series) < min_points:
+        logger.warning(
+            f"Not enough data points for seasonal decomposition (need at least {min_points}). "
+            f"Filling with NaN values."
+        )
+        return nan_features
+    
+    try:
+        # Perform seasonal decomposition
+        decomposition = seasonal_decompose(
+            series,
+            model=model,
+            period=period,
+            extrapolate_trend=extrapolate_trend
+        )
+        
+        logger.info(
+            f"Performed seasonal decomposition for '{column}' "
+            f"with model='{model}', period={period}"
+        )
+        
+        return {
+            f'{column}_trend': decomposition.trend,
+            f'{column}_seasonal': decomposition.seasonal,
+            f'{column}_residual': decomposition.resid,
+        }
+        
+    except Exception as e:
+        logger.error(f"Seasonal decomposition failed: {e}. Filling with NaN values.")
+        return nan_features
+
+
+def _ensure_datetime(dates: pd.Series) -> pd.Series:
+    """Return dates unchanged if already datetime, otherwise parsed."""
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+    return pd.to_datetime(dates)
+
+
+def _iso_weeks_in_year(year: np.ndarray) -> np.ndarray:
+    """Number of ISO 8601 weeks (52 or 53) in each year."""
+    def weekday_of_dec_31(y):
+        return (y + y // 4 - y // 100 + y // 400) % 7
+    
+    long_year = (weekday_of_dec_31(year) == 4) | (weekday_of_dec_31(year - 1) == 3)
+    return 52 + long_year.astype(year.dtype)
+
+
+def _iso_week_of_year(
+    year: np.ndarray,
+    day_of_year: np.ndarray,
+    day_of_week: np.ndarray
+) -> np.ndarray:
+    """
+    ISO 8601 week number computed directly from calendar components.
+    
+    Equivalent to ``Series.dt.isocalendar().week`` without materialising the
+    intermediate (year, week, day) DataFrame. day_of_week is Monday=0.
+    """
+    week = (day_of_year - day_of_week + 9) // 7
+    # Days before the first ISO week belong to the last week of the prior year;
+    # days after the last ISO week belong to week 1 of the next year
+    return np.where(
+        week < 1,
+        _iso_weeks_in_year(year - 1),
+        np.where(week > _iso_weeks_in_year(year), 1, week)
+    )
+
+
+def _date_arrays(dates: pd.Series) -> Dict[str, np.ndarray]:
+    """Build calendar feature columns from a datetime series."""
+    if dates.isna().any():
+        # Missing dates cannot be held in int32; keep pandas' nullable results
+        day_of_week = dates.dt.dayofweek
+        features = {
+            'day_of_week': day_of_week,
+            'month': dates.dt.month,
+            'quarter': dates.dt.quarter,
+            'year': dates.dt.year,
+            'day_of_month': dates.dt.day,
+            'week_of_year': dates.dt.isocalendar().week,
+            'is_weekend': (day_of_week >= 5).astype(int),
+        }
+    else:
+        index = pd.DatetimeIndex(dates)
+        day_of_week = index.dayofweek.to_numpy()
+        year = index.year.to_numpy()
+        
+        # All date features are small bounded integers: build them as one
+        # int32 block so they attach as a single column group
+        stacked = np.stack([
+            day_of_week,
+            index.month.to_numpy(),
+            index.quarter.to_numpy(),
+            year,
+            index.day.to_numpy(),
+            _iso_week_of_year(year, index.dayofyear.to_numpy(), day_of_week),
+            day_of_week >= 5,
+        ], axis=1).astype(np.int32, copy=False)
+        features = dict(zip(DATE_FEATURE_COLUMNS, stacked.T))
+    
+    logger.info(f"Created {len(features)} date-based features from '{dates.name}'")
+    
+    return features
+
 
 def create_lag_features(
     df: pd.DataFrame,
@@ -58,16 +290,7 @@ def create_lag_features(
     if column not in df.columns:
         raise ValueError(f"Column '{column}' not found in DataFrame")
     
-    df_result = df.copy()
-    
-    for lag in lags:
-        col_name = f'{column}_lag_{lag}'
-        df_result[col_name] = df_result[column].shift(lag)
-        logger.debug(f"Created {col_name} with lag period {lag}")
-    
-    logger.info(f"Created {len(lags)} lag features for '{column}'")
-    
-    return df_result
+    return _attach_features(df, _create_lag_arrays(df[column], column, lags))
 
 
 def calculate_rolling_statistics(
@@ -106,41 +329,9 @@ def calculate_rolling_statistics(
     if column not in df.columns:
         raise ValueError(f"Column '{column}' not found in DataFrame")
     
-    df_result = df.copy()
-    feature_count = 0
-    
-    for window in windows:
-        rolling_window = df_result[column].rolling(window=window, min_periods=1)
-        
-        for stat in statistics:
-            col_name = f'{column}_roll_{window}_{stat}'
-            
-            if stat == 'mean':
-                df_result[col_name] = rolling_window.mean()
-            elif stat == 'std':
-                df_result[col_name] = rolling_window.std()
-            elif stat == 'min':
-                df_result[col_name] = rolling_window.min()
-            elif stat == 'max':
-                df_result[col_name] = rolling_window.max()
-            elif stat == 'median':
-                df_result[col_name] = rolling_window.median()
-            elif stat == 'var':
-                df_result[col_name] = rolling_window.var()
-            elif stat == 'skew':
-                df_result[col_name] = rolling_window.skew()
-            elif stat == 'kurt':
-                df_result[col_name] = rolling_window.kurt()
-            else:
-                logger.warning(f"Unknown statistic '{stat}', skipping...")
-                continue
-            
-            feature_count += 1
-            logger.debug(f"Calculated {col_name} with window size {window}")
-    
-    logger.info(f"Created {feature_count} rolling statistic features for '{column}'")
-    
-    return df_result
+    return _attach_features(
+        df, _rolling_arrays(df[column], column, windows, statistics)
+    )
 
 
 def seasonal_decompose_features(
@@ -181,58 +372,9 @@ def seasonal_decompose_features(
     if column not in df.columns:
         raise ValueError(f"Column '{column}' not found in DataFrame")
     
-    df_result = df.copy()
-    
-    # If statsmodels is not available, log and fill with NaNs
-    if not SEASONAL_DECOMPOSE_AVAILABLE:
-        logger.warning(
-            "statsmodels is not installed; skipping seasonal decomposition and "
-            "filling trend/seasonal/residual with NaN. "
-            "Install 'statsmodels' for full functionality."
-        )
-        df_result[f'{column}_trend'] = np.nan
-        df_result[f'{column}_seasonal'] = np.nan
-        df_result[f'{column}_residual'] = np.nan
-        return df_result
-    
-    # Check if we have enough data points
-    min_points = period * 2 if period else 20
-    if len(df_result) < min_points:
-        logger.warning(
-            f"Not enough data points for seasonal decomposition (need at least {min_points}). "
-            f"Filling with NaN values."
-        )
-        df_result[f'{column}_trend'] = np.nan
-        df_result[f'{column}_seasonal'] = np.nan
-        df_result[f'{column}_residual'] = np.nan
-        return df_result
-    
-    try:
-        # Perform seasonal decomposition
-        decomposition = seasonal_decompose(
-            df_result[column],
-            model=model,
-            period=period,
-            extrapolate_trend=extrapolate_trend
-        )
-        
-        # Add components as features
-        df_result[f'{column}_trend'] = decomposition.trend
-        df_result[f'{column}_seasonal'] = decomposition.seasonal
-        df_result[f'{column}_residual'] = decomposition.resid
-        
-        logger.info(
-            f"Performed seasonal decomposition for '{column}' "
-            f"with model='{model}', period={period}"
-        )
-        
-    except Exception as e:
-        logger.error(f"Seasonal decomposition failed: {e}. Filling with NaN values.")
-        df_result[f'{column}_trend'] = np.nan
-        df_result[f'{column}_seasonal'] = np.nan
-        df_result[f'{column}_residual'] = np.nan
-    
-    return df_result
+    return _attach_features(
+        df, _seasonal_arrays(df[column], column, model, period, extrapolate_trend)
+    )
 
 
 def create_date_features(
@@ -270,24 +412,12 @@ def create_date_features(
     if date_column not in df.columns:
         raise ValueError(f"Column '{date_column}' not found in DataFrame")
     
-    df_result = df.copy()
-    
-    # Ensure date column is datetime
-    if not pd.api.types.is_datetime64_any_dtype(df_result[date_column]):
-        df_result[date_column] = pd.to_datetime(df_result[date_column])
-    
-    # Extract date features
-    df_result['day_of_week'] = df_result[date_column].dt.dayofweek
-    df_result['month'] = df_result[date_column].dt.month
-    df_result['quarter'] = df_result[date_column].dt.quarter
-    df_result['year'] = df_result[date_column].dt.year
-    df_result['day_of_month'] = df_result[date_column].dt.day
-    df_result['week_of_year'] = df_result[date_column].dt.isocalendar().week
-    df_result['is_weekend'] = (df_result['day_of_week'] >= 5).astype(int)
-    
-    logger.info(f"Created 7 date-based features from '{date_column}'")
+    dates = _ensure_datetime(df[date_column])
+    features = _date_arrays(dates)
+    if dates is not df[date_column]:
+        features[date_column] = dates
     
-    return df_result
+    return _attach_features(df, features)
 
 
 def add_all_time_features(
@@ -327,38 +457,44 @@ def add_all_time_features(
         >>> assert 'price_lag_1' in df_enriched.columns
         >>> assert 'price_roll_30_mean' in df_enriched.columns
     """
-    df_result = df.copy()
-    
     logger.info("Adding all time-based features...")
     
-    # Add lag features
-    df_result = create_lag_features(df_result, column=price_col, lags=lag_periods)
-    
-    # Add rolling statistics
-    df_result = calculate_rolling_statistics(
-        df_result,
-        column=price_col,
-        windows=rolling_windows,
-        statistics=rolling_statistics
+    if price_col not in df.columns:
+        raise ValueError(f"Column '{price_col}' not found in DataFrame")
+    
+    if lag_periods is None:
+        lag_periods = [1, 7, 30]
+    if rolling_windows is None:
+        rolling_windows = [7, 30, 90]
+    if rolling_statistics is None:
+        rolling_statistics = ['mean', 'std', 'min', 'max']
+    
+    # Collect every new column first and attach them in a single step, so the
+    # growing frame is copied once rather than once per feature group
+    prices = df[price_col]
+    features = _create_lag_arrays(prices, price_col, lag_periods)
+    features.update(
+        _rolling_arrays(prices, price_col, rolling_windows, rolling_statistics)
     )
     
     # Add seasonal decomposition
-    if len(df_result) >= 20:  # Minimum required for decomposition
-        df_result = seasonal_decompose_features(
-            df_result,
-            column=price_col,
-            model=seasonal_model,
-            period=seasonal_period
+    if len(df) >= 20:  # Minimum required for decomposition
+        features.update(
+            _seasonal_arrays(prices, price_col, seasonal_model, seasonal_period)
         )
     else:
         logger.warning("Not enough data for seasonal decomposition, skipping...")
     
     # Add date features if date column is specified
-    if date_col and date_col in df_result.columns:
-        df_result = create_date_features(df_result, date_column=date_col)
+    if date_col and date_col in df.columns:
+        dates = _ensure_datetime(df[date_col])
+        features.update(_date_arrays(dates))
+        if dates is not df[date_col]:
+            features[date_col] = dates
+    
+    df_result = _attach_features(df, features)
     
     num_features = len([col for col in df_result.columns if col not in df.columns])
     logger.info(f"Added {num_features} time-based features")
     
     return df_result
-
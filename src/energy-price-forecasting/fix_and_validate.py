@@ -11,16 +11,12 @@ Usage: python fix_and_validate.py
 """
 
 import sys
-import io
 from pathlib import Path
 from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
-
-# Fix Windows encoding
-if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 
 # Add project root to path
 project_root = Path(__file__).parent
@@ -28,7 +24,7 @@ sys.path.insert(0, str(project_root))
 
 from database.utils import get_session
 from database.models import Commodity, DataSource, PriceData
-from database.operations import get_price_data, get_latest_price
+from database.operations import get_latest_price
 
 
 def check_and_fix_data():
@@ -48,23 +44,31 @@ def check_and_fix_data():
         end_date = datetime.now()
         start_date = end_date - timedelta(days=90)
         
-        for commodity in ["WTI", "BRENT", "NG"]:
-            try:
-                df = get_price_data(
-                    commodity_symbol=commodity,
-                    source_name="EIA",
-                    start_date=start_date,
-                    end_date=end_date
+        symbols = ["WTI", "BRENT", "NG"]
+        try:
+            # One grouped query instead of a get_price_data() round-trip per commodity
+            counts = dict(
+                session.query(Commodity.symbol, func.count(PriceData.timestamp))
+                .join(PriceData, PriceData.commodity_id == Commodity.id)
+                .join(DataSource, PriceData.source_id == DataSource.id)
+                .filter(
+                    DataSource.name == "EIA",
+                    PriceData.timestamp.between(start_date, end_date),
+                    Commodity.symbol.in_(symbols)
                 )
-                
-                if df is None or df.empty:
-                    print(f"[WARN] No data for {commodity} - will create test data")
-                    create_test_data(commodity)
-                else:
-                    print(f"[OK] {commodity}: {len(df)} records")
-            except Exception as e:
-                print(f"[WARN] Error checking {commodity}: {e}")
+                .group_by(Commodity.symbol)
+                .all()
+            )
+        except Exception as e:
+            print(f"[WARN] Error checking price data: {e}")
+            counts = {}
+        
+        for commodity in symbols:
+            if counts.get(commodity, 0) == 0:
+                print(f"[WARN] No data for {commodity} - will create test data")
                 create_test_data(commodity)
+            else:
+                print(f"[OK] {commodity}: {counts[commodity]} records")
 
 
 def create_test_data(commodity_symbol="WTI"):
@@ -114,55 +118,51 @@ def create_test_data(commodity_symbol="WTI"):
         }
         base_price = base_prices.get(commodity_symbol, 75.0)
         
+        # Draw all random components up front rather than per row
+        n_days = 120
+        rng = np.random.default_rng()
+        days = np.arange(n_days)
+        trend = 0.05 * np.sin(days / 30)  # Seasonal trend
+        prices = base_price + trend * 10 + rng.normal(0, 1.5, n_days)
+        
+        # Ensure reasonable price range
+        if commodity_symbol == "NG":
+            np.clip(prices, 1.0, 10.0, out=prices)
+        else:
+            np.clip(prices, 50.0, 150.0, out=prices)
+        
+        volumes = 1000000 + rng.integers(-200000, 200000, n_days)
+        open_prices = prices - rng.uniform(0, 1, n_days)
+        high_prices = prices + rng.uniform(0, 2, n_days)
+        low_prices = prices - rng.uniform(0, 2, n_days)
+        
         test_data = []
-        for i in range(120):
-            date = base_date + timedelta(days=i)
-            # Simulate realistic price movement
-            trend = 0.05 * np.sin(i / 30)  # Seasonal trend
-            noise = np.random.normal(0, 1.5)
-            price = base_price + trend * 10 + noise
-            
-            # Ensure reasonable price range
-            if commodity_symbol == "NG":
-                price = max(1.0, min(price, 10.0))
-            else:
-                price = max(50.0, min(price, 150.0))
-            
+        for i in range(n_days):
             test_data.append({
-                'timestamp': date,
-                'price': float(price),
-                'volume': int(1000000 + np.random.randint(-200000, 200000)),
-                'open_price': float(price - np.random.uniform(0, 1)),
-                'high_price': float(price + np.random.uniform(0, 2)),
-                'low_price': float(price - np.random.uniform(0, 2)),
-                'close_price': float(price)
+                'timestamp': base_date + timedelta(days=i),
+                'price': float(prices[i]),
+                'volume': int(volumes[i]),
+                'open_price': float(open_prices[i]),
+                'high_price': float(high_prices[i]),
+                'low_price': float(low_prices[i]),
+                'close_price': float(prices[i])
             })
         
-        # Insert data
-        for data_point in test_data:
-            # Check if record already exists
-            existing = session.query(PriceData).filter(
-                PriceData.commodity_id == commodity.id,
-                PriceData.source_id == source.id,
-                PriceData.timestamp == data_point['timestamp']
-            ).first()
-            
-            if not existing:
-                price_record = PriceData(
-                    commodity_id=commodity.id,
-                    source_id=source.id,
-                    timestamp=data_point['timestamp'],
-                    price=data_point['price'],
-                    volume=data_point['volume'],
-                    open_price=data_point['open_price'],
-                    high_price=data_point['high_price'],
-                    low_price=data_point['low_price'],
-                    close_price=data_point['close_price']
-                )
-                session.add(price_record)
-        
+        # Insert data in one statement, skipping rows that already exist
+        rows = [
+            {
+                'commodity_id': commodity.id,
+                'source_id': source.id,
+                **data_point
+            }
+            for data_point in test_data
+        ]
+        stmt = insert(PriceData).values(rows).on_conflict_do_nothing(
+            index_elements=["timestamp", "commodity_id", "source_id"]
+        )
+        result = session.execute(stmt)
         session.commit()
-        print(f"   [OK] Created {len(test_data)} test records for {commodity_symbol}")
+        print(f"   [OK] Created {result.rowcount} test records for {commodity_symbol}")
 
 
 def fix_forecast_data_query():
@@ -254,7 +254,23 @@ def main():
     return success
 
 
+def configure_console_encoding():
+    """
+    Make console output UTF-8 on Windows when running as a script.
+    
+    Skipped when Python already runs in UTF-8 mode (PYTHONUTF8=1 or -X utf8),
+    and never applied on import so tests keep their own stdout/stderr.
+    """
+    if sys.platform != 'win32' or sys.flags.utf8_mode:
+        return
+    
+    for stream in (sys.stdout, sys.stderr):
+        if stream.encoding.lower() != 'utf-8':
+            stream.reconfigure(encoding='utf-8', errors='replace')
+
+
 if __name__ == "__main__":
+    configure_console_encoding()
     success = main()
     sys.exit(0 if success else 1)
 
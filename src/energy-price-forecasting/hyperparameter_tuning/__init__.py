@@ -2,7 +2,9 @@
 Hyperparameter Tuning Framework for Energy Price Forecasting.
 
 Provides grid search, random search, and Bayesian optimization (Optuna)
-for hyperparameter tuning of forecasting models.
+for hyperparameter tuning of forecasting models. Trials can be evaluated in
+parallel by passing n_jobs to a tuner or setting a package-wide default
+with set_num_jobs().
 
 Author: AI Assistant
 Date: December 14, 2025
@@ -12,8 +14,9 @@ Version: 1.0
 from .search_space import HyperparameterSearchSpace
 from .grid_search import GridSearchTuner
 from .random_search import RandomSearchTuner
-from .bayesian_optimization import BayesianOptimizer
+from .bayesian_optimization import BayesianOptimizer, keras_pruning_callback
 from .tuner import HyperparameterTuner
+from .parallel import set_num_jobs, get_num_jobs
 
 __version__ = "1.0.0"
 
@@ -22,6 +25,9 @@ __all__ = [
     'GridSearchTuner',
     'RandomSearchTuner',
     'BayesianOptimizer',
+    'keras_pruning_callback',
     'HyperparameterTuner',
+    'set_num_jobs',
+    'get_num_jobs',
 ]
 
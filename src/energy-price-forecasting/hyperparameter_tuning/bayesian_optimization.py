@@ -10,8 +10,9 @@ Version: 1.0
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Callable, Optional, Tuple
+from typing import Dict, List, Any, Callable, Optional, Tuple, Union
 import logging
+import threading
 from datetime import datetime
 
 try:
@@ -24,15 +25,57 @@ except ImportError:
     Study = None
     Trial = None
 
+from .evaluation import PredictionAdapter, calculate_score, extract_targets, fit_and_score, results_to_dataframe
+from .parallel import resolve_n_jobs
+
 logger = logging.getLogger(__name__)
 
 
+def keras_pruning_callback(monitor: str = 'val_loss') -> Callable[[Any], Any]:
+    """
+    Build a pruning_callback factory for Keras-based models (e.g. LSTMForecaster).
+    
+    The returned factory creates, for each Optuna trial, a Keras callback
+    that reports ``logs[monitor]`` after every epoch and raises
+    optuna.TrialPruned when the study's pruner decides to stop the trial.
+    
+    Args:
+        monitor: Keras log key to report (default: 'val_loss')
+    
+    Returns:
+        Factory to pass as pruning_callback to BayesianOptimizer.optimize()
+        or HyperparameterTuner
+    
+    Raises:
+        ImportError: If TensorFlow is not installed
+    """
+    from tensorflow.keras.callbacks import Callback
+    
+    class KerasPruningCallback(Callback):
+        """Report the monitored loss to an Optuna trial after each epoch."""
+        
+        def __init__(self, trial: Any):
+            super().__init__()
+            self.trial = trial
+        
+        def on_epoch_end(self, epoch: int, logs: Optional[Dict] = None):
+            value = (logs or {}).get(monitor)
+            if value is None:
+                return
+            self.trial.report(float(value), step=epoch)
+            if self.trial.should_prune():
+                raise optuna.TrialPruned(f"Trial pruned at epoch {epoch}")
+    
+    return KerasPruningCallback
+
+
 class BayesianOptimizer:
     """
     Bayesian optimization hyperparameter tuner using Optuna.
     
     Uses Tree-structured Parzen Estimator (TPE) for intelligent
-    hyperparameter search.
+    hyperparameter search by default; CMA-ES, Gaussian-process and random
+    samplers can be selected with the sampler argument.
     
     Attributes:
         study: Optuna study object
@@ -52,9 +95,14 @@ class BayesianOptimizer:
         scoring_metric: str = 'rmse',
         minimize: bool = True,
         study_name: Optional[str] = None,
-        storage: Optional[str] = None,
+        storage: Optional[Union[str, Any]] = None,
         load_if_exists: bool = False,
-        random_state: Optional[int] = None
+        random_state: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+        pruner: Optional[Union[str, Any]] = None,
+        sampler: Union[str, Any] = 'tpe',
+        validate_nans: bool = True,
+        worker_id: int = 0
     ):
         """
         Initialize BayesianOptimizer.
@@ -65,8 +113,26 @@ class BayesianOptimizer:
             minimize: Whether to minimize (True) or maximize (False) the metric
             study_name: Name for the Optuna study
             storage: Storage URL for study persistence (e.g., 'sqlite:///study.db')
+                or an Optuna storage object such as optuna.integration.DaskStorage()
+                for trials spread over a Dask cluster (see run_worker())
             load_if_exists: Whether to load existing study if it exists
             random_state: Random seed for reproducibility
+            n_jobs: Number of trials run concurrently by study.optimize
+                (default: package default, see set_num_jobs)
+            pruner: Optuna pruner instance, or one of 'median', 'hyperband',
+                'none' (default: None, Optuna's default MedianPruner). Pruning
+                only takes effect when trials report intermediate values, see
+                the pruning_callback argument of optimize()
+            sampler: Optuna sampler instance, or one of 'tpe', 'cmaes', 'gp',
+                'random', 'auto' (default: 'tpe'). 'auto' picks CMA-ES when
+                the param_space passed to optimize() is dominated by linear
+                float parameters and TPE otherwise
+            validate_nans: Whether scoring checks for and skips NaN targets or
+                predictions. Set False when the validation data and model
+                output are known to be NaN-free to skip the check
+            worker_id: Index of this process among workers sharing a study
+                (see run_worker()). Added to random_state to seed the sampler,
+                so seeded workers do not all propose the same parameters
         
         Raises:
             ImportError: If Optuna is not installed
@@ -84,26 +150,157 @@ class BayesianOptimizer:
         self.storage = storage
         self.load_if_exists = load_if_exists
         self.random_state = random_state
+        self.worker_id = worker_id
+        self._sampler_seed = None if random_state is None else random_state + worker_id
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        self.validate_nans = validate_nans
+        
+        self.pruner = self._create_pruner(pruner)
+        self.sampler = sampler
         
         # Create or load study
-        direction = 'minimize' if minimize else 'maximize'
-        self.study = optuna.create_study(
-            study_name=self.study_name,
-            direction=direction,
-            storage=storage,
-            load_if_exists=load_if_exists,
-            sampler=optuna.samplers.TPESampler(seed=random_state)
-        )
+        self.study = self._create_study(self.study_name)
         
         self.best_params = None
         self.best_score = None
         self.best_model = None
+        self.stage2_study = None
+        
+        # ((study_name, trial_number), score, model) of the best trial fitted in this process
+        self._best_trial_model = None
+        self._best_trial_lock = threading.Lock()
+        
+        # (study_name, sorted suggested params) -> score of trials evaluated
+        # in the current optimize()/run_worker() call, i.e. on the same data
+        self._seen_scores: Dict[Tuple[str, Tuple], float] = {}
         
         logger.info(
             f"BayesianOptimizer initialized: n_trials={n_trials}, metric={scoring_metric}, "
-            f"minimize={minimize}, study_name={self.study_name}"
+            f"minimize={minimize}, study_name={self.study_name}, n_jobs={self.n_jobs}"
         )
     
+    def _create_study(self, study_name: str) -> Any:
+        """
+        Create a study, or load the stored one of that name if load_if_exists is set.
+        
+        Resuming a study that already has trials is logged as a warning:
+        its trials may have been scored on other data.
+        """
+        study = optuna.create_study(
+            study_name=study_name,
+            direction='minimize' if self.minimize else 'maximize',
+            storage=self.storage,
+            load_if_exists=self.load_if_exists,
+            sampler=self._create_sampler(self.sampler, self._sampler_seed),
+            pruner=self.pruner
+        )
+        if study.trials:
+            logger.warning(
+                f"Resuming study '{study_name}' with {len(study.trials)} existing trials "
+                f"from {self.storage}"
+            )
+        return study
+    
+    @staticmethod
+    def _create_pruner(pruner: Optional[Union[str, Any]]) -> Optional[Any]:
+        """
+        Resolve a pruner name to an Optuna pruner instance.
+        
+        Args:
+            pruner: Pruner instance, name ('median', 'hyperband', 'none') or None
+        
+        Returns:
+            Optuna pruner, or None to use Optuna's default
+        """
+        if pruner is None or not isinstance(pruner, str):
+            return pruner
+        
+        name = pruner.lower()
+        if name == 'median':
+            return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=5)
+        elif name == 'hyperband':
+            return optuna.pruners.HyperbandPruner(reduction_factor=3)
+        elif name == 'none':
+            return optuna.pruners.NopPruner()
+        else:
+            raise ValueError(
+                f"Unknown pruner: {pruner}. Choose from: 'median', 'hyperband', 'none'"
+            )
+    
+    @staticmethod
+    def _create_sampler(sampler: Union[str, Any], random_state: Optional[int]) -> Any:
+        """
+        Resolve a sampler name to an Optuna sampler instance.
+        
+        Args:
+            sampler: Sampler instance or name ('tpe', 'cmaes', 'gp', 'random', 'auto')
+            random_state: Random seed for the sampler
+        
+        Returns:
+            Optuna sampler ('auto' starts as TPE until the search space is known)
+        
+        Raises:
+            ValueError: If the sampler is unknown, or 'gp' with optuna < 3.6
+        """
+        if not isinstance(sampler, str):
+            return sampler
+        
+        name = sampler.lower()
+        if name in ('tpe', 'auto'):
+            return optuna.samplers.TPESampler(seed=random_state)
+        elif name == 'cmaes':
+            return optuna.samplers.CmaEsSampler(seed=random_state)
+        elif name == 'gp':
+            if not hasattr(optuna.samplers, 'GPSampler'):
+                raise ValueError(
+                    f"Sampler 'gp' requires optuna>=3.6 (installed: {optuna.__version__}). "
+                    "Upgrade with: pip install -U optuna"
+                )
+            return optuna.samplers.GPSampler(seed=random_state)
+        elif name == 'random':
+            return optuna.samplers.RandomSampler(seed=random_state)
+        else:
+            raise ValueError(
+                f"Unknown sampler: {sampler}. Choose from: 'tpe', 'cmaes', 'gp', 'random', 'auto'"
+            )
+    
+    @staticmethod
+    def _auto_sampler_name(param_space: Dict[str, Any]) -> str:
+        """
+        Choose a sampler name from the composition of param_space.
+        
+        CMA-ES models the covariance between parameters and converges faster
+        on continuous spaces; TPE handles categorical and integer parameters
+        better. CMA-ES is chosen when more than 80% of the entries are
+        linear-scale floats.
+        
+        Args:
+            param_space: Parameter search space
+        
+        Returns:
+            'cmaes' or 'tpe'
+        """
+        if not param_space:
+            return 'tpe'
+        
+        n_continuous = sum(
+            1 for spec in param_space.values()
+            if isinstance(spec, dict)
+            and spec.get('type') == 'float'
+            and not spec.get('log', False)
+        )
+        
+        return 'cmaes' if n_continuous / len(param_space) > 0.8 else 'tpe'
+    
+    def _apply_auto_sampler(self, param_space: Dict[str, Any], study: Optional[Any] = None):
+        """Swap in the sampler chosen for param_space when sampler='auto'."""
+        if not (isinstance(self.sampler, str) and self.sampler.lower() == 'auto'):
+            return
+        
+        name = self._auto_sampler_name(param_space)
+        (study or self.study).sampler = self._create_sampler(name, self._sampler_seed)
+        logger.info(f"Auto-selected '{name}' sampler for search space")
+    
     def optimize(
         self,
         model_factory: Callable,
@@ -113,7 +310,13 @@ class BayesianOptimizer:
         target_column: Optional[str] = None,
         fit_kwargs: Optional[Dict] = None,
         predict_kwargs: Optional[Dict] = None,
-        verbose: int = 1
+        verbose: int = 1,
+        pruning_callback: Optional[Callable[[Any], Any]] = None,
+        two_stage: bool = False,
+        stage1_frac: float = 0.3,
+        top_k: int = 4,
+        warm_start_from: Optional[Union[str, pd.DataFrame, Any]] = None,
+        callbacks: Optional[List[Callable[[Any, Any], None]]] = None
     ) -> Tuple[Dict[str, Any], Any]:
         """
         Perform Bayesian optimization.
@@ -127,6 +330,23 @@ class BayesianOptimizer:
             fit_kwargs: Additional arguments for model.fit()
             predict_kwargs: Additional arguments for model.predict()
             verbose: Verbosity level (0, 1, or 2)
+            pruning_callback: Factory called with the Optuna trial that returns
+                a fit callback reporting intermediate validation scores (e.g.
+                ``lambda trial: TFKerasPruningCallback(trial, 'val_loss')``).
+                The callback is appended to fit_kwargs['callbacks'] and should
+                raise optuna.TrialPruned when trial.should_prune() is True
+            two_stage: Spend stage1_frac of the trials on the full space, then
+                tune only the top_k most important parameters (the rest fixed
+                at their best stage-one values) in a second study
+            stage1_frac: Fraction of n_trials used for the first stage
+            top_k: Number of parameters kept for the second stage
+            warm_start_from: Prior results seeding the sampler before the
+                first trial: an Optuna study, a SQLite study file (or RDB
+                storage URL) holding one study, or a results DataFrame from
+                get_results_dataframe() of any tuner. Prior trials whose
+                parameters fall outside param_space are skipped
+            callbacks: Optuna study callbacks, called as callback(study, trial)
+                after every trial (e.g. to stop a plateaued search)
         
         Returns:
             Tuple of (best_params, best_model)
@@ -147,134 +367,463 @@ class BayesianOptimizer:
         if predict_kwargs is None:
             predict_kwargs = {}
         
-        # Store data for objective function
-        self._train_data = train_data
-        self._val_data = val_data
-        self._target_column = target_column
-        self._fit_kwargs = fit_kwargs
-        self._predict_kwargs = predict_kwargs
-        self._model_factory = model_factory
-        self._verbose = verbose
+        self._apply_auto_sampler(param_space)
         
-        # Define objective function
-        def objective(trial: Trial) -> float:
-            # Sample parameters from search space
-            params = {}
-            for param_name, param_spec in param_space.items():
-                if isinstance(param_spec, dict):
-                    # Handle Optuna suggest methods
-                    if 'type' in param_spec:
-                        if param_spec['type'] == 'int':
-                            params[param_name] = trial.suggest_int(
-                                param_name,
-                                param_spec.get('low', 1),
-                                param_spec.get('high', 100)
-                            )
-                        elif param_spec['type'] == 'float':
-                            params[param_name] = trial.suggest_float(
-                                param_name,
-                                param_spec.get('low', 0.0),
-                                param_spec.get('high', 1.0),
-                                log=param_spec.get('log', False)
-                            )
-                        elif param_spec['type'] == 'categorical':
-                            params[param_name] = trial.suggest_categorical(
-                                param_name,
-                                param_spec.get('choices', [])
-                            )
-                    else:
-                        # Direct value (for fixed parameters)
-                        params[param_name] = param_spec.get('value')
-                elif isinstance(param_spec, list):
-                    # List of choices (categorical)
-                    params[param_name] = trial.suggest_categorical(param_name, param_spec)
+        if warm_start_from is not None:
+            self._add_warm_start_trials(warm_start_from, param_space)
+        self._seen_scores.clear()
+        
+        def build_objective(space: Dict[str, Any]) -> Callable[[Any], float]:
+            return self._create_objective(
+                model_factory,
+                space,
+                train_data,
+                val_data,
+                target_column,
+                fit_kwargs,
+                predict_kwargs,
+                verbose,
+                pruning_callback
+            )
+        
+        # Run optimization
+        if two_stage:
+            best_study, fixed_params = self._optimize_two_stage(
+                build_objective, param_space, stage1_frac, top_k, verbose, callbacks
+            )
+        else:
+            self.study.optimize(
+                build_objective(param_space),
+                n_trials=self.n_trials,
+                n_jobs=self.n_jobs,
+                show_progress_bar=(verbose >= 1),
+                callbacks=callbacks
+            )
+            best_study, fixed_params = self.study, {}
+        
+        # Get best results
+        self.best_params = {**fixed_params, **best_study.best_params}
+        self.best_score = best_study.best_value
+        self.best_trial = best_study.best_trial
+        best_key = (best_study.study_name, self.best_trial.number)
+        
+        # Reuse the model fitted during the best trial; only refit when that
+        # trial ran elsewhere (another worker or a previous session)
+        if self._best_trial_model is not None and self._best_trial_model[0] == best_key:
+            best_model = self._best_trial_model[2]
+        else:
+            logger.info("Best trial was not run in this process; refitting best model")
+            best_model = model_factory(**self.best_params)
+            if hasattr(best_model, 'fit'):
+                if isinstance(train_data, pd.DataFrame) and target_column:
+                    best_model.fit(train_data, target_column=target_column, **fit_kwargs)
                 else:
-                    # Direct value (for fixed parameters)
-                    params[param_name] = param_spec
+                    best_model.fit(train_data, **fit_kwargs)
+        self.best_model = best_model
+        self._best_trial_model = None
+        
+        logger.info("="*80)
+        logger.info("BAYESIAN OPTIMIZATION COMPLETE")
+        logger.info(f"Best score: {self.best_score:.6f}")
+        logger.info(f"Best parameters: {self.best_params}")
+        logger.info("="*80)
+        
+        return self.best_params, self.best_model
+    
+    def _add_warm_start_trials(
+        self,
+        warm_start_from: Union[str, pd.DataFrame, Any],
+        param_space: Dict[str, Any]
+    ) -> int:
+        """
+        Seed the study with completed trials from earlier tuning runs.
+        
+        Args:
+            warm_start_from: Optuna study, SQLite study file / storage URL, or
+                results DataFrame with 'params' and 'value' (Bayesian) or
+                'score' (grid/random search) columns
+            param_space: Current parameter search space
+        
+        Returns:
+            Number of trials added
+        """
+        if isinstance(warm_start_from, pd.DataFrame):
+            score_column = 'value' if 'value' in warm_start_from.columns else 'score'
+            # Failed trials hold None, or pd.NA in Arrow-backed results; read them as NaN
+            scores = warm_start_from[score_column].to_numpy(dtype=float, na_value=np.nan)
+            prior = zip(warm_start_from['params'], scores)
+        else:
+            if isinstance(warm_start_from, str):
+                storage_url = warm_start_from if '://' in warm_start_from else f"sqlite:///{warm_start_from}"
+                warm_start_from = optuna.load_study(study_name=None, storage=storage_url)
+            prior = (
+                (trial.params, trial.value)
+                for trial in warm_start_from.get_trials(
+                    deepcopy=False, states=(optuna.trial.TrialState.COMPLETE,)
+                )
+            )
+        
+        distributions = self._param_distributions(param_space)
+        trials = []
+        skipped = 0
+        
+        for params, value in prior:
+            if not isinstance(params, dict) or value is None or not np.isfinite(value):
+                skipped += 1
+                continue
             
-            # Create and train model
             try:
-                model = model_factory(**params)
-                
-                if hasattr(model, 'fit'):
-                    if isinstance(train_data, pd.DataFrame) and target_column:
-                        model.fit(train_data, target_column=target_column, **fit_kwargs)
-                    else:
-                        model.fit(train_data, **fit_kwargs)
-                else:
-                    raise ValueError("Model must have a fit() method")
-                
-                # Predict on validation set
-                if hasattr(model, 'predict'):
-                    predictions = model.predict(val_data, **predict_kwargs)
-                else:
-                    raise ValueError("Model must have a predict() method")
-                
-                # Get true values
-                if isinstance(val_data, pd.DataFrame):
-                    if target_column:
-                        y_true = val_data[target_column].values
-                    else:
-                        y_true = val_data.iloc[:, -1].values
-                else:
-                    y_true = val_data.values
-                
-                # Handle predictions format
-                if isinstance(predictions, pd.DataFrame):
-                    if 'yhat' in predictions.columns:
-                        predictions = predictions['yhat'].values
-                    else:
-                        predictions = predictions.iloc[:, 0].values
-                elif isinstance(predictions, tuple):
-                    predictions = predictions[0]
-                
-                # Flatten if needed
-                if predictions.ndim > 1 and predictions.shape[1] == 1:
-                    predictions = predictions.flatten()
-                if y_true.ndim > 1 and y_true.shape[1] == 1:
-                    y_true = y_true.flatten()
-                
-                # Align lengths
-                min_len = min(len(y_true), len(predictions))
-                y_true = y_true[:min_len]
-                predictions = predictions[:min_len]
-                
-                # Calculate score
-                score = self._calculate_score(y_true, predictions)
+                trial_params = {
+                    name: int(params[name]) if isinstance(dist, optuna.distributions.IntDistribution) else params[name]
+                    for name, dist in distributions.items()
+                }
+                trials.append(optuna.trial.create_trial(
+                    params=trial_params,
+                    distributions=distributions,
+                    value=float(value),
+                    state=optuna.trial.TrialState.COMPLETE
+                ))
+            except (KeyError, TypeError, ValueError):
+                # Parameter missing from, or outside, the current search space
+                skipped += 1
+        
+        self.study.add_trials(trials)
+        logger.info(f"Warm start: added {len(trials)} prior trials ({skipped} skipped)")
+        
+        return len(trials)
+    
+    @staticmethod
+    def _param_distributions(param_space: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Optuna distributions for the tuned (non-fixed) entries of param_space."""
+        distributions = {}
+        for param_name, param_spec in param_space.items():
+            if isinstance(param_spec, dict) and 'type' in param_spec:
+                if param_spec['type'] == 'int':
+                    distributions[param_name] = optuna.distributions.IntDistribution(
+                        param_spec.get('low', 1),
+                        param_spec.get('high', 100)
+                    )
+                elif param_spec['type'] == 'float':
+                    distributions[param_name] = optuna.distributions.FloatDistribution(
+                        param_spec.get('low', 0.0),
+                        param_spec.get('high', 1.0),
+                        log=param_spec.get('log', False)
+                    )
+                elif param_spec['type'] == 'categorical':
+                    distributions[param_name] = optuna.distributions.CategoricalDistribution(
+                        param_spec.get('choices', [])
+                    )
+            elif isinstance(param_spec, list):
+                distributions[param_name] = optuna.distributions.CategoricalDistribution(param_spec)
+        
+        return distributions
+    
+    def _optimize_two_stage(
+        self,
+        build_objective: Callable[[Dict[str, Any]], Callable[[Any], float]],
+        param_space: Dict[str, Any],
+        stage1_frac: float,
+        top_k: int,
+        verbose: int,
+        callbacks: Optional[List[Callable[[Any, Any], None]]] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Run a short search over all parameters, then a focused one over the most important.
+        
+        TPE scales poorly with the number of dimensions, so after the first
+        stage the parameters outside the top_k by fANOVA importance are fixed
+        at their best values and the remaining budget goes to a second study
+        (stored as self.stage2_study) over the reduced space.
+        
+        Args:
+            build_objective: Function building the Optuna objective for a param_space
+            param_space: Full parameter search space
+            stage1_frac: Fraction of n_trials used for the first stage
+            top_k: Number of parameters kept for the second stage
+            verbose: Verbosity level (0, 1, or 2)
+            callbacks: Optuna study callbacks for both stages
+        
+        Returns:
+            Tuple of (study holding the best trial, parameters fixed in that study)
+        """
+        stage1_trials = min(self.n_trials, max(2, int(self.n_trials * stage1_frac)))
+        stage2_trials = self.n_trials - stage1_trials
+        
+        self.study.optimize(
+            build_objective(param_space),
+            n_trials=stage1_trials,
+            n_jobs=self.n_jobs,
+            show_progress_bar=(verbose >= 1),
+            callbacks=callbacks
+        )
+        
+        if stage2_trials <= 0:
+            return self.study, {}
+        
+        try:
+            importance = optuna.importance.get_param_importances(self.study)
+        except Exception as e:
+            logger.warning(f"Could not calculate parameter importance, continuing single-stage search: {e}")
+            importance = {}
+        
+        top_params = list(importance)[:top_k]
+        if len(top_params) >= len(importance):
+            # Nothing to freeze; spend the rest of the budget on the same study
+            self.study.optimize(
+                build_objective(param_space),
+                n_trials=stage2_trials,
+                n_jobs=self.n_jobs,
+                show_progress_bar=(verbose >= 1),
+                callbacks=callbacks
+            )
+            return self.study, {}
+        
+        fixed_params = {
+            name: value for name, value in self.study.best_params.items()
+            if name not in top_params
+        }
+        reduced_space = {
+            name: {'value': fixed_params[name]} if name in fixed_params else spec
+            for name, spec in param_space.items()
+        }
+        logger.info(f"Stage 2: tuning {top_params}, fixed {fixed_params}")
+        
+        self.stage2_study = self._create_study(f"{self.study_name}_stage2")
+        self._apply_auto_sampler({name: param_space[name] for name in top_params}, self.stage2_study)
+        self.stage2_study.optimize(
+            build_objective(reduced_space),
+            n_trials=stage2_trials,
+            n_jobs=self.n_jobs,
+            show_progress_bar=(verbose >= 1),
+            callbacks=callbacks
+        )
+        
+        try:
+            stage2_best = self.stage2_study.best_value
+        except ValueError:
+            # No completed trials in the second stage
+            return self.study, {}
+        
+        stage1_best = self.study.best_value
+        stage2_is_better = (stage2_best < stage1_best) if self.minimize else (stage2_best > stage1_best)
+        if stage2_is_better:
+            return self.stage2_study, fixed_params
+        return self.study, {}
+    
+    def run_worker(
+        self,
+        model_factory: Callable,
+        param_space: Dict[str, Any],
+        train_data: pd.DataFrame | pd.Series,
+        val_data: pd.DataFrame | pd.Series,
+        target_column: Optional[str] = None,
+        fit_kwargs: Optional[Dict] = None,
+        predict_kwargs: Optional[Dict] = None,
+        n_trials: Optional[int] = None,
+        verbose: int = 0,
+        pruning_callback: Optional[Callable[[Any], Any]] = None,
+        callbacks: Optional[List[Callable[[Any, Any], None]]] = None
+    ) -> Study:
+        """
+        Run trials for a study shared with other worker processes.
+        
+        Start the same script in N shells (or on N machines), each creating
+        a BayesianOptimizer with the same study_name, an RDB storage URL
+        (e.g. 'postgresql://...' or 'sqlite:///study.db') and
+        load_if_exists=True, then calling run_worker(). Optuna coordinates
+        the trials through the storage; call optimize() or read self.study
+        from any process afterwards to get the combined results.
+        
+        On a Dask cluster, pass an optuna.integration.DaskStorage (created
+        while a dask.distributed.Client is active) and submit one task per
+        worker that builds its own optimizer and calls run_worker():
+        
+            >>> client = Client('scheduler:8786')
+            >>> storage = optuna.integration.DaskStorage()
+            >>> def work(worker_id, n):
+            ...     optimizer = BayesianOptimizer(study_name='lstm', storage=storage,
+            ...                                   load_if_exists=True, random_state=42,
+            ...                                   worker_id=worker_id)
+            ...     optimizer.run_worker(model_factory, param_space, train, val, n_trials=n)
+            >>> wait([client.submit(work, i, 10, pure=False) for i in range(8)])
+        
+        Give each worker a distinct worker_id when seeding with random_state;
+        otherwise every worker's sampler proposes the same sequence.
+        
+        Args:
+            model_factory: Function that creates model with parameters: model_factory(**params)
+            param_space: Dictionary defining parameter search space
+            train_data: Training data
+            val_data: Validation data
+            target_column: Name of target column (for DataFrame)
+            fit_kwargs: Additional arguments for model.fit()
+            predict_kwargs: Additional arguments for model.predict()
+            n_trials: Trials to run in this worker (default: self.n_trials)
+            verbose: Verbosity level (0, 1, or 2)
+            pruning_callback: See optimize()
+            callbacks: See optimize()
+        
+        Returns:
+            The shared Optuna study
+        
+        Raises:
+            ValueError: If the optimizer was created without a shared storage
+        """
+        if self.storage is None:
+            raise ValueError(
+                "run_worker requires a shared RDB storage URL; "
+                "create the optimizer with storage='sqlite:///...' or a database URL"
+            )
+        
+        self._apply_auto_sampler(param_space)
+        self._seen_scores.clear()
+        
+        objective = self._create_objective(
+            model_factory,
+            param_space,
+            train_data,
+            val_data,
+            target_column,
+            fit_kwargs or {},
+            predict_kwargs or {},
+            verbose,
+            pruning_callback
+        )
+        
+        self.study.optimize(
+            objective,
+            n_trials=n_trials or self.n_trials,
+            n_jobs=self.n_jobs,
+            show_progress_bar=(verbose >= 1),
+            callbacks=callbacks
+        )
+        
+        logger.info(f"Worker finished; study '{self.study_name}' has {len(self.study.trials)} trials")
+        
+        return self.study
+    
+    def _create_objective(
+        self,
+        model_factory: Callable,
+        param_space: Dict[str, Any],
+        train_data: pd.DataFrame | pd.Series,
+        val_data: pd.DataFrame | pd.Series,
+        target_column: Optional[str],
+        fit_kwargs: Dict,
+        predict_kwargs: Dict,
+        verbose: int,
+        pruning_callback: Optional[Callable[[Any], Any]]
+    ) -> Callable[[Any], float]:
+        """Build the Optuna objective function for one search."""
+        # Validation targets are identical for every trial
+        y_true = extract_targets(val_data, target_column)
+        pred_adapter = PredictionAdapter()
+        
+        def objective(trial: Trial) -> float:
+            params = self._suggest_params(trial, param_space)
+            
+            # Samplers can re-propose a configuration (e.g. small categorical
+            # spaces); reuse its score instead of training the same model again
+            seen_key = (trial.study.study_name, tuple(sorted(trial.params.items())))
+            seen_score = self._seen_scores.get(seen_key)
+            if seen_score is not None:
+                trial.set_user_attr('duplicate', True)
+                if verbose >= 2:
+                    logger.info(f"Trial {trial.number}: duplicate of an earlier trial, score={seen_score:.6f}")
+                return seen_score
+            
+            # Let the model report per-epoch scores so the pruner can stop it early
+            trial_fit_kwargs = fit_kwargs
+            if pruning_callback is not None:
+                trial_fit_kwargs = dict(fit_kwargs)
+                trial_fit_kwargs['callbacks'] = (
+                    list(fit_kwargs.get('callbacks') or []) + [pruning_callback(trial)]
+                )
+            
+            # Create, train and score model
+            try:
+                score, model = fit_and_score(
+                    model_factory,
+                    params,
+                    train_data,
+                    val_data,
+                    target_column,
+                    trial_fit_kwargs,
+                    predict_kwargs,
+                    self.scoring_metric,
+                    self.minimize,
+                    y_true,
+                    pred_adapter,
+                    self.validate_nans
+                )
                 
                 if verbose >= 2:
                     logger.info(f"Trial {trial.number}: params={params}, score={score:.6f}")
                 
+                self._keep_if_best((trial.study.study_name, trial.number), score, model)
+                self._seen_scores[seen_key] = score
+                
                 return score
                 
+            except optuna.TrialPruned:
+                if verbose >= 2:
+                    logger.info(f"Trial {trial.number} pruned")
+                raise
             except Exception as e:
                 logger.error(f"Trial {trial.number} failed: {e}")
                 return float('inf') if self.minimize else float('-inf')
         
-        # Run optimization
-        self.study.optimize(objective, n_trials=self.n_trials, show_progress_bar=(verbose >= 1))
-        
-        # Get best results
-        self.best_params = self.study.best_params
-        self.best_score = self.study.best_value
-        self.best_trial = self.study.best_trial
-        
-        # Recreate best model
-        best_model = model_factory(**self.best_params)
-        if hasattr(best_model, 'fit'):
-            if isinstance(train_data, pd.DataFrame) and target_column:
-                best_model.fit(train_data, target_column=target_column, **fit_kwargs)
+        return objective
+    
+    def _keep_if_best(self, trial_key: Tuple[str, int], score: float, model: Any):
+        """Hold on to model if it beats the best trial seen so far, dropping the previous one."""
+        with self._best_trial_lock:
+            if self._best_trial_model is None:
+                is_better = True
             else:
-                best_model.fit(train_data, **fit_kwargs)
-        self.best_model = best_model
-        
-        logger.info("="*80)
-        logger.info("BAYESIAN OPTIMIZATION COMPLETE")
-        logger.info(f"Best score: {self.best_score:.6f}")
-        logger.info(f"Best parameters: {self.best_params}")
-        logger.info("="*80)
+                best_score = self._best_trial_model[1]
+                is_better = (score < best_score) if self.minimize else (score > best_score)
+            
+            if is_better:
+                self._best_trial_model = (trial_key, score, model)
+    
+    @staticmethod
+    def _suggest_params(trial: Any, param_space: Dict[str, Any]) -> Dict[str, Any]:
+        """Sample one parameter set from param_space for an Optuna trial."""
+        params = {}
+        for param_name, param_spec in param_space.items():
+            if isinstance(param_spec, dict):
+                # Handle Optuna suggest methods
+                if 'type' in param_spec:
+                    if param_spec['type'] == 'int':
+                        params[param_name] = trial.suggest_int(
+                            param_name,
+                            param_spec.get('low', 1),
+                            param_spec.get('high', 100)
+                        )
+                    elif param_spec['type'] == 'float':
+                        params[param_name] = trial.suggest_float(
+                            param_name,
+                            param_spec.get('low', 0.0),
+                            param_spec.get('high', 1.0),
+                            log=param_spec.get('log', False)
+                        )
+                    elif param_spec['type'] == 'categorical':
+                        params[param_name] = trial.suggest_categorical(
+                            param_name,
+                            param_spec.get('choices', [])
+                        )
+                else:
+                    # Direct value (for fixed parameters)
+                    params[param_name] = param_spec.get('value')
+            elif isinstance(param_spec, list):
+                # List of choices (categorical)
+                params[param_name] = trial.suggest_categorical(param_name, param_spec)
+            else:
+                # Direct value (for fixed parameters)
+                params[param_name] = param_spec
         
-        return self.best_params, self.best_model
+        return params
     
     def _calculate_score(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
         """
@@ -287,35 +836,7 @@ class BayesianOptimizer:
         Returns:
             Score value
         """
-        # Remove NaN values
-        mask = ~(np.isnan(y_true) | np.isnan(y_pred))
-        y_true_clean = y_true[mask]
-        y_pred_clean = y_pred[mask]
-        
-        if len(y_true_clean) == 0:
-            return float('inf') if self.minimize else float('-inf')
-        
-        if self.scoring_metric == 'rmse':
-            return np.sqrt(np.mean((y_true_clean - y_pred_clean) ** 2))
-        elif self.scoring_metric == 'mae':
-            return np.mean(np.abs(y_true_clean - y_pred_clean))
-        elif self.scoring_metric == 'mape':
-            mask_nonzero = y_true_clean != 0
-            if mask_nonzero.sum() > 0:
-                return np.mean(
-                    np.abs((y_true_clean[mask_nonzero] - y_pred_clean[mask_nonzero]) / y_true_clean[mask_nonzero])
-                ) * 100
-            else:
-                return float('inf')
-        elif self.scoring_metric == 'r2':
-            ss_res = np.sum((y_true_clean - y_pred_clean) ** 2)
-            ss_tot = np.sum((y_true_clean - np.mean(y_true_clean)) ** 2)
-            if ss_tot > 0:
-                return 1 - (ss_res / ss_tot)
-            else:
-                return float('-inf')
-        else:
-            raise ValueError(f"Unknown scoring metric: {self.scoring_metric}")
+        return calculate_score(y_true, y_pred, self.scoring_metric, self.minimize, self.validate_nans)
     
     def get_parameter_importance(self) -> pd.DataFrame:
         """
@@ -402,7 +923,7 @@ class BayesianOptimizer:
                     'datetime_complete': trial.datetime_complete
                 })
         
-        return pd.DataFrame(results)
+        return results_to_dataframe(results)
     
     def get_best_result(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,312 @@
+"""
+Shared Trial Evaluation for Hyperparameter Tuning.
+
+Fits a candidate model, predicts on the validation set and scores the
+predictions. Used by all tuners so that trials can also be shipped to
+worker processes as plain module-level functions.
+
+Author: AI Assistant
+Date: December 14, 2025
+Version: 1.0
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Any, Callable, Optional, Tuple
+import logging
+from datetime import datetime
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+
+from .fast_metrics import error_sums
+
+logger = logging.getLogger(__name__)
+
+
+def calculate_score(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    scoring_metric: str = 'rmse',
+    minimize: bool = True,
+    validate_nans: bool = True
+) -> float:
+    """
+    Calculate scoring metric.
+
+    Args:
+        y_true: True values
+        y_pred: Predicted values
+        scoring_metric: Metric to compute ('rmse', 'mae', 'mape', 'r2')
+        minimize: Whether the metric is being minimized (sets the worst score)
+        validate_nans: Whether to skip NaN pairs (False skips the check for
+            data known to be NaN-free)
+
+    Returns:
+        Score value
+    """
+    # One pass over the data collects every sum the metrics need (NaN pairs skipped)
+    count, sum_sq_err, sum_abs_err, sum_abs_pct_err, count_nonzero, ss_tot = error_sums(
+        y_true, y_pred, validate_nans
+    )
+
+    if count == 0:
+        return float('inf') if minimize else float('-inf')
+
+    if scoring_metric == 'rmse':
+        return np.sqrt(sum_sq_err / count)
+    elif scoring_metric == 'mae':
+        return sum_abs_err / count
+    elif scoring_metric == 'mape':
+        if count_nonzero > 0:
+            return sum_abs_pct_err / count_nonzero * 100
+        else:
+            return float('inf')
+    elif scoring_metric == 'r2':
+        if ss_tot > 0:
+            return 1 - (sum_sq_err / ss_tot)
+        else:
+            return float('-inf')
+    else:
+        raise ValueError(f"Unknown scoring metric: {scoring_metric}")
+
+
+def extract_targets(
+    val_data: pd.DataFrame | pd.Series,
+    target_column: Optional[str] = None,
+    dtype: Optional[np.dtype] = None
+) -> np.ndarray:
+    """
+    Extract validation targets as a flat array.
+
+    The targets are the same for every trial, so tuners call this once per
+    search and pass the result to fit_and_score(). The column is returned
+    as a view of the frame's data whenever possible rather than a copy.
+
+    Args:
+        val_data: Validation data
+        target_column: Name of target column (for DataFrame; default: last column)
+        dtype: Optional dtype for the targets (default: keep the column dtype).
+            np.float32 halves memory traffic in the metric kernel when the
+            model also predicts float32 (e.g. Keras models)
+
+    Returns:
+        1-D array of true values
+    """
+    if isinstance(val_data, pd.DataFrame):
+        if target_column:
+            y_true = val_data[target_column].to_numpy(dtype=dtype, copy=False)
+        else:
+            y_true = val_data.iloc[:, -1].to_numpy(dtype=dtype, copy=False)
+    else:
+        y_true = val_data.to_numpy(dtype=dtype, copy=False)
+
+    if y_true.ndim > 1 and y_true.shape[1] == 1:
+        y_true = y_true.flatten()
+
+    return y_true
+
+
+def _flatten_column(predictions: Any) -> np.ndarray:
+    """Return predictions as an array, flattening a single-column 2-D array."""
+    predictions = np.asarray(predictions)
+    if predictions.ndim > 1 and predictions.shape[1] == 1:
+        return predictions.ravel()
+    return predictions
+
+
+def _build_pred_adapter(sample_pred: Any) -> Callable[[Any], np.ndarray]:
+    """
+    Pick the conversion from a model's raw predictions to a 1-D array.
+
+    Args:
+        sample_pred: Raw output of model.predict()
+
+    Returns:
+        Function converting predictions of the same kind
+    """
+    if isinstance(sample_pred, pd.DataFrame):
+        # Column layout can differ between frames, so it is checked per call
+        return lambda p: (p['yhat'] if 'yhat' in p.columns else p.iloc[:, 0]).to_numpy()
+    elif isinstance(sample_pred, tuple):
+        return lambda p: _flatten_column(p[0])
+    return _flatten_column
+
+
+class PredictionAdapter:
+    """
+    Converts model predictions to a flat array, specialised on first use.
+
+    Every trial of a search uses the same model class, so the type checks
+    that pick the conversion run once and the chosen function is reused.
+    It is rebuilt if a later prediction has a different type.
+    """
+
+    def __init__(self):
+        # (prediction type, conversion) swapped as one tuple so threads
+        # sharing the adapter never see a mismatched pair
+        self._cached = None
+
+    def __call__(self, predictions: Any) -> np.ndarray:
+        cached = self._cached
+        if cached is None or type(predictions) is not cached[0]:
+            cached = (type(predictions), _build_pred_adapter(predictions))
+            self._cached = cached
+        return cached[1](predictions)
+
+
+def fit_and_score(
+    model_factory: Callable,
+    params: Dict[str, Any],
+    train_data: pd.DataFrame | pd.Series,
+    val_data: pd.DataFrame | pd.Series,
+    target_column: Optional[str] = None,
+    fit_kwargs: Optional[Dict] = None,
+    predict_kwargs: Optional[Dict] = None,
+    scoring_metric: str = 'rmse',
+    minimize: bool = True,
+    y_true: Optional[np.ndarray] = None,
+    pred_adapter: Optional[Callable[[Any], np.ndarray]] = None,
+    validate_nans: bool = True
+) -> Tuple[float, Any]:
+    """
+    Create, train and score one model.
+
+    Args:
+        model_factory: Function that creates model with parameters: model_factory(**params)
+        params: Hyperparameters for this trial
+        train_data: Training data
+        val_data: Validation data
+        target_column: Name of target column (for DataFrame)
+        fit_kwargs: Additional arguments for model.fit()
+        predict_kwargs: Additional arguments for model.predict()
+        scoring_metric: Metric to compute ('rmse', 'mae', 'mape', 'r2')
+        minimize: Whether the metric is being minimized
+        y_true: Validation targets from extract_targets(); extracted from
+            val_data when omitted
+        pred_adapter: PredictionAdapter shared across the trials of a search
+            (default: a new one for this call)
+        validate_nans: Whether to skip NaN pairs when scoring
+
+    Returns:
+        Tuple of (score, fitted_model)
+
+    Raises:
+        ValueError: If the model has no fit() or predict() method
+    """
+    fit_kwargs = fit_kwargs or {}
+    predict_kwargs = predict_kwargs or {}
+
+    # Create model with these parameters
+    model = model_factory(**params)
+
+    # Train model
+    if hasattr(model, 'fit'):
+        if isinstance(train_data, pd.DataFrame) and target_column:
+            model.fit(train_data, target_column=target_column, **fit_kwargs)
+        else:
+            model.fit(train_data, **fit_kwargs)
+    else:
+        raise ValueError("Model must have a fit() method")
+
+    # Predict on validation set
+    if hasattr(model, 'predict'):
+        predictions = model.predict(val_data, **predict_kwargs)
+    else:
+        raise ValueError("Model must have a predict() method")
+
+    # Get true values (normally extracted once per search by the caller)
+    if y_true is None:
+        y_true = extract_targets(val_data, target_column)
+
+    # Handle predictions format (DataFrame/yhat, tuple, single-column array)
+    if pred_adapter is None:
+        pred_adapter = PredictionAdapter()
+    predictions = pred_adapter(predictions)
+
+    # Align lengths
+    min_len = min(len(y_true), len(predictions))
+    y_true = y_true[:min_len]
+    predictions = predictions[:min_len]
+
+    # Calculate score
+    score = calculate_score(y_true, predictions, scoring_metric, minimize, validate_nans)
+
+    return score, model
+
+
+def run_trial(
+    trial: int,
+    params: Dict[str, Any],
+    **evaluate_kwargs
+) -> Tuple[Dict[str, Any], Any]:
+    """
+    Evaluate one parameter combination and build its result record.
+
+    Failures are captured in the record instead of raised so that one bad
+    trial does not abort a (possibly parallel) search.
+
+    Args:
+        trial: 1-based trial number
+        params: Hyperparameters for this trial
+        **evaluate_kwargs: Arguments forwarded to fit_and_score()
+
+    Returns:
+        Tuple of (result, fitted_model); fitted_model is None on failure
+    """
+    try:
+        score, model = fit_and_score(params=params, **evaluate_kwargs)
+        result = {
+            'params': params,
+            'score': score,
+            'timestamp': datetime.now().isoformat(),
+            'trial': trial
+        }
+        return result, model
+    except Exception as e:
+        result = {
+            'params': params,
+            'score': None,
+            'error': str(e),
+            'timestamp': datetime.now().isoformat(),
+            'trial': trial
+        }
+        return result, None
+
+
+def results_to_dataframe(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build a trial results DataFrame from a list of result records.
+
+    Uses pyarrow-backed columns when pyarrow is installed: the records are
+    converted to columnar storage in one pass and string or nested columns
+    (params, errors, timestamps) avoid per-cell Python objects. Falls back
+    to a plain pandas DataFrame when pyarrow is missing or cannot infer a
+    column type (e.g. a parameter mixing ints and strings). With pyarrow,
+    params dictionaries share one struct type, so a key missing from one
+    trial reads back as None.
+
+    Args:
+        records: Result dictionaries, one per trial
+
+    Returns:
+        DataFrame with one row per record
+    """
+    if not PYARROW_AVAILABLE or not records:
+        return pd.DataFrame(records)
+
+    # Union of keys across records: failed trials carry an extra 'error' key
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    try:
+        table = pa.Table.from_pydict({
+            column: [record.get(column) for record in records] for column in columns
+        })
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        logger.debug(f"Falling back to object-dtype results DataFrame: {e}")
+        return pd.DataFrame(records)
+
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
@@ -0,0 +1,173 @@
+"""
+Single-Pass Error Accumulation for Tuning Metrics.
+
+Collects every sum needed for RMSE, MAE, MAPE and R² in one pass over the
+validation arrays, skipping NaN pairs. Uses a Numba-compiled loop when
+Numba is installed and a NumPy implementation otherwise. The compiled
+kernel is cached on disk and warmed up at import, so no trial pays the
+compile time.
+
+Author: AI Assistant
+Date: December 14, 2025
+Version: 1.0
+"""
+
+import numpy as np
+from typing import Tuple
+import logging
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Fast-math flags minus 'nnan'/'ninf': the kernel must still see NaNs to skip them
+_FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+def _error_sums_loop(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    skip_nan: bool = True
+) -> Tuple[int, float, float, float, int, float]:
+    """
+    Accumulate error sums in a single loop (compiled with Numba when available).
+
+    The spread of y_true around its mean is tracked with Welford's update so
+    R² stays exact for constant targets.
+    """
+    count = 0
+    sum_sq_err = 0.0
+    sum_abs_err = 0.0
+    sum_abs_pct_err = 0.0
+    count_nonzero = 0
+    mean_true = 0.0
+    ss_tot = 0.0
+
+    for i in range(y_true.shape[0]):
+        t = y_true[i]
+        p = y_pred[i]
+        if skip_nan and (np.isnan(t) or np.isnan(p)):
+            continue
+
+        err = t - p
+        count += 1
+        sum_sq_err += err * err
+        sum_abs_err += abs(err)
+        if t != 0.0:
+            sum_abs_pct_err += abs(err / t)
+            count_nonzero += 1
+
+        delta = t - mean_true
+        mean_true += delta / count
+        ss_tot += delta * (t - mean_true)
+
+    return count, sum_sq_err, sum_abs_err, sum_abs_pct_err, count_nonzero, ss_tot
+
+
+def _error_sums_numpy(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    skip_nan: bool = True
+) -> Tuple[int, float, float, float, int, float]:
+    """
+    Accumulate error sums with vectorized NumPy operations.
+
+    Reuses one scratch buffer for the errors, their absolute values and the
+    centered targets, and masks zero targets with ``where=`` instead of
+    boolean indexing, to keep temporary allocations to a minimum.
+    """
+    if skip_nan:
+        invalid = np.isnan(y_true)
+        np.logical_or(invalid, np.isnan(y_pred), out=invalid)
+        if invalid.any():
+            valid = np.logical_not(invalid, out=invalid)
+            y_true = y_true[valid]
+            y_pred = y_pred[valid]
+
+    count = y_true.shape[0]
+    if count == 0:
+        return 0, 0.0, 0.0, 0.0, 0, 0.0
+
+    diff = np.subtract(y_true, y_pred)
+    sum_sq_err = float(np.dot(diff, diff))
+
+    mask_nonzero = y_true != 0
+    rel = np.zeros_like(diff)
+    np.divide(diff, y_true, out=rel, where=mask_nonzero)
+    sum_abs_pct_err = float(np.abs(rel, out=rel).sum())
+
+    sum_abs_err = float(np.abs(diff, out=diff).sum())
+
+    np.subtract(y_true, y_true.mean(), out=diff)
+    ss_tot = float(np.dot(diff, diff))
+
+    return (
+        count,
+        sum_sq_err,
+        sum_abs_err,
+        sum_abs_pct_err,
+        int(np.count_nonzero(mask_nonzero)),
+        ss_tot,
+    )
+
+
+def _warmup():
+    """
+    Compile the Numba kernel now rather than inside the first tuning trial.
+
+    With cache=True the machine code is written under __pycache__, so
+    after the first run this only loads it from disk.
+    """
+    for dtype in (np.float64, np.float32):
+        sample = np.zeros(2, dtype=dtype)
+        try:
+            _error_sums(sample, sample, True)
+        except Exception as e:
+            logger.warning(f"Numba warm-up for {np.dtype(dtype).name} failed, compiling on first use: {e}")
+
+
+if NUMBA_AVAILABLE:
+    _error_sums = njit(cache=True, fastmath=_FASTMATH_FLAGS)(_error_sums_loop)
+    _warmup()
+else:
+    _error_sums = _error_sums_numpy
+
+
+def error_sums(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    skip_nan: bool = True
+) -> Tuple[int, float, float, float, int, float]:
+    """
+    Compute the sums behind the tuning metrics, ignoring NaN pairs.
+
+    Inputs that are both float32 stay float32; anything else is converted
+    to float64.
+
+    Args:
+        y_true: True values
+        y_pred: Predicted values (same length as y_true)
+        skip_nan: Whether to check for and skip NaN pairs. Pass False only
+            when both arrays are known to be NaN-free; NaNs then propagate
+            into the sums
+
+    Returns:
+        Tuple of (count, sum_sq_err, sum_abs_err, sum_abs_pct_err,
+        count_nonzero_true, ss_tot), where the percentage error sum and its
+        count only cover entries with non-zero y_true
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    if y_true.dtype == np.float32 and y_pred.dtype == np.float32:
+        dtype = np.float32
+    else:
+        dtype = np.float64
+
+    y_true = np.ascontiguousarray(y_true, dtype=dtype)
+    y_pred = np.ascontiguousarray(y_pred, dtype=dtype)
+    return _error_sums(y_true, y_pred, skip_nan)
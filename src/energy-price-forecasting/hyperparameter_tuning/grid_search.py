@@ -13,7 +13,9 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Callable, Optional, Tuple
 import logging
-from datetime import datetime
+
+from .evaluation import PredictionAdapter, calculate_score, extract_targets, results_to_dataframe, run_trial
+from .parallel import resolve_n_jobs, run_trials
 
 logger = logging.getLogger(__name__)
 
@@ -36,22 +38,38 @@ class GridSearchTuner:
         ... )
     """
     
-    def __init__(self, scoring_metric: str = 'rmse', minimize: bool = True):
+    def __init__(
+        self,
+        scoring_metric: str = 'rmse',
+        minimize: bool = True,
+        n_jobs: Optional[int] = None,
+        validate_nans: bool = True
+    ):
         """
         Initialize GridSearchTuner.
         
         Args:
             scoring_metric: Metric to optimize ('rmse', 'mae', 'mape', 'r2')
             minimize: Whether to minimize (True) or maximize (False) the metric
+            n_jobs: Number of parallel trial workers (default: package default,
+                see set_num_jobs)
+            validate_nans: Whether scoring checks for and skips NaN targets or
+                predictions. Set False when the validation data and model
+                output are known to be NaN-free to skip the check
         """
         self.scoring_metric = scoring_metric.lower()
         self.minimize = minimize
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        self.validate_nans = validate_nans
         self.results = []
         self.best_params = None
         self.best_score = None
         self.best_model = None
         
-        logger.info(f"GridSearchTuner initialized with metric: {scoring_metric}, minimize: {minimize}")
+        logger.info(
+            f"GridSearchTuner initialized with metric: {scoring_metric}, minimize: {minimize}, "
+            f"n_jobs: {self.n_jobs}"
+        )
     
     def search(
         self,
@@ -75,7 +93,8 @@ class GridSearchTuner:
             target_column: Name of target column (for DataFrame)
             fit_kwargs: Additional arguments for model.fit()
             predict_kwargs: Additional arguments for model.predict()
-            verbose: Verbosity level (0, 1, or 2)
+            verbose: Verbosity level (0: quiet, 1: progress every 5% of trials,
+                2: every trial)
         
         Returns:
             Tuple of (best_params, best_model)
@@ -89,106 +108,75 @@ class GridSearchTuner:
         if predict_kwargs is None:
             predict_kwargs = {}
         
-        # Generate all parameter combinations
+        # Stream parameter combinations instead of materializing the grid
         param_names = list(param_grid.keys())
         param_values = list(param_grid.values())
-        param_combinations = list(itertools.product(*param_values))
         
-        total_combinations = len(param_combinations)
+        total_combinations = 1
+        for values in param_values:
+            total_combinations *= len(values)
         logger.info(f"Total parameter combinations: {total_combinations}")
+        log_every = max(1, total_combinations // 20)
         
         self.results = []
         best_score = float('inf') if self.minimize else float('-inf')
         best_params = None
         best_model = None
-        
-        # Evaluate each combination
-        for i, param_values_tuple in enumerate(param_combinations):
-            params = dict(zip(param_names, param_values_tuple))
+        best_trial = None
+        
+        tasks = (
+            (i + 1, dict(zip(param_names, param_values_tuple)))
+            for i, param_values_tuple in enumerate(itertools.product(*param_values))
+        )
+        
+        # Evaluate each combination (in worker processes when n_jobs > 1);
+        # results arrive in completion order and are sorted by trial afterwards
+        outcomes = run_trials(
+            run_trial,
+            tasks,
+            n_jobs=self.n_jobs,
+            ordered=False,
+            shared={'train_data': train_data, 'val_data': val_data},
+            model_factory=model_factory,
+            target_column=target_column,
+            fit_kwargs=fit_kwargs,
+            predict_kwargs=predict_kwargs,
+            scoring_metric=self.scoring_metric,
+            minimize=self.minimize,
+            y_true=extract_targets(val_data, target_column),
+            pred_adapter=PredictionAdapter(),
+            validate_nans=self.validate_nans
+        )
+        
+        for n_done, (result, model) in enumerate(outcomes, start=1):
+            self.results.append(result)
             
-            if verbose >= 1:
-                logger.info(f"Trial {i+1}/{total_combinations}: {params}")
+            if verbose >= 2:
+                logger.info("Trial %d/%d: %r", result['trial'], total_combinations, result['params'])
             
-            try:
-                # Create model with these parameters
-                model = model_factory(**params)
-                
-                # Train model
-                if hasattr(model, 'fit'):
-                    if isinstance(train_data, pd.DataFrame) and target_column:
-                        model.fit(train_data, target_column=target_column, **fit_kwargs)
-                    else:
-                        model.fit(train_data, **fit_kwargs)
-                else:
-                    raise ValueError("Model must have a fit() method")
-                
-                # Predict on validation set
-                if hasattr(model, 'predict'):
-                    predictions = model.predict(val_data, **predict_kwargs)
-                else:
-                    raise ValueError("Model must have a predict() method")
-                
-                # Get true values
-                if isinstance(val_data, pd.DataFrame):
-                    if target_column:
-                        y_true = val_data[target_column].values
-                    else:
-                        y_true = val_data.iloc[:, -1].values
-                else:
-                    y_true = val_data.values
-                
-                # Handle predictions format
-                if isinstance(predictions, pd.DataFrame):
-                    if 'yhat' in predictions.columns:
-                        predictions = predictions['yhat'].values
-                    else:
-                        predictions = predictions.iloc[:, 0].values
-                elif isinstance(predictions, tuple):
-                    predictions = predictions[0]
-                
-                # Flatten if needed
-                if predictions.ndim > 1 and predictions.shape[1] == 1:
-                    predictions = predictions.flatten()
-                if y_true.ndim > 1 and y_true.shape[1] == 1:
-                    y_true = y_true.flatten()
-                
-                # Align lengths
-                min_len = min(len(y_true), len(predictions))
-                y_true = y_true[:min_len]
-                predictions = predictions[:min_len]
-                
-                # Calculate score
-                score = self._calculate_score(y_true, predictions)
-                
-                # Store result
-                result = {
-                    'params': params,
-                    'score': score,
-                    'timestamp': datetime.now().isoformat(),
-                    'trial': i + 1
-                }
-                self.results.append(result)
-                
-                # Update best if better
+            if 'error' in result:
+                logger.error("Trial %d failed with error: %s", result['trial'], result['error'])
+            else:
+                # Update best if better (ties go to the earlier trial, as in a sequential run)
+                score = result['score']
                 is_better = (score < best_score) if self.minimize else (score > best_score)
+                if score == best_score and best_trial is not None and result['trial'] < best_trial:
+                    is_better = True
                 if is_better:
                     best_score = score
-                    best_params = params.copy()
+                    best_params = result['params'].copy()
                     best_model = model
-                    if verbose >= 1:
-                        logger.info(f"New best score: {best_score:.6f}")
-                
-            except Exception as e:
-                logger.error(f"Trial {i+1} failed with error: {e}")
-                result = {
-                    'params': params,
-                    'score': None,
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat(),
-                    'trial': i + 1
-                }
-                self.results.append(result)
+                    best_trial = result['trial']
+                    if verbose >= 2:
+                        logger.info("New best score: %.6f", best_score)
+            
+            # Batched progress summary instead of a line per trial
+            if verbose == 1 and n_done % log_every == 0:
+                logger.info(
+                    "%d/%d trials done, best score so far: %.6f", n_done, total_combinations, best_score
+                )
         
+        self.results.sort(key=lambda result: result['trial'])
         self.best_params = best_params
         self.best_score = best_score
         self.best_model = best_model
@@ -212,35 +200,7 @@ class GridSearchTuner:
         Returns:
             Score value
         """
-        # Remove NaN values
-        mask = ~(np.isnan(y_true) | np.isnan(y_pred))
-        y_true_clean = y_true[mask]
-        y_pred_clean = y_pred[mask]
-        
-        if len(y_true_clean) == 0:
-            return float('inf') if self.minimize else float('-inf')
-        
-        if self.scoring_metric == 'rmse':
-            return np.sqrt(np.mean((y_true_clean - y_pred_clean) ** 2))
-        elif self.scoring_metric == 'mae':
-            return np.mean(np.abs(y_true_clean - y_pred_clean))
-        elif self.scoring_metric == 'mape':
-            mask_nonzero = y_true_clean != 0
-            if mask_nonzero.sum() > 0:
-                return np.mean(
-                    np.abs((y_true_clean[mask_nonzero] - y_pred_clean[mask_nonzero]) / y_true_clean[mask_nonzero])
-                ) * 100
-            else:
-                return float('inf')
-        elif self.scoring_metric == 'r2':
-            ss_res = np.sum((y_true_clean - y_pred_clean) ** 2)
-            ss_tot = np.sum((y_true_clean - np.mean(y_true_clean)) ** 2)
-            if ss_tot > 0:
-                return 1 - (ss_res / ss_tot)
-            else:
-                return float('-inf')
-        else:
-            raise ValueError(f"Unknown scoring metric: {self.scoring_metric}")
+        return calculate_score(y_true, y_pred, self.scoring_metric, self.minimize, self.validate_nans)
     
     def get_results_dataframe(self) -> pd.DataFrame:
         """
@@ -249,7 +209,7 @@ class GridSearchTuner:
         Returns:
             DataFrame with columns: params, score, timestamp, trial
         """
-        return pd.DataFrame(self.results)
+        return results_to_dataframe(self.results)
     
     def get_best_result(self) -> Dict[str, Any]:
         """
@@ -8,12 +8,17 @@ Date: December 14, 2025
 Version: 1.0
 """
 
-import random
+import json
+from pathlib import Path
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Callable, Optional, Tuple
 import logging
-from datetime import datetime
+
+from .evaluation import (
+    PYARROW_AVAILABLE, PredictionAdapter, calculate_score, extract_targets, results_to_dataframe, run_trial
+)
+from .parallel import resolve_n_jobs, run_trials
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +41,19 @@ class RandomSearchTuner:
         ... )
     """
     
-    def __init__(self, n_iter: int = 20, scoring_metric: str = 'rmse', minimize: bool = True, random_state: Optional[int] = None):
+    # Redraws allowed for one trial before the search space counts as exhausted
+    MAX_RESAMPLES = 10
+    
+    def __init__(
+        self,
+        n_iter: int = 20,
+        scoring_metric: str = 'rmse',
+        minimize: bool = True,
+        random_state: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+        results_path: Optional[str] = None,
+        validate_nans: bool = True
+    ):
         """
         Initialize RandomSearchTuner.
         
@@ -44,16 +61,23 @@ class RandomSearchTuner:
             n_iter: Number of random parameter combinations to try
             scoring_metric: Metric to optimize ('rmse', 'mae', 'mape', 'r2')
             minimize: Whether to minimize (True) or maximize (False) the metric
-            random_state: Random seed for reproducibility
+            random_state: Seed for parameter sampling, for reproducible
+                searches (the global random state is left untouched)
+            n_jobs: Number of parallel trial workers (default: package default,
+                see set_num_jobs)
+            results_path: Optional JSON Lines file that trial results are
+                streamed to instead of being kept in self.results
+            validate_nans: Whether scoring checks for and skips NaN targets or
+                predictions. Set False when the validation data and model
+                output are known to be NaN-free to skip the check
         """
         self.n_iter = n_iter
         self.scoring_metric = scoring_metric.lower()
         self.minimize = minimize
         self.random_state = random_state
-        
-        if random_state is not None:
-            random.seed(random_state)
-            np.random.seed(random_state)
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        self.results_path = results_path
+        self.validate_nans = validate_nans
         
         self.results = []
         self.best_params = None
@@ -62,7 +86,7 @@ class RandomSearchTuner:
         
         logger.info(
             f"RandomSearchTuner initialized: n_iter={n_iter}, metric={scoring_metric}, "
-            f"minimize={minimize}, random_state={random_state}"
+            f"minimize={minimize}, random_state={random_state}, n_jobs={self.n_jobs}"
         )
     
     def search(
@@ -87,7 +111,8 @@ class RandomSearchTuner:
             target_column: Name of target column (for DataFrame)
             fit_kwargs: Additional arguments for model.fit()
             predict_kwargs: Additional arguments for model.predict()
-            verbose: Verbosity level (0, 1, or 2)
+            verbose: Verbosity level (0: quiet, 1: progress every 5% of trials,
+                2: every trial)
         
         Returns:
             Tuple of (best_params, best_model)
@@ -106,96 +131,64 @@ class RandomSearchTuner:
         best_params = None
         best_model = None
         
-        # Randomly sample parameter combinations
-        for i in range(self.n_iter):
-            # Randomly select one value for each parameter
-            params = {
-                param_name: random.choice(param_values)
-                for param_name, param_values in param_distributions.items()
-            }
-            
-            if verbose >= 1:
-                logger.info(f"Trial {i+1}/{self.n_iter}: {params}")
-            
-            try:
-                # Create model with these parameters
-                model = model_factory(**params)
-                
-                # Train model
-                if hasattr(model, 'fit'):
-                    if isinstance(train_data, pd.DataFrame) and target_column:
-                        model.fit(train_data, target_column=target_column, **fit_kwargs)
-                    else:
-                        model.fit(train_data, **fit_kwargs)
+        # Randomly sample distinct parameter combinations
+        tasks = list(enumerate(self._sample_params(param_distributions), start=1))
+        n_trials = len(tasks)
+        log_every = max(1, n_trials // 20)
+        
+        # Evaluate each combination (in worker processes when n_jobs > 1)
+        outcomes = run_trials(
+            run_trial,
+            tasks,
+            n_jobs=self.n_jobs,
+            shared={'train_data': train_data, 'val_data': val_data},
+            model_factory=model_factory,
+            target_column=target_column,
+            fit_kwargs=fit_kwargs,
+            predict_kwargs=predict_kwargs,
+            scoring_metric=self.scoring_metric,
+            minimize=self.minimize,
+            y_true=extract_targets(val_data, target_column),
+            pred_adapter=PredictionAdapter(),
+            validate_nans=self.validate_nans
+        )
+        
+        results_file = None
+        if self.results_path:
+            Path(self.results_path).parent.mkdir(parents=True, exist_ok=True)
+            results_file = open(self.results_path, 'w', buffering=1 << 16)
+        
+        try:
+            for result, model in outcomes:
+                if results_file is not None:
+                    results_file.write(json.dumps(result, default=str) + '\n')
                 else:
-                    raise ValueError("Model must have a fit() method")
+                    self.results.append(result)
                 
-                # Predict on validation set
-                if hasattr(model, 'predict'):
-                    predictions = model.predict(val_data, **predict_kwargs)
-                else:
-                    raise ValueError("Model must have a predict() method")
+                if verbose >= 2:
+                    logger.info("Trial %d/%d: %r", result['trial'], n_trials, result['params'])
                 
-                # Get true values
-                if isinstance(val_data, pd.DataFrame):
-                    if target_column:
-                        y_true = val_data[target_column].values
-                    else:
-                        y_true = val_data.iloc[:, -1].values
+                if 'error' in result:
+                    logger.error("Trial %d failed with error: %s", result['trial'], result['error'])
                 else:
-                    y_true = val_data.values
-                
-                # Handle predictions format
-                if isinstance(predictions, pd.DataFrame):
-                    if 'yhat' in predictions.columns:
-                        predictions = predictions['yhat'].values
-                    else:
-                        predictions = predictions.iloc[:, 0].values
-                elif isinstance(predictions, tuple):
-                    predictions = predictions[0]
-                
-                # Flatten if needed
-                if predictions.ndim > 1 and predictions.shape[1] == 1:
-                    predictions = predictions.flatten()
-                if y_true.ndim > 1 and y_true.shape[1] == 1:
-                    y_true = y_true.flatten()
-                
-                # Align lengths
-                min_len = min(len(y_true), len(predictions))
-                y_true = y_true[:min_len]
-                predictions = predictions[:min_len]
+                    # Update best if better
+                    score = result['score']
+                    is_better = (score < best_score) if self.minimize else (score > best_score)
+                    if is_better:
+                        best_score = score
+                        best_params = result['params'].copy()
+                        best_model = model
+                        if verbose >= 2:
+                            logger.info("New best score: %.6f", best_score)
                 
-                # Calculate score
-                score = self._calculate_score(y_true, predictions)
-                
-                # Store result
-                result = {
-                    'params': params,
-                    'score': score,
-                    'timestamp': datetime.now().isoformat(),
-                    'trial': i + 1
-                }
-                self.results.append(result)
-                
-                # Update best if better
-                is_better = (score < best_score) if self.minimize else (score > best_score)
-                if is_better:
-                    best_score = score
-                    best_params = params.copy()
-                    best_model = model
-                    if verbose >= 1:
-                        logger.info(f"New best score: {best_score:.6f}")
-                
-            except Exception as e:
-                logger.error(f"Trial {i+1} failed with error: {e}")
-                result = {
-                    'params': params,
-                    'score': None,
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat(),
-                    'trial': i + 1
-                }
-                self.results.append(result)
+                # Batched progress summary instead of a line per trial
+                if verbose == 1 and result['trial'] % log_every == 0:
+                    logger.info(
+                        "Trial %d/%d done, best score so far: %.6f", result['trial'], n_trials, best_score
+                    )
+        finally:
+            if results_file is not None:
+                results_file.close()
         
         self.best_params = best_params
         self.best_score = best_score
@@ -209,6 +202,70 @@ class RandomSearchTuner:
         
         return best_params, best_model
     
+    def _sample_params(self, param_distributions: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Draw all n_iter parameter combinations up front.
+        
+        A single vectorized draw of an (n_iter, n_params) index matrix
+        replaces a random.choice call per parameter per trial. When n_iter
+        covers the whole space, every combination is returned once in random
+        order. Otherwise a combination that was already drawn is resampled
+        (up to MAX_RESAMPLES times) instead of training the same model twice;
+        if no new combination turns up the search space is treated as
+        exhausted and fewer than n_iter combinations are returned.
+        
+        Args:
+            param_distributions: Dictionary of parameter names to lists of possible values
+        
+        Returns:
+            List of at most n_iter distinct parameter dictionaries
+        """
+        rng = np.random.default_rng(self.random_state)
+        param_names = list(param_distributions.keys())
+        param_values = [list(values) for values in param_distributions.values()]
+        if not param_names:
+            return [{}]
+        
+        sizes = [len(values) for values in param_values]
+        n_combinations = 1
+        for size in sizes:
+            n_combinations *= size
+        
+        if n_combinations <= self.n_iter:
+            # Budget covers the whole space: visit each combination once
+            logger.info(f"n_iter covers all {n_combinations} combinations; evaluating each once")
+            order = rng.permutation(n_combinations)
+            indices = np.stack(np.unravel_index(order, sizes), axis=1)
+        else:
+            indices = rng.integers(0, sizes, size=(self.n_iter, len(sizes)))
+        
+        seen = set()
+        sampled = []
+        n_duplicates = 0
+        
+        # Combinations are compared by value indices, so unhashable values are fine
+        for key in map(tuple, indices.tolist()):
+            attempts = 0
+            while key in seen and attempts < self.MAX_RESAMPLES:
+                n_duplicates += 1
+                attempts += 1
+                key = tuple(rng.integers(0, sizes).tolist())
+            
+            if key in seen:
+                logger.info(f"Search space exhausted after {len(sampled)} distinct combinations")
+                break
+            
+            seen.add(key)
+            sampled.append({
+                param_name: values[index]
+                for param_name, values, index in zip(param_names, param_values, key)
+            })
+        
+        if n_duplicates:
+            logger.info(f"Skipped {n_duplicates} duplicate parameter combinations")
+        
+        return sampled
+    
     def _calculate_score(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
         """
         Calculate scoring metric.
@@ -220,35 +277,7 @@ class RandomSearchTuner:
         Returns:
             Score value
         """
-        # Remove NaN values
-        mask = ~(np.isnan(y_true) | np.isnan(y_pred))
-        y_true_clean = y_true[mask]
-        y_pred_clean = y_pred[mask]
-        
-        if len(y_true_clean) == 0:
-            return float('inf') if self.minimize else float('-inf')
-        
-        if self.scoring_metric == 'rmse':
-            return np.sqrt(np.mean((y_true_clean - y_pred_clean) ** 2))
-        elif self.scoring_metric == 'mae':
-            return np.mean(np.abs(y_true_clean - y_pred_clean))
-        elif self.scoring_metric == 'mape':
-            mask_nonzero = y_true_clean != 0
-            if mask_nonzero.sum() > 0:
-                return np.mean(
-                    np.abs((y_true_clean[mask_nonzero] - y_pred_clean[mask_nonzero]) / y_true_clean[mask_nonzero])
-                ) * 100
-            else:
-                return float('inf')
-        elif self.scoring_metric == 'r2':
-            ss_res = np.sum((y_true_clean - y_pred_clean) ** 2)
-            ss_tot = np.sum((y_true_clean - np.mean(y_true_clean)) ** 2)
-            if ss_tot > 0:
-                return 1 - (ss_res / ss_tot)
-            else:
-                return float('-inf')
-        else:
-            raise ValueError(f"Unknown scoring metric: {self.scoring_metric}")
+        return calculate_score(y_true, y_pred, self.scoring_metric, self.minimize, self.validate_nans)
     
     def get_results_dataframe(self) -> pd.DataFrame:
         """
@@ -257,7 +286,14 @@ class RandomSearchTuner:
         Returns:
             DataFrame with columns: params, score, timestamp, trial
         """
-        return pd.DataFrame(self.results)
+        if self.results_path:
+            if not Path(self.results_path).exists():
+                return pd.DataFrame()
+            if PYARROW_AVAILABLE:
+                return pd.read_json(self.results_path, lines=True, dtype_backend='pyarrow')
+            return pd.read_json(self.results_path, lines=True)
+        
+        return results_to_dataframe(self.results)
     
     def get_best_result(self) -> Dict[str, Any]:
         """
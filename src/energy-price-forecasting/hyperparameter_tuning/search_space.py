@@ -8,14 +8,39 @@ Date: December 14, 2025
 Version: 1.0
 """
 
-from typing import Dict, List, Any, Optional
+import copy
+import os
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 import yaml
 from pathlib import Path
 import logging
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 logger = logging.getLogger(__name__)
 
 
+def _to_plain(value: Any) -> Any:
+    """Convert tuples and NumPy scalars (recursively) to the plain types the safe dumper accepts."""
+    if isinstance(value, dict):
+        return {_to_plain(key): _to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item) for item in value]
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    if hasattr(value, 'item'):
+        # NumPy scalar, e.g. from np.linspace; .item() gives the Python equivalent
+        return value.item()
+    if isinstance(value, str):
+        return str(value)
+    return value
+
+
 class HyperparameterSearchSpace:
     """
     Define and manage hyperparameter search spaces.
@@ -31,12 +56,16 @@ class HyperparameterSearchSpace:
         >>> lstm_space = space.get_search_space('lstm')
     """
     
+    # Search spaces parsed from files, keyed by (resolved path, mtime in ns, size)
+    _FILE_CACHE: Dict[Tuple[str, int, int], Dict[str, Dict]] = {}
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize HyperparameterSearchSpace.
         
         Args:
-            config_path: Path to YAML configuration file with search spaces
+            config_path: Path to YAML configuration file with search spaces. The
+                parsed file is cached in memory and reused until the file changes
         """
         if config_path:
             self.search_spaces = self._load_from_file(config_path)
@@ -48,21 +77,32 @@ class HyperparameterSearchSpace:
     def _load_from_file(self, config_path: str) -> Dict[str, Dict]:
         """Load search spaces from YAML file."""
         path = Path(config_path)
-        if not path.exists():
+        if not path.is_file():
             logger.warning(f"Config file not found: {config_path}. Using default search spaces.")
             return self._default_search_spaces()
         
         try:
+            stat = path.stat()
+            key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+            cached = self._FILE_CACHE.get(key)
+            if cached is not None:
+                logger.debug(f"Using cached search spaces from {config_path}")
+                return copy.deepcopy(cached)
+            
             with open(path, 'r') as f:
-                spaces = yaml.safe_load(f)
+                spaces = yaml.load(f, Loader=_YamlLoader)
+            self._FILE_CACHE[key] = spaces
             logger.info(f"Loaded search spaces from {config_path}")
-            return spaces
+            return copy.deepcopy(spaces)
         except Exception as e:
             logger.error(f"Failed to load search spaces: {e}. Using default.")
             return self._default_search_spaces()
     
     def _default_search_spaces(self) -> Dict[str, Dict]:
         """Get default search spaces for all model types."""
+        # Built fresh from a literal on purpose: callers may mutate
+        # search_spaces in place, and a literal (a few µs) is far cheaper
+        # than deep-copying a shared module-level constant
         return {
             'lstm': {
                 'lstm_units': [50, 64, 128],
@@ -95,26 +135,48 @@ class HyperparameterSearchSpace:
             }
         }
     
-    def get_search_space(self, model_type: str) -> Dict[str, List[Any]]:
+    def get_search_space(self, model_type: str) -> Mapping[str, List[Any]]:
         """
         Get search space for a model type.
         
+        Returns a read-only view rather than a copy, since tuners only read
+        the space; use get_search_space_mutable() for a copy to modify.
+        
+        Args:
+            model_type: Type of model ('lstm', 'arima', 'prophet', etc.)
+        
+        Returns:
+            Read-only mapping of parameter names to lists of values
+        
+        Raises:
+            ValueError: If model_type not found
+        """
+        return MappingProxyType(self._lookup(model_type))
+    
+    def get_search_space_mutable(self, model_type: str) -> Dict[str, List[Any]]:
+        """
+        Get an independent copy of the search space for a model type.
+        
         Args:
             model_type: Type of model ('lstm', 'arima', 'prophet', etc.)
         
         Returns:
-            Dictionary of parameter names to lists of values
+            Deep copy of the parameter names to lists of values
         
         Raises:
             ValueError: If model_type not found
         """
-        if model_type not in self.search_spaces:
+        return copy.deepcopy(self._lookup(model_type))
+    
+    def _lookup(self, model_type: str) -> Dict[str, List[Any]]:
+        """Return the stored search space for model_type with a single dict lookup."""
+        space = self.search_spaces.get(model_type)
+        if space is None:
             raise ValueError(
                 f"Unknown model type: {model_type}. "
                 f"Available types: {list(self.search_spaces.keys())}"
             )
-        
-        return self.search_spaces[model_type].copy()
+        return space
     
     def add_search_space(self, model_type: str, search_space: Dict[str, List[Any]]):
         """
@@ -131,18 +193,29 @@ class HyperparameterSearchSpace:
         """
         Save search spaces to YAML file.
         
+        The file is written to a temporary sibling and then moved into place,
+        so a crash mid-write never leaves a truncated config behind. Tuples
+        are written as lists and NumPy scalars as plain numbers; other
+        non-YAML values raise yaml.representer.RepresenterError.
+        
         Args:
             filepath: Path to save search spaces
         """
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
         
-        with open(path, 'w') as f:
-            yaml.dump(self.search_spaces, f, default_flow_style=False)
+        try:
+            with open(tmp_path, 'w') as f:
+                yaml.dump(_to_plain(self.search_spaces), f, Dumper=_YamlDumper, default_flow_style=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
         
         logger.info(f"Search spaces saved to {filepath}")
     
-    def to_dict(self) -> Dict[str, Dict]:
-        """Get all search spaces as dictionary."""
-        return self.search_spaces.copy()
+    def to_dict(self) -> Mapping[str, Dict]:
+        """Get all search spaces as a read-only mapping."""
+        return MappingProxyType(self.search_spaces)
 
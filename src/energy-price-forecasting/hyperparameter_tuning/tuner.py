@@ -8,8 +8,12 @@ Date: December 14, 2025
 Version: 1.0
 """
 
+import numbers
+import uuid
 import pandas as pd
-from typing import Dict, List, Any, Callable, Optional, Tuple
+from datetime import datetime
+from functools import partial
+from typing import Dict, List, Any, Callable, Mapping, Optional, Tuple
 import logging
 
 from .search_space import HyperparameterSearchSpace
@@ -20,6 +24,29 @@ from .bayesian_optimization import BayesianOptimizer
 logger = logging.getLogger(__name__)
 
 
+def _early_stop(study: Any, trial: Any, patience: int):
+    """
+    Optuna study callback stopping the search when the best trial is stale.
+    
+    Args:
+        study: Optuna study
+        trial: Trial that just finished
+        patience: Number of trials without improvement before stopping
+    """
+    try:
+        best_trial_number = study.best_trial.number
+    except ValueError:
+        # No completed trial yet
+        return
+    
+    if trial.number - best_trial_number >= patience:
+        logger.info(
+            f"Early stopping: no improvement in {patience} trials "
+            f"(best trial {best_trial_number})"
+        )
+        study.stop()
+
+
 class HyperparameterTuner:
     """
     Unified hyperparameter tuner.
@@ -38,6 +65,9 @@ class HyperparameterTuner:
         ... )
     """
     
+    # Bayesian searches with at least this many trials default to a SQLite study
+    PERSIST_STUDY_MIN_TRIALS = 100
+    
     def __init__(
         self,
         method: str = 'random',
@@ -55,22 +85,44 @@ class HyperparameterTuner:
             scoring_metric: Metric to optimize ('rmse', 'mae', 'mape', 'r2')
             minimize: Whether to minimize (True) or maximize (False) the metric
             **method_kwargs: Additional arguments for specific method:
+                - all: n_jobs (default: package default, see set_num_jobs); trials
+                  run in processes for grid/random search and in threads for bayesian
                 - grid: (none)
                 - random: n_iter (default: 20), random_state
-                - bayesian: n_trials (default: 50), study_name, storage, random_state
+                - bayesian: n_trials (default: 50), study_name, storage (URL or Optuna
+                  storage, e.g. DaskStorage; see BayesianOptimizer.run_worker;
+                  default: in memory, or sqlite:///<study_name or optuna_study>.db
+                  when n_trials >= PERSIST_STUDY_MIN_TRIALS, under a new study
+                  name per run that is logged for resuming; pass storage=None
+                  to keep the study in memory), load_if_exists (resume a stored
+                  study of the same name, e.g. after a crash; default: False),
+                  random_state, worker_id (offsets the sampler seed per
+                  shared-study worker),
+                  sampler (default: 'tpe'), pruner ('median', 'hyperband', 'none'
+                  or an Optuna pruner), pruning_callback (e.g.
+                  keras_pruning_callback() for LSTM models; see
+                  BayesianOptimizer.optimize), early_stopping_rounds (stop after
+                  this many trials without improvement)
         """
         self.method = method.lower()
+        self.pruning_callback = method_kwargs.get('pruning_callback', None)
+        self.early_stopping_rounds = method_kwargs.get('early_stopping_rounds', None)
+        n_jobs = method_kwargs.get('n_jobs', None)
         self.scoring_metric = scoring_metric
         self.minimize = minimize
         
         # Initialize search space
         self.search_space = HyperparameterSearchSpace(search_space_config)
         
+        # model_type -> (source search space, Optuna-format space)
+        self._optuna_space_cache: Dict[str, Tuple[Dict, Dict[str, Any]]] = {}
+        
         # Initialize appropriate tuner
         if self.method == 'grid':
             self.tuner = GridSearchTuner(
                 scoring_metric=scoring_metric,
-                minimize=minimize
+                minimize=minimize,
+                n_jobs=n_jobs
             )
         elif self.method == 'random':
             n_iter = method_kwargs.get('n_iter', 20)
@@ -79,14 +131,29 @@ class HyperparameterTuner:
                 n_iter=n_iter,
                 scoring_metric=scoring_metric,
                 minimize=minimize,
-                random_state=random_state
+                random_state=random_state,
+                n_jobs=n_jobs
             )
         elif self.method == 'bayesian':
             n_trials = method_kwargs.get('n_trials', 50)
             study_name = method_kwargs.get('study_name', None)
             storage = method_kwargs.get('storage', None)
             load_if_exists = method_kwargs.get('load_if_exists', False)
+            if 'storage' not in method_kwargs and n_trials >= self.PERSIST_STUDY_MIN_TRIALS:
+                # A fresh study name per run, so trials of an earlier run
+                # (possibly on other data) are never loaded without asking
+                base_name = study_name or 'optuna_study'
+                storage = f"sqlite:///{base_name}.db"
+                study_name = f"{base_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+                load_if_exists = False
+                logger.info(
+                    f"Persisting {n_trials}-trial study '{study_name}' to {storage}; after a crash, "
+                    f"resume with study_name='{study_name}', storage='{storage}', load_if_exists=True"
+                )
             random_state = method_kwargs.get('random_state', None)
+            sampler = method_kwargs.get('sampler', 'tpe')
+            pruner = method_kwargs.get('pruner', None)
+            worker_id = method_kwargs.get('worker_id', 0)
             self.tuner = BayesianOptimizer(
                 n_trials=n_trials,
                 scoring_metric=scoring_metric,
@@ -94,7 +161,11 @@ class HyperparameterTuner:
                 study_name=study_name,
                 storage=storage,
                 load_if_exists=load_if_exists,
-                random_state=random_state
+                random_state=random_state,
+                n_jobs=n_jobs,
+                sampler=sampler,
+                pruner=pruner,
+                worker_id=worker_id
             )
         else:
             raise ValueError(
@@ -111,7 +182,7 @@ class HyperparameterTuner:
         train_data: pd.DataFrame | pd.Series,
         val_data: pd.DataFrame | pd.Series,
         target_column: Optional[str] = None,
-        param_space: Optional[Dict[str, List[Any]]] = None,
+        param_space: Optional[Mapping[str, List[Any]]] = None,
         fit_kwargs: Optional[Dict] = None,
         predict_kwargs: Optional[Dict] = None,
         verbose: int = 1
@@ -126,7 +197,8 @@ class HyperparameterTuner:
             val_data: Validation data
             target_column: Name of target column (for DataFrame)
             param_space: Custom parameter search space (overrides default for model_type)
-            fit_kwargs: Additional arguments for model.fit()
+            fit_kwargs: Additional arguments for model.fit(); may include
+                callbacks=[...] (Bayesian pruning appends its callback to these)
             predict_kwargs: Additional arguments for model.predict()
             verbose: Verbosity level (0, 1, or 2)
         
@@ -134,38 +206,20 @@ class HyperparameterTuner:
             Tuple of (best_params, best_model)
         """
         # Get search space
-        if param_space is None:
+        use_default_space = param_space is None
+        if use_default_space:
             param_space = self.search_space.get_search_space(model_type)
         
         # Convert search space format for Bayesian optimization
         if self.method == 'bayesian':
-            # Convert list-based space to Optuna format
-            optuna_space = {}
-            for param_name, param_values in param_space.items():
-                if isinstance(param_values, list):
-                    if all(isinstance(v, int) for v in param_values):
-                        # Integer parameter
-                        optuna_space[param_name] = {
-                            'type': 'int',
-                            'low': min(param_values),
-                            'high': max(param_values)
-                        }
-                    elif all(isinstance(v, float) for v in param_values):
-                        # Float parameter
-                        optuna_space[param_name] = {
-                            'type': 'float',
-                            'low': min(param_values),
-                            'high': max(param_values),
-                            'log': False
-                        }
-                    else:
-                        # Categorical parameter
-                        optuna_space[param_name] = {
-                            'type': 'categorical',
-                            'choices': param_values
-                        }
-                else:
-                    optuna_space[param_name] = param_values
+            if use_default_space:
+                optuna_space = self._get_cached_optuna_space(model_type)
+            else:
+                optuna_space = self._to_optuna_space(param_space)
+            
+            callbacks = None
+            if self.early_stopping_rounds:
+                callbacks = [partial(_early_stop, patience=self.early_stopping_rounds)]
             
             # Use Bayesian optimizer
             return self.tuner.optimize(
@@ -176,7 +230,9 @@ class HyperparameterTuner:
                 target_column,
                 fit_kwargs,
                 predict_kwargs,
-                verbose
+                verbose,
+                pruning_callback=self.pruning_callback,
+                callbacks=callbacks
             )
         else:
             # Use grid or random search
@@ -191,6 +247,73 @@ class HyperparameterTuner:
                 verbose
             )
     
+    def _get_cached_optuna_space(self, model_type: str) -> Dict[str, Any]:
+        """
+        Get the Optuna-format default search space for model_type, converting it once.
+        
+        The cache entry is rebuilt when the search space for model_type has
+        been replaced (e.g. via add_search_space()).
+        """
+        source = self.search_space.search_spaces[model_type]
+        cached = self._optuna_space_cache.get(model_type)
+        if cached is None or cached[0] is not source:
+            cached = (source, self._to_optuna_space(source))
+            self._optuna_space_cache[model_type] = cached
+        return cached[1]
+    
+    @staticmethod
+    def _to_optuna_space(param_space: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a list-based search space to Optuna format.
+        
+        Lists of integers (including NumPy integers, excluding bools) become
+        int ranges, lists of real numbers float ranges, anything else a
+        categorical choice.
+        
+        Args:
+            param_space: Parameter names to lists of values (or Optuna specs)
+        
+        Returns:
+            Optuna-format search space
+        """
+        optuna_space = {}
+        for param_name, param_values in param_space.items():
+            if isinstance(param_values, list):
+                # Classify the values in one pass over the list
+                is_int = is_real = True
+                for v in param_values:
+                    if isinstance(v, bool) or not isinstance(v, numbers.Real):
+                        is_int = is_real = False
+                        break
+                    if is_int and not isinstance(v, numbers.Integral):
+                        is_int = False
+                
+                if is_int:
+                    # Integer parameter
+                    optuna_space[param_name] = {
+                        'type': 'int',
+                        'low': int(min(param_values)),
+                        'high': int(max(param_values))
+                    }
+                elif is_real:
+                    # Float parameter (ints mixed in widen the range)
+                    optuna_space[param_name] = {
+                        'type': 'float',
+                        'low': float(min(param_values)),
+                        'high': float(max(param_values)),
+                        'log': False
+                    }
+                else:
+                    # Categorical parameter
+                    optuna_space[param_name] = {
+                        'type': 'categorical',
+                        'choices': param_values
+                    }
+            else:
+                optuna_space[param_name] = param_values
+        
+        return optuna_space
+    
     def get_results(self) -> pd.DataFrame:
         """
         Get tuning results as DataFrame.
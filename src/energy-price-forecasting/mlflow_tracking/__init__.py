@@ -11,7 +11,7 @@ Version: 1.0
 
 from .experiment_tracker import ExperimentTracker
 from .model_registry import ModelRegistry
-from .mlflow_manager import MLflowManager
+from .mlflow_manager import MLflowManager, get_default_manager
 
 __version__ = "1.0.0"
 
@@ -19,5 +19,6 @@ __all__ = [
     'ExperimentTracker',
     'ModelRegistry',
     'MLflowManager',
+    'get_default_manager',
 ]
 
@@ -8,23 +8,28 @@ Date: December 14, 2025
 Version: 1.0
 """
 
+import importlib.util
 import os
 from typing import Dict, Any, Optional, List
 import logging
 from datetime import datetime
 
-try:
-    import mlflow
-    MLFLOW_AVAILABLE = True
-except ImportError:
-    MLFLOW_AVAILABLE = False
-    mlflow = None
+# MLflow itself is imported on first use (see _load_mlflow)
+MLFLOW_AVAILABLE = importlib.util.find_spec('mlflow') is not None
+mlflow = None
 
 from .mlflow_manager import MLflowManager
 
 logger = logging.getLogger(__name__)
 
 
+def _load_mlflow():
+    """Import MLflow into this module on first use."""
+    global mlflow
+    if mlflow is None:
+        import mlflow
+
+
 class ExperimentTracker:
     """
     Tracks ML experiments using MLflow.
@@ -48,7 +53,8 @@ class ExperimentTracker:
         self,
         experiment_name: str,
         tracking_uri: Optional[str] = None,
-        run_name: Optional[str] = None
+        run_name: Optional[str] = None,
+        async_logging: bool = False
     ):
         """
         Initialize ExperimentTracker.
@@ -57,6 +63,11 @@ class ExperimentTracker:
             experiment_name: Name of the experiment
             tracking_uri: MLflow tracking URI
             run_name: Name for the run (optional)
+            async_logging: Send params, metrics, tags and artifacts from a
+                background thread so that callers (e.g. tuning trials) do
+                not wait on the tracking server. Calls are queued on the
+                manager's background logger, flushed by flush() and
+                end_run() and stopped by close(); failures are logged there
         
         Raises:
             ImportError: If MLflow is not installed
@@ -65,12 +76,19 @@ class ExperimentTracker:
             raise ImportError(
                 "MLflow is required. Install it with: pip install mlflow"
             )
+        _load_mlflow()
         
-        self.manager = MLflowManager(tracking_uri=tracking_uri, experiment_name=experiment_name)
+        self.manager = MLflowManager(
+            tracking_uri=tracking_uri, experiment_name=experiment_name, async_logging=async_logging
+        )
+        self.client = self.manager.client
         self.experiment_name = experiment_name
+        # Fixed for the tracker's lifetime, so searches skip the name lookup
+        self._experiment_id = self.manager.experiment_id
         self.run_name = run_name
         self.run_id = None
         self.active_run = None
+        self.async_logging = async_logging
         
         logger.info(f"ExperimentTracker initialized for experiment: {experiment_name}")
     
@@ -104,6 +122,7 @@ class ExperimentTracker:
             status: Run status ('FINISHED', 'FAILED', 'KILLED')
         """
         if self.active_run is not None:
+            self.flush()
             mlflow.end_run(status=status)
             logger.info(f"Ended run: {self.run_id} (Status: {status})")
             self.active_run = None
@@ -111,6 +130,24 @@ class ExperimentTracker:
         else:
             logger.warning("No active run to end")
     
+    def flush(self) -> int:
+        """
+        Wait for queued background logging calls to finish.
+        
+        Returns:
+            Number of calls that failed (each failure is logged)
+        """
+        return self.manager.flush()
+    
+    def close(self) -> int:
+        """
+        Send queued background logging calls and stop the background logger.
+        
+        Returns:
+            Number of calls that failed (each failure is logged)
+        """
+        return self.manager.close()
+    
     def log_params(self, params: Dict[str, Any]):
         """
         Log parameters to the current run.
@@ -121,9 +158,8 @@ class ExperimentTracker:
         if self.active_run is None:
             raise RuntimeError("No active run. Call start_run() first.")
         
-        # Convert all values to strings (MLflow requirement)
-        params_str = {k: str(v) for k, v in params.items()}
-        mlflow.log_params(params_str)
+        # One batched store call for all parameters (non-string values stringified as MLflow requires)
+        self.manager.log_batch(params=params, run_id=self.run_id)
         logger.debug(f"Logged parameters: {list(params.keys())}")
     
     def log_metrics(self, metrics: Dict[str, float], step: Optional[int] = None):
@@ -137,11 +173,7 @@ class ExperimentTracker:
         if self.active_run is None:
             raise RuntimeError("No active run. Call start_run() first.")
         
-        if step is not None:
-            for metric_name, metric_value in metrics.items():
-                mlflow.log_metric(metric_name, metric_value, step=step)
-        else:
-            mlflow.log_metrics(metrics)
+        self.manager.log_batch(metrics=metrics, step=step, run_id=self.run_id)
         
         logger.debug(f"Logged metrics: {list(metrics.keys())}")
     
@@ -159,7 +191,7 @@ class ExperimentTracker:
         if not os.path.exists(local_path):
             raise FileNotFoundError(f"Artifact not found: {local_path}")
         
-        mlflow.log_artifact(local_path, artifact_path)
+        self.manager.submit(self.client.log_artifact, self.run_id, local_path, artifact_path)
         logger.debug(f"Logged artifact: {local_path}")
     
     def log_artifacts(self, local_dir: str, artifact_path: Optional[str] = None):
@@ -176,7 +208,7 @@ class ExperimentTracker:
         if not os.path.exists(local_dir):
             raise FileNotFoundError(f"Directory not found: {local_dir}")
         
-        mlflow.log_artifacts(local_dir, artifact_path)
+        self.manager.submit(self.client.log_artifacts, self.run_id, local_dir, artifact_path)
         logger.debug(f"Logged artifacts from: {local_dir}")
     
     def log_model(
@@ -226,7 +258,7 @@ class ExperimentTracker:
         if self.active_run is None:
             raise RuntimeError("No active run. Call start_run() first.")
         
-        mlflow.set_tags(tags)
+        self.manager.log_batch(tags=tags, run_id=self.run_id)
         logger.debug(f"Logged tags: {list(tags.keys())}")
     
     def set_tag(self, key: str, value: str):
@@ -240,7 +272,7 @@ class ExperimentTracker:
         if self.active_run is None:
             raise RuntimeError("No active run. Call start_run() first.")
         
-        mlflow.set_tag(key, value)
+        self.manager.submit(self.client.set_tag, self.run_id, key, str(value))
         logger.debug(f"Set tag: {key} = {value}")
     
     def search_runs(
@@ -260,12 +292,8 @@ class ExperimentTracker:
         Returns:
             List of run dictionaries
         """
-        experiment = mlflow.get_experiment_by_name(self.experiment_name)
-        if experiment is None:
-            return []
-        
         runs = mlflow.search_runs(
-            experiment_ids=[experiment.experiment_id],
+            experiment_ids=[self._experiment_id],
             filter_string=filter_string,
             max_results=max_results,
             order_by=order_by
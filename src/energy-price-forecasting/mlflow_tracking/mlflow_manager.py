@@ -8,21 +8,98 @@ Date: December 14, 2025
 Version: 1.0
 """
 
+import atexit
+import functools
+import importlib.util
 import os
-from typing import Optional, Dict, Any
+import queue
+import threading
+import time
+import weakref
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple
 import logging
 
-try:
-    import mlflow
-    from mlflow.tracking import MlflowClient
-    MLFLOW_AVAILABLE = True
-except ImportError:
-    MLFLOW_AVAILABLE = False
-    mlflow = None
-    MlflowClient = None
+# Importing MLflow pulls in SQLAlchemy, alembic and more, so it is deferred
+# until an MLflowManager is created (see _load_mlflow)
+MLFLOW_AVAILABLE = importlib.util.find_spec('mlflow') is not None
+mlflow = None
+MlflowClient = None
+Metric = None
+Param = None
+RunTag = None
 
 logger = logging.getLogger(__name__)
 
+# Per-request limits enforced by the tracking server (mlflow.utils.validation)
+MAX_PARAMS_TAGS_PER_BATCH = 100
+MAX_METRICS_PER_BATCH = 1000
+MAX_ENTITIES_PER_BATCH = 1000
+
+# Managers with a running background logger, closed when the interpreter exits
+_async_managers = weakref.WeakSet()
+
+
+@atexit.register
+def _close_async_managers():
+    """Send logging calls still queued by any manager and stop its logger thread."""
+    for manager in list(_async_managers):
+        manager.close()
+
+
+def _load_mlflow():
+    """Import MLflow into this module on first use."""
+    global mlflow, MlflowClient, Metric, Param, RunTag
+    if mlflow is None:
+        import mlflow
+    if MlflowClient is None:
+        from mlflow.tracking import MlflowClient
+    if Metric is None:
+        from mlflow.entities import Metric, Param, RunTag
+
+
+def log_batch_chunked(
+    client: Any,
+    run_id: str,
+    metrics: Optional[List[Any]] = None,
+    params: Optional[List[Any]] = None,
+    tags: Optional[List[Any]] = None
+) -> int:
+    """
+    Log entities with client.log_batch, splitting them to respect server limits.
+    
+    The tracking server rejects a request with more than
+    MAX_PARAMS_TAGS_PER_BATCH params and tags combined, more than
+    MAX_METRICS_PER_BATCH metrics or more than MAX_ENTITIES_PER_BATCH
+    entities in total. Small batches still go out as a single request.
+    
+    Args:
+        client: MlflowClient
+        run_id: Run to log to
+        metrics: Metric entities
+        params: Param entities
+        tags: RunTag entities
+    
+    Returns:
+        Number of requests sent
+    """
+    metrics, params, tags = metrics or [], params or [], tags or []
+    n_requests = 0
+    
+    while True:
+        chunk_params = params[:MAX_PARAMS_TAGS_PER_BATCH]
+        chunk_tags = tags[:MAX_PARAMS_TAGS_PER_BATCH - len(chunk_params)]
+        n_metrics = min(MAX_METRICS_PER_BATCH, MAX_ENTITIES_PER_BATCH - len(chunk_params) - len(chunk_tags))
+        chunk_metrics = metrics[:n_metrics]
+        
+        client.log_batch(run_id, metrics=chunk_metrics, params=chunk_params, tags=chunk_tags)
+        n_requests += 1
+        
+        params = params[len(chunk_params):]
+        tags = tags[len(chunk_tags):]
+        metrics = metrics[len(chunk_metrics):]
+        if not (metrics or params or tags):
+            return n_requests
+
 
 class MLflowManager:
     """
@@ -33,16 +110,28 @@ class MLflowManager:
     Attributes:
         tracking_uri: MLflow tracking URI
         client: MLflow client instance
+        experiment_id: ID of the experiment set up last (None if none yet)
     
     Example:
         >>> manager = MLflowManager(tracking_uri='http://localhost:5000')
         >>> manager.setup_experiment('energy_forecasting')
     """
     
+    # Fixed attribute set; one manager may exist per experiment or sweep worker
+    __slots__ = (
+        'tracking_uri', 'client', 'experiment_id', '_experiment_cache',
+        'active_run', 'run_id', 'async_logging', '_log_queue', '_log_thread',
+        '_log_failures', '__weakref__'
+    )
+    
+    # Queued log_batch calls merged into one request by the background logger
+    MAX_QUEUED_BATCHES = 100
+    
     def __init__(
         self,
         tracking_uri: Optional[str] = None,
-        experiment_name: Optional[str] = None
+        experiment_name: Optional[str] = None,
+        async_logging: bool = False
     ):
         """
         Initialize MLflowManager.
@@ -50,6 +139,12 @@ class MLflowManager:
         Args:
             tracking_uri: MLflow tracking URI (default: local file store)
             experiment_name: Name of experiment to use/create
+            async_logging: Queue log_batch/log_params/log_metrics and
+                submit() calls and send them from a background thread, merging queued calls
+                into one request, so training loops do not wait on the
+                tracking server. The queue is flushed by flush() and
+                end_run(); failures are logged there. close() (called at
+                interpreter exit) sends what is left and stops the thread
         
         Raises:
             ImportError: If MLflow is not installed
@@ -58,6 +153,7 @@ class MLflowManager:
             raise ImportError(
                 "MLflow is required. Install it with: pip install mlflow"
             )
+        _load_mlflow()
         
         # Set tracking URI
         if tracking_uri:
@@ -69,6 +165,10 @@ class MLflowManager:
         
         self.tracking_uri = mlflow.get_tracking_uri()
         self.client = MlflowClient(tracking_uri=self.tracking_uri)
+        self.experiment_id = None
+        
+        # Experiment name -> ID, so repeated setup calls skip the lookup by name
+        self._experiment_cache: Dict[str, str] = {}
         
         # Set experiment if provided
         if experiment_name:
@@ -77,18 +177,40 @@ class MLflowManager:
         self.active_run = None
         self.run_id = None
         
+        # Background logger: (run_id, metrics, params, tags) batches drained by a daemon thread
+        self.async_logging = async_logging
+        self._log_queue: Optional[queue.Queue] = None
+        self._log_thread: Optional[threading.Thread] = None
+        self._log_failures = 0
+        if async_logging:
+            self._log_queue = queue.Queue()
+            self._log_thread = threading.Thread(
+                target=self._drain_logs, name='mlflow-log-drain', daemon=True
+            )
+            self._log_thread.start()
+            _async_managers.add(self)
+        
         logger.info(f"MLflowManager initialized with tracking URI: {self.tracking_uri}")
     
     def setup_experiment(self, experiment_name: str) -> str:
         """
         Set up or get existing experiment.
         
+        The name-to-ID mapping is cached, so setting up the same experiment
+        again only re-activates it by ID.
+        
         Args:
             experiment_name: Name of the experiment
         
         Returns:
             Experiment ID
         """
+        experiment_id = self._experiment_cache.get(experiment_name)
+        if experiment_id is not None:
+            mlflow.set_experiment(experiment_id=experiment_id)
+            self.experiment_id = experiment_id
+            return experiment_id
+        
         try:
             experiment = mlflow.get_experiment_by_name(experiment_name)
             if experiment is None:
@@ -99,6 +221,8 @@ class MLflowManager:
                 logger.info(f"Using existing experiment: {experiment_name} (ID: {experiment_id})")
             
             mlflow.set_experiment(experiment_name)
+            self.experiment_id = experiment_id
+            self._experiment_cache[experiment_name] = experiment_id
             return experiment_id
         except Exception as e:
             logger.error(f"Failed to setup experiment: {e}")
@@ -134,6 +258,7 @@ class MLflowManager:
         End the current MLflow run.
         """
         if self.active_run is not None:
+            self.flush()
             mlflow.end_run(status=status)
             logger.info(f"Ended run: {self.run_id} (Status: {status})")
             self.active_run = None
@@ -141,25 +266,166 @@ class MLflowManager:
         else:
             logger.warning("No active run to end.")
     
+    def log_batch(
+        self,
+        metrics: Optional[Dict[str, float]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        tags: Optional[Dict[str, Any]] = None,
+        step: Optional[int] = None,
+        run_id: Optional[str] = None
+    ):
+        """
+        Log metrics, parameters and tags to a run in one request.
+        
+        Args:
+            metrics: Metric names and values
+            params: Parameter names and values (stringified)
+            tags: Tag names and values (stringified)
+            step: Step recorded with the metrics (default: 0)
+            run_id: Run to log to (default: the run started by start_run())
+        """
+        if run_id is None:
+            if self.active_run is None:
+                raise RuntimeError("No active run. Call start_run() first.")
+            run_id = self.run_id
+        
+        timestamp = int(time.time() * 1000)
+        batch = (
+            run_id,
+            [Metric(key, float(value), timestamp, step or 0) for key, value in (metrics or {}).items()],
+            # Most values are already strings; skip the str() call for those
+            [Param(key, value if type(value) is str else str(value)) for key, value in (params or {}).items()],
+            [RunTag(key, value if type(value) is str else str(value)) for key, value in (tags or {}).items()]
+        )
+        
+        if self._log_queue is not None:
+            self._log_queue.put(batch)
+        else:
+            self._send_batch(*batch)
+    
+    def submit(self, func: Callable, *args, **kwargs):
+        """
+        Run an MLflow call now, or queue it on the background logger.
+        
+        Queued calls run in order with queued log_batch calls, e.g. artifact
+        uploads; failures are counted and logged like failed batches.
+        
+        Args:
+            func: Callable to run, e.g. self.client.log_artifact
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        """
+        if self._log_queue is not None:
+            self._log_queue.put(functools.partial(func, *args, **kwargs))
+        else:
+            func(*args, **kwargs)
+    
+    def _send_batch(self, run_id: str, metrics: List[Any], params: List[Any], tags: List[Any]):
+        """Send a batch, split into as few requests as the server limits allow."""
+        log_batch_chunked(self.client, run_id, metrics, params, tags)
+    
+    def _drain_logs(self):
+        """Background logger loop: merge queued batches per run and send them until close()."""
+        log_queue = self._log_queue
+        stopping = False
+        while not stopping:
+            items = [log_queue.get()]
+            while len(items) < self.MAX_QUEUED_BATCHES and items[-1] is not None:
+                try:
+                    items.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # None is the stop sentinel put by close(), queued after every batch
+            if items[-1] is None:
+                stopping = True
+                log_queue.task_done()
+                items.pop()
+            
+            # run_id -> (metrics, params by key, tags by key); a batch may not
+            # repeat a param key, and the last tag value wins anyway
+            merged: Dict[str, Tuple[List[Any], Dict[str, Any], Dict[str, Any]]] = {}
+            for item in items:
+                if callable(item):
+                    # Calls from submit() run after the batches queued before them
+                    self._send_merged(merged)
+                    merged = {}
+                    try:
+                        item()
+                    except Exception as e:
+                        self._log_failures += 1
+                        logger.error(f"Background MLflow call {item.func.__name__} failed: {e}")
+                    continue
+                
+                run_id, metrics, params, tags = item
+                run_metrics, run_params, run_tags = merged.setdefault(run_id, ([], {}, {}))
+                run_metrics.extend(metrics)
+                run_params.update((param.key, param) for param in params)
+                run_tags.update((tag.key, tag) for tag in tags)
+            self._send_merged(merged)
+            
+            for _ in items:
+                log_queue.task_done()
+    
+    def _send_merged(self, merged: Dict[str, Tuple[List[Any], Dict[str, Any], Dict[str, Any]]]):
+        """Send merged batches from the background logger, one per run."""
+        for run_id, (metrics, params, tags) in merged.items():
+            try:
+                self._send_batch(run_id, metrics, list(params.values()), list(tags.values()))
+            except Exception as e:
+                self._log_failures += 1
+                logger.error(f"Background MLflow logging failed for run {run_id}: {e}")
+    
+    def flush(self) -> int:
+        """
+        Wait until queued background logging calls have been sent.
+        
+        Returns:
+            Number of requests that failed since the last flush (each is logged)
+        """
+        if self._log_queue is None:
+            return 0
+        
+        self._log_queue.join()
+        failures, self._log_failures = self._log_failures, 0
+        return failures
+    
+    def close(self) -> int:
+        """
+        Send queued background logging calls and stop the background logger.
+        
+        Later logging calls are sent synchronously. Safe to call more than once.
+        
+        Returns:
+            Number of requests that failed since the last flush (each is logged)
+        """
+        log_queue, log_thread = self._log_queue, self._log_thread
+        if log_queue is None:
+            return 0
+        
+        self._log_queue = None
+        self._log_thread = None
+        _async_managers.discard(self)
+        log_queue.put(None)
+        log_thread.join()
+        failures, self._log_failures = self._log_failures, 0
+        return failures
+    
     def log_params(self, params: Dict[str, Any]):
         """
         Log parameters to the active run.
         """
-        if self.active_run is None:
-            raise RuntimeError("No active run. Call start_run() first.")
-        
-        params_str = {k: str(v) for k, v in params.items()}
-        mlflow.log_params(params_str)
+        self.log_batch(params=params)
         logger.debug(f"Logged parameters: {list(params.keys())}")
     
-    def log_metrics(self, metrics: Dict[str, float]):
+    def log_metrics(self, metrics: Dict[str, float], step: Optional[int] = None):
         """
-        Log metrics to the active run.
-        """
-        if self.active_run is None:
-            raise RuntimeError("No active run. Call start_run() first.")
+        Log metrics to the active run in one batched call.
         
-        mlflow.log_metrics(metrics)
+        Pass step for per-epoch metrics instead of calling mlflow.log_metric
+        once per metric.
+        """
+        self.log_batch(metrics=metrics, step=step)
         logger.debug(f"Logged metrics: {list(metrics.keys())}")
     
     def get_experiment(self, experiment_name: Optional[str] = None) -> Dict[str, Any]:
@@ -167,17 +433,24 @@ class MLflowManager:
         Get experiment information.
         
         Args:
-            experiment_name: Name of experiment (None = current)
+            experiment_name: Name of experiment (None = the active run's
+                experiment, or the experiment set up last if no run is active)
         
         Returns:
             Dictionary with experiment information
+        
+        Raises:
+            ValueError: If the experiment is not found
         """
         if experiment_name:
             experiment = mlflow.get_experiment_by_name(experiment_name)
         else:
-            experiment = mlflow.get_experiment(mlflow.get_experiment_by_name(
-                mlflow.get_experiment(mlflow.active_run().info.experiment_id).name
-            ).experiment_id)
+            # One lookup by ID: the active run's experiment, else the one set up last
+            active_run = mlflow.active_run()
+            experiment_id = active_run.info.experiment_id if active_run else self.experiment_id
+            if experiment_id is None:
+                raise ValueError("No active run or experiment set up")
+            experiment = self.client.get_experiment(experiment_id)
         
         if experiment is None:
             raise ValueError(f"Experiment not found: {experiment_name}")
@@ -197,16 +470,36 @@ class MLflowManager:
         Returns:
             List of experiment dictionaries
         """
-        experiments = self.client.search_experiments()
-        return [
-            {
-                'experiment_id': exp.experiment_id,
-                'name': exp.name,
-                'artifact_location': exp.artifact_location,
-                'lifecycle_stage': exp.lifecycle_stage
-            }
-            for exp in experiments
-        ]
+        return list(self.iter_experiments())
+    
+    def iter_experiments(self, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all experiments, one page at a time.
+        
+        Only one page of experiments is requested and held at a time, so
+        callers that stop early never fetch the rest.
+        
+        Args:
+            page_size: Experiments requested per page
+        
+        Yields:
+            Experiment dictionaries
+        """
+        page_token = None
+        
+        while True:
+            page = self.client.search_experiments(max_results=page_size, page_token=page_token)
+            for exp in page:
+                yield {
+                    'experiment_id': exp.experiment_id,
+                    'name': exp.name,
+                    'artifact_location': exp.artifact_location,
+                    'lifecycle_stage': exp.lifecycle_stage
+                }
+            
+            page_token = getattr(page, 'token', None)
+            if not page_token:
+                return
     
     def delete_experiment(self, experiment_name: str):
         """
@@ -215,6 +508,7 @@ class MLflowManager:
         Args:
             experiment_name: Name of experiment to delete
         """
+        self._experiment_cache.pop(experiment_name, None)
         experiment = mlflow.get_experiment_by_name(experiment_name)
         if experiment:
             self.client.delete_experiment(experiment.experiment_id)
@@ -222,3 +516,31 @@ class MLflowManager:
         else:
             logger.warning(f"Experiment not found: {experiment_name}")
 
+
+_default_managers: Dict[Optional[str], MLflowManager] = {}
+_default_managers_lock = threading.Lock()
+
+
+def get_default_manager(tracking_uri: Optional[str] = None) -> MLflowManager:
+    """
+    Get a process-wide MLflowManager for tracking_uri, creating it on first use.
+    
+    Sharing one manager (and so one MlflowClient and its HTTP session)
+    keeps connections to a remote tracking server alive between callers,
+    e.g. ModelRegistry objects created per request.
+    
+    Args:
+        tracking_uri: MLflow tracking URI (None = default, as in MLflowManager)
+    
+    Returns:
+        Shared MLflowManager
+    """
+    with _default_managers_lock:
+        manager = _default_managers.get(tracking_uri)
+        if manager is None:
+            manager = MLflowManager(tracking_uri=tracking_uri)
+            _default_managers[tracking_uri] = manager
+        else:
+            # Another manager may have pointed the fluent API elsewhere since
+            mlflow.set_tracking_uri(manager.tracking_uri)
+    return manager
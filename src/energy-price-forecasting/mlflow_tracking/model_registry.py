@@ -8,22 +8,84 @@ Date: December 14, 2025
 Version: 1.0
 """
 
-from typing import Dict, Any, Optional, List
+import importlib.util
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 import logging
 
-try:
-    import mlflow
-    from mlflow.tracking import MlflowClient
-    MLFLOW_AVAILABLE = True
-except ImportError:
-    MLFLOW_AVAILABLE = False
-    mlflow = None
-    MlflowClient = None
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+# MLflow itself is imported on first use (see _load_mlflow)
+MLFLOW_AVAILABLE = importlib.util.find_spec('mlflow') is not None
+mlflow = None
+MlflowClient = None
+MlflowException = None
 
 from .mlflow_manager import MLflowManager
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses of MLflow errors worth retrying (server errors and throttling)
+TRANSIENT_HTTP_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _name_filter(name: str) -> str:
+    """
+    Build a search filter matching a registered model name exactly.
+    
+    Raises:
+        ValueError: If name contains both quote characters and cannot be quoted
+    """
+    if "'" not in name:
+        return f"name='{name}'"
+    if '"' not in name:
+        return f'name="{name}"'
+    raise ValueError(f"Model name cannot contain both quote characters: {name!r}")
+
+
+def _load_mlflow():
+    """Import MLflow into this module on first use."""
+    global mlflow, MlflowClient, MlflowException
+    if mlflow is None:
+        import mlflow
+    if MlflowClient is None:
+        from mlflow.tracking import MlflowClient
+    if MlflowException is None:
+        from mlflow.exceptions import MlflowException
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """
+    Check whether a registry request failed for a reason worth retrying.
+    
+    MLflow wraps dropped connections and timeouts in an MlflowException
+    with an internal (500) error code; not-found and invalid-argument
+    errors map to 4xx statuses and are raised straight away.
+    """
+    import requests
+    from mlflow.exceptions import MlflowException
+    
+    if isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    return isinstance(exc, MlflowException) and exc.get_http_status_code() in TRANSIENT_HTTP_STATUS_CODES
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.1, max=5),
+    retry=retry_if_exception(_is_transient_error),
+    reraise=True
+)
+def _call_with_retry(func, *args, **kwargs):
+    """
+    Issue one idempotent registry request, retrying transient failures.
+    
+    Uses exponential backoff (0.1s, 0.2s, ...) for at most 3 attempts, on
+    top of the HTTP-level retries MLflow's REST client already does.
+    """
+    return func(*args, **kwargs)
+
 
 class ModelRegistry:
     """
@@ -40,14 +102,23 @@ class ModelRegistry:
         >>> registry = ModelRegistry()
         >>> registry.register_model(run_id, 'energy_forecasting_model')
         >>> registry.transition_model('energy_forecasting_model', 'Production', version=1)
+        
+        Services creating registries repeatedly should share one manager:
+        
+        >>> registry = ModelRegistry(manager=get_default_manager())
     """
     
-    def __init__(self, tracking_uri: Optional[str] = None):
+    # Seconds get_model() reuses a looked-up latest version number
+    LATEST_VERSION_TTL = 60.0
+    
+    def __init__(self, tracking_uri: Optional[str] = None, manager: Optional[MLflowManager] = None):
         """
         Initialize ModelRegistry.
         
         Args:
-            tracking_uri: MLflow tracking URI
+            tracking_uri: MLflow tracking URI (ignored when manager is given)
+            manager: Existing MLflowManager to reuse, e.g. from
+                get_default_manager(); by default a new one is created
         
         Raises:
             ImportError: If MLflow is not installed
@@ -56,10 +127,14 @@ class ModelRegistry:
             raise ImportError(
                 "MLflow is required. Install it with: pip install mlflow"
             )
+        _load_mlflow()
         
-        self.manager = MLflowManager(tracking_uri=tracking_uri)
+        self.manager = manager if manager is not None else MLflowManager(tracking_uri=tracking_uri)
         self.client = self.manager.client
         
+        # Model name -> (latest version number, monotonic lookup time)
+        self._latest_version_cache: Dict[str, Tuple[str, float]] = {}
+        
         logger.info("ModelRegistry initialized")
     
     def register_model(
@@ -80,14 +155,9 @@ class ModelRegistry:
             Model version
         """
         try:
-            model_version = mlflow.register_model(model_uri, name)
-            
-            if tags:
-                self.client.set_model_version_tag(
-                    name,
-                    model_version.version,
-                    **tags
-                )
+            # Tags are created together with the version, in the same request
+            model_version = mlflow.register_model(model_uri, name, tags=tags)
+            self._latest_version_cache.pop(name, None)
             
             logger.info(f"Registered model: {name} (Version: {model_version.version})")
             return model_version.version
@@ -107,10 +177,37 @@ class ModelRegistry:
             List of model version dictionaries
         """
         try:
-            versions = self.client.search_model_versions(f"name='{name}'")
-            
-            return [
-                {
+            return list(self.iter_model_versions(name))
+        except MlflowException as e:
+            logger.error(f"Failed to get model versions: {e}")
+            return []
+    
+    def iter_model_versions(self, name: str, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the versions of a registered model, one page at a time.
+        
+        Only one page of versions is requested and held at a time, so
+        callers that stop early never fetch the rest.
+        
+        Args:
+            name: Name of the registered model
+            page_size: Versions requested per page
+        
+        Yields:
+            Model version dictionaries
+        """
+        filter_string = _name_filter(name)
+        page_token = None
+        
+        while True:
+            page = _call_with_retry(
+                self.client.search_model_versions,
+                filter_string,
+                max_results=page_size,
+                page_token=page_token
+            )
+            for v in page:
+                yield {
                     'version': v.version,
                     'stage': v.current_stage,
                     'run_id': v.run_id,
@@ -118,11 +215,10 @@ class ModelRegistry:
                     'status': v.status,
                     'tags': v.tags
                 }
-                for v in versions
-            ]
-        except Exception as e:
-            logger.error(f"Failed to get model versions: {e}")
-            return []
+            
+            page_token = getattr(page, 'token', None)
+            if not page_token:
+                return
     
     def get_latest_versions(
         self,
@@ -140,7 +236,7 @@ class ModelRegistry:
             List of latest model version dictionaries
         """
         try:
-            versions = self.client.get_latest_versions(name, stages=stages)
+            versions = _call_with_retry(self.client.get_latest_versions, name, stages=stages)
             
             return [
                 {
@@ -152,7 +248,7 @@ class ModelRegistry:
                 }
                 for v in versions
             ]
-        except Exception as e:
+        except MlflowException as e:
             logger.error(f"Failed to get latest versions: {e}")
             return []
     
@@ -172,13 +268,10 @@ class ModelRegistry:
         """
         try:
             if version is None:
-                # Get latest version
-                versions = self.get_latest_versions(name)
-                if not versions:
-                    raise ValueError(f"No versions found for model: {name}")
-                version = versions[0]['version']
+                version = self._latest_version_number(name)
             
-            self.client.transition_model_version_stage(
+            _call_with_retry(
+                self.client.transition_model_version_stage,
                 name=name,
                 version=str(version),
                 stage=stage
@@ -190,13 +283,47 @@ class ModelRegistry:
             logger.error(f"Failed to transition model: {e}")
             raise
     
+    def _latest_version_number(self, name: str) -> str:
+        """
+        Get the highest version number of a registered model in one query.
+        
+        Raises:
+            ValueError: If the model has no versions
+        """
+        versions = _call_with_retry(
+            self.client.search_model_versions,
+            _name_filter(name),
+            max_results=1,
+            order_by=['version_number DESC']
+        )
+        if not versions:
+            raise ValueError(f"No versions found for model: {name}")
+        return versions[0].version
+    
+    def _cached_latest_version_number(self, name: str) -> str:
+        """
+        Get the latest version number, reusing a lookup younger than LATEST_VERSION_TTL.
+        
+        Versions registered or deleted through this registry invalidate the
+        entry at once; ones registered elsewhere show up within the TTL.
+        """
+        now = time.monotonic()
+        cached = self._latest_version_cache.get(name)
+        if cached is not None and now - cached[1] < self.LATEST_VERSION_TTL:
+            return cached[0]
+        
+        version = self._latest_version_number(name)
+        self._latest_version_cache[name] = (version, now)
+        return version
+    
     def get_model(self, name: str, version: Optional[int] = None, stage: Optional[str] = None):
         """
         Get a registered model.
         
         Args:
             name: Name of the registered model
-            version: Model version (None = latest)
+            version: Model version (None = latest; the lookup is cached for
+                LATEST_VERSION_TTL seconds)
             stage: Model stage (None = any)
         
         Returns:
@@ -208,11 +335,7 @@ class ModelRegistry:
             elif stage is not None:
                 model_uri = f"models:/{name}/{stage}"
             else:
-                # Get latest version
-                versions = self.get_latest_versions(name)
-                if not versions:
-                    raise ValueError(f"No versions found for model: {name}")
-                model_uri = f"models:/{name}/{versions[0]['version']}"
+                model_uri = f"models:/{name}/{self._cached_latest_version_number(name)}"
             
             logger.info(f"Retrieved model: {model_uri}")
             return model_uri
@@ -231,6 +354,7 @@ class ModelRegistry:
         """
         try:
             self.client.delete_model_version(name, str(version))
+            self._latest_version_cache.pop(name, None)
             logger.info(f"Deleted model version: {name} v{version}")
         
         except Exception as e:
@@ -254,7 +378,7 @@ class ModelRegistry:
             value: Tag value
         """
         try:
-            self.client.set_model_version_tag(name, str(version), key, value)
+            _call_with_retry(self.client.set_model_version_tag, name, str(version), key, value)
             logger.debug(f"Set tag on {name} v{version}: {key} = {value}")
         
         except Exception as e:
@@ -273,10 +397,10 @@ class ModelRegistry:
             Dictionary with lineage information
         """
         try:
-            version_info = self.client.get_model_version(name, str(version))
+            version_info = _call_with_retry(self.client.get_model_version, name, str(version))
             
             # Get run information
-            run = self.client.get_run(version_info.run_id)
+            run = _call_with_retry(self.client.get_run, version_info.run_id)
             
             return {
                 'model_name': name,
@@ -291,9 +415,37 @@ class ModelRegistry:
                 'creation_timestamp': version_info.creation_timestamp
             }
         
-        except Exception as e:
+        except MlflowException as e:
             logger.error(f"Failed to get model lineage: {e}")
             return {}
+    
+    def get_model_lineages(
+        self,
+        name: str,
+        versions: List[int],
+        max_workers: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        Get lineage information for several versions of a model.
+        
+        Each lineage needs two dependent requests (model version, then its
+        run), so the versions are fetched concurrently in threads to overlap
+        the round-trips.
+        
+        Args:
+            name: Name of the registered model
+            versions: Model versions
+            max_workers: Maximum concurrent lineage lookups
+        
+        Returns:
+            Lineage dictionaries in the order of versions (empty on failure,
+            as in get_model_lineage())
+        """
+        if len(versions) <= 1:
+            return [self.get_model_lineage(name, version) for version in versions]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(versions))) as executor:
+            return list(executor.map(lambda version: self.get_model_lineage(name, version), versions))
 
 
 class ModelRegistryManager(ModelRegistry):
@@ -0,0 +1,215 @@
+"""
+Column Store for Logged Predictions.
+
+NumPy columns behind PredictionLogger and ABTestTracker: one row per
+prediction with its value, actual value, error, timestamp (integer
+nanoseconds) and model version / commodity codes, so filters and metrics
+use vectorized masks instead of Python loops over the records.
+
+Author: AI Assistant
+Date: December 15, 2025
+Version: 1.0
+"""
+
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def timestamp_ns(timestamp: datetime) -> int:
+    """
+    Exact nanoseconds since the epoch of a datetime.
+    
+    Naive datetimes are taken as they are (no time zone conversion); aware
+    ones are converted to UTC first, so they keep their order.
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // _ONE_MICROSECOND * 1000
+
+
+class PredictionColumns:
+    """
+    Growable column arrays of predictions, one row per prediction.
+    
+    Missing actuals and errors are NaN. Model versions and commodities are
+    stored as codes into the vocab dicts, so label filters compare integers
+    (labels never recorded get code -1, which matches no row). While rows
+    are appended in timestamp order, date ranges are row ranges found by
+    binary search.
+    
+    Attributes:
+        n_rows: Number of rows in use (the arrays are usually longer)
+        predictions: Predicted values (float64)
+        actuals: Actual values, NaN if missing (float64)
+        errors: Absolute errors, NaN if missing (float64)
+        timestamps_ns: Nanoseconds since the epoch (int64, see timestamp_ns)
+        model_version_codes: Codes into model_version_vocab
+        commodity_codes: Codes into commodity_vocab
+        model_version_vocab: Model version -> code
+        commodity_vocab: Commodity -> code
+        timestamps_sorted: Whether rows are in timestamp order
+    """
+    
+    # Column array attributes, in the order of their dtypes (see __init__)
+    COLUMNS = (
+        'predictions', 'actuals', 'errors', 'timestamps_ns', 'model_version_codes', 'commodity_codes'
+    )
+    
+    def __init__(self, code_dtype: type = np.int32):
+        """
+        Initialize empty columns.
+        
+        Args:
+            code_dtype: Integer dtype of the label codes (bounds the number
+                of distinct model versions and commodities)
+        """
+        self._dtypes = (np.float64, np.float64, np.float64, np.int64, code_dtype, code_dtype)
+        self.n_rows = 0
+        for name, dtype in zip(self.COLUMNS, self._dtypes):
+            setattr(self, name, np.empty(0, dtype=dtype))
+        self.model_version_vocab: Dict[str, int] = {}
+        self.commodity_vocab: Dict[str, int] = {}
+        self.timestamps_sorted = True
+    
+    def reserve(self, capacity: int):
+        """Grow the column arrays to hold at least capacity rows."""
+        if capacity <= len(self.predictions):
+            return
+        for name, dtype in zip(self.COLUMNS, self._dtypes):
+            column = np.empty(capacity, dtype=dtype)
+            column[:self.n_rows] = getattr(self, name)[:self.n_rows]
+            setattr(self, name, column)
+    
+    def append(
+        self,
+        prediction: float,
+        actual: Optional[float],
+        error: Optional[float],
+        timestamp: datetime,
+        model_version: str,
+        commodity: str
+    ) -> int:
+        """
+        Append a row; the arrays double their capacity when full.
+        
+        The timestamp is converted first, so a bad one raises before
+        anything is changed.
+        
+        Returns:
+            Index of the new row
+        """
+        row_timestamp_ns = timestamp_ns(timestamp)
+        if self.n_rows == len(self.predictions):
+            self.reserve(max(1024, 2 * self.n_rows))
+        
+        i = self.n_rows
+        self.predictions[i] = prediction
+        self.actuals[i] = np.nan if actual is None else actual
+        self.errors[i] = np.nan if error is None else error
+        if i and row_timestamp_ns < self.timestamps_ns[i - 1]:
+            self.timestamps_sorted = False
+        self.timestamps_ns[i] = row_timestamp_ns
+        self.model_version_codes[i] = self.model_version_vocab.setdefault(
+            model_version, len(self.model_version_vocab)
+        )
+        self.commodity_codes[i] = self.commodity_vocab.setdefault(commodity, len(self.commodity_vocab))
+        self.n_rows += 1
+        return i
+    
+    def append_many(
+        self,
+        predictions: List[float],
+        timestamps: List[datetime],
+        model_versions: List[str],
+        commodities: List[str]
+    ):
+        """Append rows without actual values in one step (timestamps are converted first)."""
+        rows_timestamp_ns = np.array([timestamp_ns(timestamp) for timestamp in timestamps], dtype=np.int64)
+        start = self.n_rows
+        end = start + len(rows_timestamp_ns)
+        if end > len(self.predictions):
+            self.reserve(max(1024, 2 * self.n_rows, end))
+        
+        self.predictions[start:end] = predictions
+        self.actuals[start:end] = np.nan
+        self.errors[start:end] = np.nan
+        if end > start and (
+            (start and rows_timestamp_ns[0] < self.timestamps_ns[start - 1])
+            or np.any(np.diff(rows_timestamp_ns) < 0)
+        ):
+            self.timestamps_sorted = False
+        self.timestamps_ns[start:end] = rows_timestamp_ns
+        model_version_vocab = self.model_version_vocab
+        self.model_version_codes[start:end] = [
+            model_version_vocab.setdefault(model_version, len(model_version_vocab))
+            for model_version in model_versions
+        ]
+        commodity_vocab = self.commodity_vocab
+        self.commodity_codes[start:end] = [
+            commodity_vocab.setdefault(commodity, len(commodity_vocab)) for commodity in commodities
+        ]
+        self.n_rows = end
+    
+    def set_actual(self, i: int, actual: float, error: float):
+        """Set the actual value and error of row i."""
+        self.actuals[i] = actual
+        self.errors[i] = error
+    
+    def time_range(self, start_date: Optional[datetime], end_date: Optional[datetime]) -> Tuple[int, int]:
+        """Rows lo:hi between start_date and end_date, found by binary search (rows must be in timestamp order)."""
+        rows_timestamp_ns = self.timestamps_ns[:self.n_rows]
+        lo, hi = 0, self.n_rows
+        if start_date:
+            lo = int(np.searchsorted(rows_timestamp_ns, timestamp_ns(start_date), side='left'))
+        if end_date:
+            hi = int(np.searchsorted(rows_timestamp_ns, timestamp_ns(end_date), side='right'))
+        return lo, max(lo, hi)
+    
+    def label_mask(
+        self,
+        model_version: Optional[str],
+        commodity: Optional[str],
+        lo: int,
+        hi: int,
+        with_actual_only: bool = False
+    ) -> np.ndarray:
+        """Mask of rows lo:hi with matching labels (and an actual value if with_actual_only)."""
+        mask = ~np.isnan(self.actuals[lo:hi]) if with_actual_only else np.ones(hi - lo, dtype=bool)
+        if model_version:
+            mask &= self.model_version_codes[lo:hi] == self.model_version_vocab.get(model_version, -1)
+        if commodity:
+            mask &= self.commodity_codes[lo:hi] == self.commodity_vocab.get(commodity, -1)
+        return mask
+    
+    def filter_rows(
+        self,
+        model_version: Optional[str],
+        commodity: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        with_actual_only: bool = False
+    ) -> Tuple[int, int, np.ndarray]:
+        """
+        Find the rows matching criteria.
+        
+        While rows are in timestamp order the date range is a contiguous
+        row range, so only the rows in it are masked.
+        
+        Returns:
+            Tuple of (lo, hi, mask), where mask selects among rows lo:hi
+        """
+        if self.timestamps_sorted:
+            lo, hi = self.time_range(start_date, end_date)
+            return lo, hi, self.label_mask(model_version, commodity, lo, hi, with_actual_only)
+        
+        lo, hi = 0, self.n_rows
+        mask = self.label_mask(model_version, commodity, lo, hi, with_actual_only)
+        if start_date:
+            mask &= self.timestamps_ns[:hi] >= timestamp_ns(start_date)
+        if end_date:
+            mask &= self.timestamps_ns[:hi] <= timestamp_ns(end_date)
+        return lo, hi, mask
@@ -0,0 +1,141 @@
+"""
+Single-Pass Kernels for Performance Monitoring.
+
+Loops behind PredictionLogger.get_window_stats(): the error sums of the
+selected rows of a window, and how many consecutive selected rows moved
+in the same direction as their actual values. Uses Numba-compiled loops
+when Numba is installed and NumPy implementations otherwise. The compiled
+kernels are cached on disk and warmed up at import.
+
+Author: AI Assistant
+Date: December 15, 2025
+Version: 1.0
+"""
+
+import numpy as np
+from typing import Tuple
+import logging
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Fast-math flags minus 'nnan'/'ninf': unselected rows hold NaN actuals and errors
+_FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+def _window_sums_loop(
+    predictions: np.ndarray,
+    actuals: np.ndarray,
+    errors: np.ndarray,
+    mask: np.ndarray
+) -> Tuple[int, float, float, float, int, float, float]:
+    """Accumulate the error sums of the masked rows in a single loop (compiled with Numba when available)."""
+    count = 0
+    sum_error = 0.0
+    sum_squared_error = 0.0
+    sum_abs_pct_error = 0.0
+    count_nonzero = 0
+    sum_prediction = 0.0
+    sum_actual = 0.0
+
+    for i in range(mask.shape[0]):
+        if not mask[i]:
+            continue
+        error = errors[i]
+        actual = actuals[i]
+        count += 1
+        sum_error += error
+        sum_squared_error += error * error
+        if actual != 0.0:
+            sum_abs_pct_error += abs(error / actual)
+            count_nonzero += 1
+        sum_prediction += predictions[i]
+        sum_actual += actual
+
+    return count, sum_error, sum_squared_error, sum_abs_pct_error, count_nonzero, sum_prediction, sum_actual
+
+
+def _window_sums_numpy(
+    predictions: np.ndarray,
+    actuals: np.ndarray,
+    errors: np.ndarray,
+    mask: np.ndarray
+) -> Tuple[int, float, float, float, int, float, float]:
+    """Accumulate the error sums of the masked rows with vectorized NumPy operations."""
+    errors = errors[mask]
+    actuals = actuals[mask]
+    nonzero = actuals != 0
+    return (
+        errors.shape[0],
+        float(errors.sum()),
+        float(np.dot(errors, errors)),
+        float(np.abs(errors[nonzero] / actuals[nonzero]).sum()),
+        int(np.count_nonzero(nonzero)),
+        float(predictions[mask].sum()),
+        float(actuals.sum()),
+    )
+
+
+def _direction_matches_loop(
+    predictions: np.ndarray,
+    actuals: np.ndarray,
+    mask: np.ndarray
+) -> Tuple[int, int]:
+    """Count consecutive masked rows whose prediction and actual both rose or both did not."""
+    matches = 0
+    pairs = 0
+    previous = -1
+
+    for i in range(mask.shape[0]):
+        if not mask[i]:
+            continue
+        if previous >= 0:
+            pairs += 1
+            if (predictions[i] > predictions[previous]) == (actuals[i] > actuals[previous]):
+                matches += 1
+        previous = i
+
+    return matches, pairs
+
+
+def _direction_matches_numpy(
+    predictions: np.ndarray,
+    actuals: np.ndarray,
+    mask: np.ndarray
+) -> Tuple[int, int]:
+    """Count same-direction consecutive masked rows with vectorized NumPy operations."""
+    predictions = predictions[mask]
+    actuals = actuals[mask]
+    same_direction = (np.diff(predictions) > 0) == (np.diff(actuals) > 0)
+    return int(np.count_nonzero(same_direction)), same_direction.shape[0]
+
+
+def _warmup():
+    """
+    Compile the Numba kernels now rather than inside the first metrics query.
+
+    With cache=True the machine code is written under __pycache__, so
+    after the first run this only loads it from disk.
+    """
+    values = np.zeros(2)
+    mask = np.ones(2, dtype=bool)
+    try:
+        window_sums(values, values, values, mask)
+        direction_matches(values, values, mask)
+    except Exception as e:
+        logger.warning(f"Numba warm-up failed, compiling on first use: {e}")
+
+
+if NUMBA_AVAILABLE:
+    window_sums = njit(cache=True, fastmath=_FASTMATH_FLAGS)(_window_sums_loop)
+    direction_matches = njit(cache=True)(_direction_matches_loop)
+    _warmup()
+else:
+    window_sums = _window_sums_numpy
+    direction_matches = _direction_matches_numpy
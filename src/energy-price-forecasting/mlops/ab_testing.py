@@ -9,15 +9,67 @@ Date: December 15, 2025
 Version: 1.0
 """
 
-import hashlib
+import atexit
 import logging
+import os
+import shutil
+import sys
+import threading
+import time
+import weakref
+import zlib
 from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from datetime import datetime
+from dataclasses import dataclass
 import json
+import math
+import numpy as np
+
+from ._columns import PredictionColumns, timestamp_ns
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+NS_PER_MINUTE = 60_000_000_000
+
+
+# Trackers with an open storage file, flushed when the interpreter exits
+_open_trackers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_trackers():
+    """Write out records still buffered by any tracker."""
+    for tracker in list(_open_trackers):
+        tracker.flush()
+
+
+def _json_default(value: Any) -> str:
+    """Serialize datetimes for json.dumps as ISO 8601, like orjson does."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dump_line(record: Dict[str, Any]) -> bytes:
+    """Serialize a storage record as one JSON Lines line (with orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY) + b'\n'
+    return (json.dumps(record, default=_json_default) + '\n').encode()
+
+
+def _load_line(line: bytes) -> Dict[str, Any]:
+    """Parse one JSON Lines line."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
 
 @dataclass
 class ABTestResult:
@@ -32,10 +84,27 @@ class ABTestResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
-        data = asdict(self)
+        data = self._to_record()
         data['timestamp'] = self.timestamp.isoformat()
         return data
     
+    def _to_record(self) -> Dict[str, Any]:
+        """
+        Convert to a flat dictionary, keeping the timestamp a datetime.
+        
+        Built directly rather than with dataclasses.asdict(), which deep-copies
+        every field; the storage serializer formats the datetime itself.
+        """
+        return {
+            'user_id': self.user_id,
+            'timestamp': self.timestamp,
+            'model_version': self.model_version,
+            'commodity': self.commodity,
+            'prediction': self.prediction,
+            'actual': self.actual,
+            'error': self.error
+        }
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ABTestResult':
         """Create from dictionary."""
@@ -49,6 +118,8 @@ class TrafficSplitter:
     Splits traffic between champion and challenger models.
     
     Uses deterministic hashing to ensure consistent routing for the same user.
+    The hash is CRC-32: bucketing needs a fast, well-spread hash rather than
+    a cryptographic one.
     """
     
     def __init__(self, split_ratio: float = 0.9):
@@ -62,6 +133,9 @@ class TrafficSplitter:
             raise ValueError("split_ratio must be between 0 and 1")
         
         self.split_ratio = split_ratio
+        
+        # Buckets 0-99 below the threshold go to the champion
+        self._threshold = int(split_ratio * 100)
         logger.info(f"TrafficSplitter initialized with split ratio: {split_ratio:.1%} champion")
     
     def select_model(self, user_id: str, seed: Optional[str] = None) -> str:
@@ -77,16 +151,12 @@ class TrafficSplitter:
         Returns:
             'champion' or 'challenger'
         """
-        # Create hash from user_id and optional seed
+        # Map hash of user_id and optional seed to 0-99 range
         hash_input = f"{user_id}_{seed}" if seed else user_id
-        hash_value = int(hashlib.md5(hash_input.encode()).hexdigest(), 16)
-        
-        # Map to 0-99 range
-        bucket = hash_value % 100
+        bucket = zlib.crc32(hash_input.encode()) % 100
         
         # Determine model based on split ratio
-        threshold = int(self.split_ratio * 100)
-        model = 'champion' if bucket < threshold else 'challenger'
+        model = 'champion' if bucket < self._threshold else 'challenger'
         
         logger.debug(f"User {user_id}: bucket={bucket}, model={model}")
         return model
@@ -101,11 +171,10 @@ class TrafficSplitter:
         Returns:
             Dictionary with counts for 'champion' and 'challenger'
         """
-        stats = {'champion': 0, 'challenger': 0}
-        for user_id in user_ids:
-            model = self.select_model(user_id)
-            stats[model] += 1
-        return stats
+        # Hash all IDs in one pass through C-level map/fromiter, then bucket them at once
+        hashes = np.fromiter(map(zlib.crc32, map(str.encode, user_ids)), dtype=np.uint32, count=len(user_ids))
+        champion_count = int(np.count_nonzero(hashes % 100 < self._threshold))
+        return {'champion': champion_count, 'challenger': len(user_ids) - champion_count}
 
 
 class ABTestTracker:
@@ -114,18 +183,67 @@ class ABTestTracker:
     
     Stores predictions and actual outcomes, then calculates performance
     metrics for comparison between champion and challenger models.
+    
+    Besides the ABTestResult records in self.results, the fields used by
+    get_metrics() are kept column-wise in NumPy arrays (a PredictionColumns,
+    shared with PredictionLogger; row i describes self.results[i]), so metrics are computed with vectorized reductions
+    instead of Python loops over the records. Timestamps are
+    kept as integer nanoseconds; while rows are in timestamp order, date
+    ranges are found by binary search. Rows are also indexed by (user_id,
+    minute), so update_actual() only compares the integer timestamps of
+    the few predictions recorded around the given one. Running sums per (model_version,
+    commodity) back get_metrics_fast().
+    
+    Results are persisted as JSON Lines: record_prediction() appends the
+    result and update_actual() appends an {"update": row, "actual": value}
+    line instead of rewriting the file. compact() folds the updates back
+    into the result lines; once enough updates pile up, update_actual()
+    starts a compaction in a background thread.
     """
     
+    # Update lines appended before the storage file is compacted (at least
+    # one per result, so compaction stays linear overall)
+    COMPACT_MIN_UPDATES = 1000
+    
+    # Rough size of one stored result line, used to presize the columns on load
+    STORED_RESULT_BYTES = 160
+    
+    # Distinct get_metrics() queries cached between two data changes
+    MAX_CACHED_METRICS = 256
+    
+    # Appended records are buffered and written out every FLUSH_EVERY records
+    # or FLUSH_INTERVAL seconds, whichever comes first
+    FLUSH_EVERY = 64
+    FLUSH_INTERVAL = 0.2
+    
     def __init__(self, storage_path: Optional[str] = None):
         """
         Initialize ABTestTracker.
         
         Args:
-            storage_path: Path to JSON file for storing results (optional)
+            storage_path: Path to JSON Lines file for storing results
+                (optional; a file in the older JSON array format is
+                converted when loaded)
         """
         self.storage_path = storage_path
         self.results: List[ABTestResult] = []
         
+        # get_metrics() results for the data as of _data_version; any
+        # recorded prediction or actual bumps the version
+        self._data_version = 0
+        self._metrics_cache: Dict[Tuple, Dict[str, Any]] = {}
+        self._metrics_cache_version = 0
+        self._reset_columns()
+        
+        # Append handle for storage_path, opened on first write
+        self._storage_file = None
+        # Guards the storage file against the background compaction thread
+        self._storage_lock = threading.RLock()
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._n_unflushed = 0
+        self._last_flush = time.monotonic()
+        self._n_update_lines = 0
+        
         # Load existing results if storage path provided
         if storage_path:
             self._load_results()
@@ -138,7 +256,8 @@ class ABTestTracker:
         model_version: str,
         commodity: str,
         prediction: float,
-        actual: Optional[float] = None
+        actual: Optional[float] = None,
+        timestamp: Optional[datetime] = None
     ):
         """
         Record a prediction result.
@@ -149,14 +268,20 @@ class ABTestTracker:
             commodity: Commodity symbol
             prediction: Model prediction
             actual: Actual value (if available)
+            timestamp: Time of the prediction (default: now); callers
+                recording a batch can read the clock once and pass it to each
         """
         error = None
         if actual is not None:
             error = abs(prediction - actual)
         
+        # Interned so every result shares one copy of each label
+        model_version = sys.intern(model_version)
+        commodity = sys.intern(commodity)
+        
         result = ABTestResult(
             user_id=user_id,
-            timestamp=datetime.now(),
+            timestamp=datetime.now() if timestamp is None else timestamp,
             model_version=model_version,
             commodity=commodity,
             prediction=prediction,
@@ -164,14 +289,74 @@ class ABTestTracker:
             error=error
         )
         
+        # Columns first: _append_row raises on a bad timestamp before changing anything
+        self._append_row(result)
         self.results.append(result)
         
         # Save if storage path provided
         if self.storage_path:
-            self._save_results()
+            self._append_record(result._to_record())
         
         logger.debug(f"Recorded {model_version} prediction for {user_id}: {prediction}")
     
+    def _reset_columns(self):
+        """Empty the column arrays, their vocabularies and the (user_id, minute) index."""
+        # Few distinct model versions and commodities: 16-bit label codes
+        self._columns = PredictionColumns(code_dtype=np.int16)
+        self._row_index: Dict[Tuple[str, int], List[Tuple[int, int]]] = {}
+        self._running_stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._data_version += 1
+    
+    def _append_row(self, result: ABTestResult):
+        """
+        Append a result to the column arrays and the index.
+        
+        A bad timestamp raises before anything is changed.
+        """
+        i = self._columns.append(
+            result.prediction, result.actual, result.error, result.timestamp,
+            result.model_version, result.commodity
+        )
+        row_ns = int(self._columns.timestamps_ns[i])
+        self._row_index.setdefault((result.user_id, row_ns // NS_PER_MINUTE), []).append((i, row_ns))
+        self._data_version += 1
+        
+        stats = self._running_stats.get((result.model_version, result.commodity))
+        if stats is None:
+            stats = self._running_stats[(result.model_version, result.commodity)] = {
+                'n_predictions': 0, 'n_with_actual': 0, 'sum_error': 0.0, 'sum_squared_error': 0.0,
+                'sum_abs_pct_error': 0.0, 'count_nonzero': 0, 'sum_prediction': 0.0, 'sum_actual': 0.0
+            }
+        stats['n_predictions'] += 1
+        if result.actual is not None:
+            self._add_to_running_stats(stats, result, 1)
+    
+    @staticmethod
+    def _add_to_running_stats(stats: Dict[str, float], result: ABTestResult, sign: int):
+        """Add (sign=1) or remove (sign=-1) a result with an actual value from running sums."""
+        error = abs(result.prediction - result.actual)
+        stats['n_with_actual'] += sign
+        stats['sum_error'] += sign * error
+        stats['sum_squared_error'] += sign * error * error
+        # Zero actuals are left out of MAPE, as in PredictionLogger
+        if result.actual:
+            stats['sum_abs_pct_error'] += sign * abs(error / result.actual)
+            stats['count_nonzero'] += sign
+        stats['sum_prediction'] += sign * result.prediction
+        stats['sum_actual'] += sign * result.actual
+    
+    def _set_actual(self, i: int, actual: float):
+        """Set the actual value (and error) of result row i."""
+        result = self.results[i]
+        stats = self._running_stats[(result.model_version, result.commodity)]
+        if result.actual is not None:
+            self._add_to_running_stats(stats, result, -1)
+        result.actual = actual
+        result.error = abs(result.prediction - actual)
+        self._columns.set_actual(i, actual, result.error)
+        self._data_version += 1
+        self._add_to_running_stats(stats, result, 1)
+    
     def update_actual(self, user_id: str, timestamp: datetime, actual: float):
         """
         Update actual value for a previously recorded prediction.
@@ -181,15 +366,26 @@ class ABTestTracker:
             timestamp: Timestamp of the original prediction
             actual: Actual value
         """
+        # Predictions within 1 minute fall in this minute or a neighbouring
+        # one; the earliest matching one is updated
+        target_ns = timestamp_ns(timestamp)
+        bucket = target_ns // NS_PER_MINUTE
+        candidates = sorted(
+            entry
+            for key in ((user_id, bucket - 1), (user_id, bucket), (user_id, bucket + 1))
+            for entry in self._row_index.get(key, ())
+        )
+        
         # Find matching result
-        for result in self.results:
-            if (result.user_id == user_id and 
-                abs((result.timestamp - timestamp).total_seconds()) < 60):  # Within 1 minute
-                result.actual = actual
-                result.error = abs(result.prediction - actual)
+        for i, row_ns in candidates:
+            if abs(row_ns - target_ns) < NS_PER_MINUTE:  # Within 1 minute
+                self._set_actual(i, actual)
                 
                 if self.storage_path:
-                    self._save_results()
+                    self._append_record({'update': i, 'actual': actual})
+                    self._n_update_lines += 1
+                    if self._n_update_lines >= max(self.COMPACT_MIN_UPDATES, len(self.results)):
+                        self._start_compaction()
                 
                 logger.debug(f"Updated actual value for {user_id}: {actual}")
                 return
@@ -213,57 +409,120 @@ class ABTestTracker:
             end_date: Filter by end date (None = no filter)
             
         Returns:
-            Dictionary with metrics
+            Dictionary with metrics (cached until a prediction or actual
+            value is recorded); zero actuals are left out of MAPE
+        """
+        if self._metrics_cache_version != self._data_version:
+            self._metrics_cache.clear()
+            self._metrics_cache_version = self._data_version
+        
+        key = (model_version, commodity, start_date, end_date)
+        metrics = self._metrics_cache.get(key)
+        if metrics is None:
+            metrics = self._compute_metrics(model_version, commodity, start_date, end_date)
+            if len(self._metrics_cache) >= self.MAX_CACHED_METRICS:
+                self._metrics_cache.clear()
+            self._metrics_cache[key] = metrics
+        
+        return dict(metrics)
+    
+    def get_metrics_fast(
+        self,
+        model_version: Optional[str] = None,
+        commodity: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        # Filter results
-        filtered = self.results
+        Calculate metrics from running sums, without scanning the results.
         
-        if model_version:
-            filtered = [r for r in filtered if r.model_version == model_version]
+        Cost does not grow with the number of results, which suits
+        dashboards polling the whole test. Unlike get_metrics(), there is
+        no date filter and no directional accuracy (it depends on the order
+        of the results).
         
-        if commodity:
-            filtered = [r for r in filtered if r.commodity == commodity]
+        Args:
+            model_version: Filter by 'champion' or 'challenger' (None = all)
+            commodity: Filter by commodity (None = all)
+            
+        Returns:
+            Dictionary with metrics
+        """
+        groups = [
+            stats
+            for (stats_model_version, stats_commodity), stats in self._running_stats.items()
+            if (not model_version or stats_model_version == model_version)
+            and (not commodity or stats_commodity == commodity)
+        ]
+        
+        def total(name: str) -> float:
+            # fsum keeps full precision when adding per-group sums of very
+            # different magnitudes (e.g. a large and a tiny commodity)
+            return math.fsum(stats[name] for stats in groups)
+        
+        n_predictions = sum(stats['n_predictions'] for stats in groups)
+        n_with_actual = sum(stats['n_with_actual'] for stats in groups)
+        count_nonzero = sum(stats['count_nonzero'] for stats in groups)
+        if n_with_actual == 0:
+            return {
+                'total_predictions': n_predictions,
+                'predictions_with_actual': 0,
+                'message': 'No results with actual values'
+            }
         
-        if start_date:
-            filtered = [r for r in filtered if r.timestamp >= start_date]
+        return {
+            'total_predictions': n_predictions,
+            'predictions_with_actual': n_with_actual,
+            'mae': total('sum_error') / n_with_actual,
+            'rmse': math.sqrt(max(total('sum_squared_error'), 0.0) / n_with_actual),
+            'mape': total('sum_abs_pct_error') / count_nonzero if count_nonzero else float('nan'),
+            'mean_prediction': total('sum_prediction') / n_with_actual,
+            'mean_actual': total('sum_actual') / n_with_actual,
+        }
+    
+    def _compute_metrics(
+        self,
+        model_version: Optional[str],
+        commodity: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """Calculate metrics for filtered results (see get_metrics)."""
+        columns = self._columns
+        lo, hi, mask = columns.filter_rows(model_version, commodity, start_date, end_date)
         
-        if end_date:
-            filtered = [r for r in filtered if r.timestamp <= end_date]
+        total_predictions = int(np.count_nonzero(mask))
         
         # Only include results with actual values
-        with_actual = [r for r in filtered if r.actual is not None]
+        mask &= ~np.isnan(columns.actuals[lo:hi])
+        n_with_actual = int(np.count_nonzero(mask))
         
-        if len(with_actual) == 0:
+        if n_with_actual == 0:
             return {
-                'total_predictions': len(filtered),
+                'total_predictions': total_predictions,
                 'predictions_with_actual': 0,
                 'message': 'No results with actual values'
             }
         
         # Calculate metrics
-        errors = [r.error for r in with_actual if r.error is not None]
-        predictions = [r.prediction for r in with_actual]
-        actuals = [r.actual for r in with_actual]
+        errors = columns.errors[lo:hi][mask]
+        predictions = columns.predictions[lo:hi][mask]
+        actuals = columns.actuals[lo:hi][mask]
         
+        # Zero actuals are left out of MAPE (NaN if all are zero)
+        nonzero = actuals != 0
         metrics = {
-            'total_predictions': len(filtered),
-            'predictions_with_actual': len(with_actual),
-            'mae': sum(errors) / len(errors) if errors else None,
-            'rmse': (sum(e**2 for e in errors) / len(errors))**0.5 if errors else None,
-            'mape': sum(abs(e / a) for e, a in zip(errors, actuals)) / len(actuals) if actuals else None,
-            'mean_prediction': sum(predictions) / len(predictions) if predictions else None,
-            'mean_actual': sum(actuals) / len(actuals) if actuals else None,
+            'total_predictions': total_predictions,
+            'predictions_with_actual': n_with_actual,
+            'mae': float(errors.mean()),
+            'rmse': float(np.sqrt(np.mean(errors ** 2))),
+            'mape': float(np.mean(np.abs(errors[nonzero] / actuals[nonzero]))) if nonzero.any() else float('nan'),
+            'mean_prediction': float(predictions.mean()),
+            'mean_actual': float(actuals.mean()),
         }
         
         # Calculate directional accuracy (if we have enough data)
-        if len(with_actual) > 1:
-            directional_correct = 0
-            for i in range(1, len(with_actual)):
-                pred_dir = predictions[i] > predictions[i-1]
-                actual_dir = actuals[i] > actuals[i-1]
-                if pred_dir == actual_dir:
-                    directional_correct += 1
-            metrics['directional_accuracy'] = directional_correct / (len(with_actual) - 1)
+        if n_with_actual > 1:
+            same_direction = (np.diff(predictions) > 0) == (np.diff(actuals) > 0)
+            metrics['directional_accuracy'] = float(same_direction.mean())
         
         return metrics
     
@@ -331,18 +590,141 @@ class ABTestTracker:
         
         return comparison
     
-    def _save_results(self):
-        """Save results to storage file."""
+    def compact(self):
+        """
+        Rewrite the storage file with one line per result.
+        
+        Folds appended update lines into the results. The file is replaced
+        atomically, so a crash leaves either the old or the new file.
+        """
         if not self.storage_path:
             return
         
+        self.wait_for_compaction()
+        self.close()
+        tmp_path = f"{self.storage_path}.tmp"
         try:
-            data = [r.to_dict() for r in self.results]
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Saved {len(self.results)} results to {self.storage_path}")
+            with open(tmp_path, 'wb') as f:
+                for result in self.results:
+                    f.write(_dump_line(result._to_record()))
+            os.replace(tmp_path, self.storage_path)
+            self._n_update_lines = 0
+            logger.debug(f"Compacted {len(self.results)} results in {self.storage_path}")
         except Exception as e:
-            logger.error(f"Failed to save results: {e}")
+            logger.error(f"Failed to compact results: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
+    def wait_for_compaction(self):
+        """Wait for a background compaction started by update_actual() to finish."""
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join()
+            self._compaction_thread = None
+    
+    def _start_compaction(self):
+        """
+        Compact the storage file in a background thread.
+        
+        The thread rewrites a snapshot of the current results (taken here:
+        the result list and a copy of the actual values), then appends
+        whatever was written to the file after the snapshot and swaps the
+        files under the storage lock. Row numbers in those later lines stay
+        valid, as the snapshot keeps the row order.
+        """
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        
+        n = self._columns.n_rows
+        with self._storage_lock:
+            self.flush()
+            try:
+                offset = os.path.getsize(self.storage_path)
+            except OSError as e:
+                logger.error(f"Failed to compact results: {e}")
+                return
+        self._n_update_lines = 0
+        
+        self._compaction_thread = threading.Thread(
+            target=self._write_compacted,
+            args=(self.results[:n], self._columns.actuals[:n].copy(), offset),
+            name='ab-test-compaction',
+            daemon=True
+        )
+        self._compaction_thread.start()
+    
+    def _write_compacted(self, results: List[ABTestResult], actuals: np.ndarray, offset: int):
+        """Write a compacted storage file from a snapshot (runs in the compaction thread)."""
+        tmp_path = f"{self.storage_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                for result, actual in zip(results, actuals.tolist()):
+                    record = result._to_record()
+                    if math.isnan(actual):
+                        record['actual'] = record['error'] = None
+                    else:
+                        record['actual'] = actual
+                        record['error'] = abs(result.prediction - actual)
+                    f.write(_dump_line(record))
+                
+                with self._storage_lock:
+                    self.close()
+                    with open(self.storage_path, 'rb') as log:
+                        log.seek(offset)
+                        shutil.copyfileobj(log, f)
+                    f.close()
+                    os.replace(tmp_path, self.storage_path)
+            logger.debug(f"Compacted {len(results)} results in {self.storage_path}")
+        except Exception as e:
+            logger.error(f"Failed to compact results: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
+    def flush(self):
+        """Write buffered records to the storage file."""
+        with self._storage_lock:
+            if self._storage_file is None:
+                return
+            
+            try:
+                self._storage_file.flush()
+            except Exception as e:
+                logger.error(f"Failed to save results: {e}")
+            self._n_unflushed = 0
+            self._last_flush = time.monotonic()
+    
+    def close(self):
+        """Flush and close the storage file (it is reopened on the next write)."""
+        with self._storage_lock:
+            if self._storage_file is not None:
+                self.flush()
+                self._storage_file.close()
+                self._storage_file = None
+                _open_trackers.discard(self)
+    
+    def _append_record(self, record: Dict[str, Any]):
+        """Append a result or update record to the storage file (buffered, see FLUSH_EVERY)."""
+        try:
+            with self._storage_lock:
+                if self._storage_file is None:
+                    self._storage_file = open(self.storage_path, 'ab', buffering=1 << 16)
+                    _open_trackers.add(self)
+                self._storage_file.write(_dump_line(record))
+        except Exception as e:
+            logger.error(f"Failed to save result: {e}")
+            return
+        
+        self._n_unflushed += 1
+        if (self._n_unflushed >= self.FLUSH_EVERY or
+                time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL):
+            self.flush()
+    
+    def _add_loaded_result(self, result: ABTestResult):
+        """Add a result read from the storage file."""
+        result.model_version = sys.intern(result.model_version)
+        result.commodity = sys.intern(result.commodity)
+        self._append_row(result)
+        self.results.append(result)
     
     def _load_results(self):
         """Load results from storage file."""
@@ -350,9 +732,40 @@ class ABTestTracker:
             return
         
         try:
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
-            self.results = [ABTestResult.from_dict(r) for r in data]
+            self.results = []
+            self._reset_columns()
+            needs_compaction = False
+            with open(self.storage_path, 'rb') as f:
+                is_json_array = f.read(64).lstrip().startswith(b'[')
+                f.seek(0)
+                
+                if is_json_array:
+                    # Older format: one JSON array, rewritten on every save
+                    for record in json.load(f):
+                        self._add_loaded_result(ABTestResult.from_dict(record))
+                    needs_compaction = True
+                else:
+                    # Results go straight into the columns, presized from the file size
+                    self._columns.reserve(os.fstat(f.fileno()).st_size // self.STORED_RESULT_BYTES + 1)
+                    for line_number, line in enumerate(f, start=1):
+                        if not line.strip():
+                            continue
+                        try:
+                            record = _load_line(line)
+                        except ValueError:
+                            # Most likely a write cut short by a crash
+                            logger.warning(f"Skipping unreadable line {line_number} in {self.storage_path}")
+                            needs_compaction = True
+                            continue
+                        
+                        if 'update' in record:
+                            self._set_actual(record['update'], record['actual'])
+                            self._n_update_lines += 1
+                        else:
+                            self._add_loaded_result(ABTestResult.from_dict(record))
+            
+            if needs_compaction:
+                self.compact()
             logger.info(f"Loaded {len(self.results)} results from {self.storage_path}")
         except FileNotFoundError:
             logger.info(f"Storage file not found: {self.storage_path}. Starting with empty results.")
@@ -9,11 +9,18 @@ Date: December 15, 2025
 Version: 1.0
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import logging
+import os
 from pathlib import Path
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +58,9 @@ class ModelValidationThresholds:
         }
     }
     
+    # Thresholds parsed from files, keyed by (resolved path, mtime in ns)
+    _FILE_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize validation thresholds.
@@ -66,12 +76,25 @@ class ModelValidationThresholds:
         logger.info("ModelValidationThresholds initialized")
     
     def _load_from_file(self, config_path: str) -> Dict[str, Any]:
-        """Load thresholds from YAML file."""
+        """
+        Load thresholds from YAML file.
+        
+        Parsed files are cached per process; the cache entry is replaced
+        when the file's modification time changes.
+        """
         try:
+            key = (str(Path(config_path).resolve()), os.stat(config_path).st_mtime_ns)
+            cached = self._FILE_CACHE.get(key)
+            if cached is not None:
+                logger.debug(f"Using cached validation thresholds from {config_path}")
+                return cached.copy()
+            
             with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
+            thresholds = config.get('thresholds', self.DEFAULT_THRESHOLDS)
+            self._FILE_CACHE[key] = thresholds
             logger.info(f"Loaded validation thresholds from {config_path}")
-            return config.get('thresholds', self.DEFAULT_THRESHOLDS)
+            return thresholds.copy()
         except Exception as e:
             logger.warning(f"Failed to load thresholds from {config_path}: {e}. Using defaults.")
             return self.DEFAULT_THRESHOLDS
@@ -93,7 +116,7 @@ class ModelValidationThresholds:
         try:
             config = {'thresholds': self.thresholds}
             with open(config_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2)
+                yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
             logger.info(f"Saved validation thresholds to {config_path}")
         except Exception as e:
             logger.error(f"Failed to save thresholds to {config_path}: {e}")
@@ -112,22 +135,45 @@ class ModelValidator:
         Initialize ModelValidator.
         
         Args:
-            thresholds: ModelValidationThresholds instance (default: uses defaults)
+            thresholds: ModelValidationThresholds instance (default: uses defaults);
+                its values are read once, here
         """
         self.thresholds = thresholds or ModelValidationThresholds()
+        
+        # Threshold values used by the checks, with defaults for missing metrics
+        self._min_directional_accuracy = self._threshold_value('directional_accuracy', 'min', 0.70)
+        self._min_sharpe_ratio = self._threshold_value('sharpe_ratio', 'min', 1.0)
+        self._rmse_max_multiplier = self._threshold_value('rmse', 'max_multiplier', None)
+        self._mae_max_multiplier = self._threshold_value('mae', 'max_multiplier', None)
+        self._max_mape = self._threshold_value('mape', 'max', 0.20)
+        self._min_r2 = self._threshold_value('r2', 'min', 0.50)
+        
         logger.info("ModelValidator initialized")
     
+    def _threshold_value(self, metric_name: str, key: str, default: Optional[float]) -> Optional[float]:
+        """Get one value of a metric's threshold configuration, or default if not configured."""
+        threshold = self.thresholds.get_threshold(metric_name)
+        if not threshold:
+            return default
+        return threshold.get(key, default)
+    
     def validate(
         self,
         metrics: Dict[str, float],
-        baseline_metrics: Optional[Dict[str, float]] = None
+        baseline_metrics: Optional[Dict[str, float]] = None,
+        fail_fast: bool = False
     ) -> Dict[str, Any]:
         """
         Validate model metrics against thresholds.
         
+        Checks run in a fixed order: directional accuracy, Sharpe ratio,
+        MAPE, R², then RMSE and MAE.
+        
         Args:
             metrics: Dictionary of model metrics (e.g., {'rmse': 2.5, 'mae': 1.8})
             baseline_metrics: Optional baseline metrics for comparison
+            fail_fast: Stop at the first failed check (the remaining checks
+                are not run or reported), e.g. when screening many candidates
             
         Returns:
             Dictionary with validation results:
@@ -144,66 +190,33 @@ class ModelValidator:
         failed_checks = []
         passed_checks = []
         
-        # Check directional accuracy
-        if 'directional_accuracy' in metrics:
-            check_result = self._check_directional_accuracy(metrics['directional_accuracy'])
-            checks.append(check_result)
-            if check_result['passed']:
-                passed_checks.append('directional_accuracy')
-            else:
-                failed_checks.append('directional_accuracy')
-        
-        # Check Sharpe ratio
-        if 'sharpe_ratio' in metrics:
-            check_result = self._check_sharpe_ratio(metrics['sharpe_ratio'])
-            checks.append(check_result)
-            if check_result['passed']:
-                passed_checks.append('sharpe_ratio')
-            else:
-                failed_checks.append('sharpe_ratio')
-        
-        # Check RMSE (relative to baseline if provided)
-        if 'rmse' in metrics:
-            check_result = self._check_rmse(
-                metrics['rmse'],
-                baseline_metrics.get('rmse') if baseline_metrics else None
-            )
-            checks.append(check_result)
-            if check_result['passed']:
-                passed_checks.append('rmse')
-            else:
-                failed_checks.append('rmse')
-        
-        # Check MAE (relative to baseline if provided)
-        if 'mae' in metrics:
-            check_result = self._check_mae(
-                metrics['mae'],
-                baseline_metrics.get('mae') if baseline_metrics else None
-            )
-            checks.append(check_result)
-            if check_result['passed']:
-                passed_checks.append('mae')
-            else:
-                failed_checks.append('mae')
-        
-        # Check MAPE
-        if 'mape' in metrics:
-            check_result = self._check_mape(metrics['mape'])
-            checks.append(check_result)
-            if check_result['passed']:
-                passed_checks.append('mape')
-            else:
-                failed_checks.append('mape')
-        
-        # Check R²
+        # R² may be reported as 'r2' or 'r_squared'
         if 'r2' in metrics or 'r_squared' in metrics:
-            r2_value = metrics.get('r2') or metrics.get('r_squared')
-            check_result = self._check_r2(r2_value)
+            metrics = {**metrics, 'r2': metrics.get('r2') or metrics.get('r_squared')}
+        baseline_metrics = baseline_metrics or {}
+        
+        # (metric, check, extra check arguments), most often failed first;
+        # RMSE and MAE are checked relative to the baseline if provided
+        check_table = (
+            ('directional_accuracy', self._check_directional_accuracy, ()),
+            ('sharpe_ratio', self._check_sharpe_ratio, ()),
+            ('mape', self._check_mape, ()),
+            ('r2', self._check_r2, ()),
+            ('rmse', self._check_rmse, (baseline_metrics.get('rmse'),)),
+            ('mae', self._check_mae, (baseline_metrics.get('mae'),)),
+        )
+        
+        for metric_name, check, extra_args in check_table:
+            if fail_fast and failed_checks:
+                break
+            if metric_name not in metrics:
+                continue
+            check_result = check(metrics[metric_name], *extra_args)
             checks.append(check_result)
             if check_result['passed']:
-                passed_checks.append('r2')
+                passed_checks.append(metric_name)
             else:
-                failed_checks.append('r2')
+                failed_checks.append(metric_name)
         
         # Overall result
         passed = len(failed_checks) == 0
@@ -228,8 +241,7 @@ class ModelValidator:
     
     def _check_directional_accuracy(self, value: float) -> Dict[str, Any]:
         """Check directional accuracy threshold."""
-        threshold = self.thresholds.get_threshold('directional_accuracy')
-        min_value = threshold['min'] if threshold else 0.70
+        min_value = self._min_directional_accuracy
         
         passed = value >= min_value
         
@@ -243,8 +255,7 @@ class ModelValidator:
     
     def _check_sharpe_ratio(self, value: float) -> Dict[str, Any]:
         """Check Sharpe ratio threshold."""
-        threshold = self.thresholds.get_threshold('sharpe_ratio')
-        min_value = threshold['min'] if threshold else 1.0
+        min_value = self._min_sharpe_ratio
         
         passed = value >= min_value
         
@@ -258,10 +269,10 @@ class ModelValidator:
     
     def _check_rmse(self, value: float, baseline: Optional[float] = None) -> Dict[str, Any]:
         """Check RMSE threshold."""
-        threshold = self.thresholds.get_threshold('rmse')
+        multiplier = self._rmse_max_multiplier
         
-        if baseline is not None and threshold and 'max_multiplier' in threshold:
-            max_value = baseline * threshold['max_multiplier']
+        if baseline is not None and multiplier is not None:
+            max_value = baseline * multiplier
             passed = value <= max_value
             message = f"RMSE: {value:.2f} {'<=' if passed else '>'} {max_value:.2f} (baseline: {baseline:.2f})"
         else:
@@ -273,17 +284,17 @@ class ModelValidator:
             'metric': 'rmse',
             'value': value,
             'baseline': baseline,
-            'threshold': baseline * threshold['max_multiplier'] if baseline and threshold and 'max_multiplier' in threshold else None,
+            'threshold': baseline * multiplier if baseline and multiplier is not None else None,
             'passed': passed,
             'message': message
         }
     
     def _check_mae(self, value: float, baseline: Optional[float] = None) -> Dict[str, Any]:
         """Check MAE threshold."""
-        threshold = self.thresholds.get_threshold('mae')
+        multiplier = self._mae_max_multiplier
         
-        if baseline is not None and threshold and 'max_multiplier' in threshold:
-            max_value = baseline * threshold['max_multiplier']
+        if baseline is not None and multiplier is not None:
+            max_value = baseline * multiplier
             passed = value <= max_value
             message = f"MAE: {value:.2f} {'<=' if passed else '>'} {max_value:.2f} (baseline: {baseline:.2f})"
         else:
@@ -294,15 +305,14 @@ class ModelValidator:
             'metric': 'mae',
             'value': value,
             'baseline': baseline,
-            'threshold': baseline * threshold['max_multiplier'] if baseline and threshold and 'max_multiplier' in threshold else None,
+            'threshold': baseline * multiplier if baseline and multiplier is not None else None,
             'passed': passed,
             'message': message
         }
     
     def _check_mape(self, value: float) -> Dict[str, Any]:
         """Check MAPE threshold."""
-        threshold = self.thresholds.get_threshold('mape')
-        max_value = threshold['max'] if threshold else 0.20
+        max_value = self._max_mape
         
         passed = value <= max_value
         
@@ -316,8 +326,7 @@ class ModelValidator:
     
     def _check_r2(self, value: float) -> Dict[str, Any]:
         """Check R² threshold."""
-        threshold = self.thresholds.get_threshold('r2')
-        min_value = threshold['min'] if threshold else 0.50
+        min_value = self._min_r2
         
         passed = value >= min_value
         
@@ -343,17 +352,19 @@ class ModelValidator:
         summary += f"Passed: {len(passed_checks)}\n"
         summary += f"Failed: {len(failed_checks)}\n\n"
         
+        checks_by_metric = {c['metric']: c for c in checks}
+        
         if passed_checks:
             summary += "Passed Checks:\n"
             for check_name in passed_checks:
-                check = next((c for c in checks if c['metric'] == check_name), None)
+                check = checks_by_metric.get(check_name)
                 if check:
                     summary += f"  ✓ {check['message']}\n"
         
         if failed_checks:
             summary += "\nFailed Checks:\n"
             for check_name in failed_checks:
-                check = next((c for c in checks if c['metric'] == check_name), None)
+                check = checks_by_metric.get(check_name)
                 if check:
                     summary += f"  ✗ {check['message']}\n"
         
@@ -9,18 +9,29 @@ Version: 1.0
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+import math
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import pandas as pd
 import numpy as np
 
+from ._columns import PredictionColumns, timestamp_ns
+from ._kernels import direction_matches, window_sums
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _finite_values(data) -> np.ndarray:
+    """Contiguous float64 array of a Series' (or array's) values, without NaNs."""
+    values = np.ascontiguousarray(np.asarray(data, dtype=np.float64))
+    nan = np.isnan(values)
+    return values[~nan] if nan.any() else values
+
+
+@dataclass(slots=True)
 class PredictionRecord:
-    """Record of a prediction made by a model."""
+    """Record of a prediction made by a model (slotted: one is kept per logged prediction)."""
     id: Optional[int] = None
     timestamp: datetime = None
     model_version: str = None  # Model identifier
@@ -32,11 +43,23 @@ class PredictionRecord:
     model_type: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        data = asdict(self)
-        if self.timestamp:
-            data['timestamp'] = self.timestamp.isoformat()
-        return data
+        """
+        Convert to dictionary.
+        
+        Built directly rather than with dataclasses.asdict(), which deep-copies
+        every field.
+        """
+        return {
+            'id': self.id,
+            'timestamp': self.timestamp.isoformat() if self.timestamp else self.timestamp,
+            'model_version': self.model_version,
+            'commodity': self.commodity,
+            'horizon': self.horizon,
+            'prediction': self.prediction,
+            'actual': self.actual,
+            'error': self.error,
+            'model_type': self.model_type
+        }
 
 
 class PredictionLogger:
@@ -44,8 +67,24 @@ class PredictionLogger:
     Logs predictions and updates with actual values.
     
     Stores predictions in database for later analysis and monitoring.
+    
+    Predictions kept in memory are also stored column-wise in NumPy arrays
+    (a PredictionColumns, shared with ABTestTracker; row i describes
+    self._in_memory_storage[i]), so get_predictions() filters with
+    vectorized masks instead of Python loops over the records. While predictions are logged in
+    timestamp order, date ranges are found by binary search. Error sums of time windows are kept
+    between calls and updated incrementally (see get_window_stats).
     """
     
+    # Sums kept per time window, in this order (see get_window_stats)
+    _WINDOW_SUMS = (
+        'count', 'sum_error', 'sum_squared_error', 'sum_abs_pct_error',
+        'count_nonzero', 'sum_prediction', 'sum_actual'
+    )
+    
+    # Distinct (model_version, commodity, window length) sums kept between calls
+    MAX_SLIDING_WINDOWS = 64
+    
     def __init__(self, db_manager=None):
         """
         Initialize PredictionLogger.
@@ -55,6 +94,11 @@ class PredictionLogger:
         """
         self.db_manager = db_manager
         self._in_memory_storage: List[PredictionRecord] = []
+        self._columns = PredictionColumns()
+        
+        # (model_version, commodity, window length in ns) -> (first row,
+        # end row, _WINDOW_SUMS of the rows in between)
+        self._windows: Dict[Tuple[Optional[str], Optional[str], int], Tuple[int, int, np.ndarray]] = {}
         logger.info("PredictionLogger initialized")
     
     def log_prediction(
@@ -103,11 +147,88 @@ class PredictionLogger:
                 logger.warning(f"Failed to save to database: {e}. Using in-memory storage.")
         
         # Fallback to in-memory storage
+        # Columns first: a bad timestamp raises before anything is changed
+        self._append_row(record)
         record.id = len(self._in_memory_storage)
         self._in_memory_storage.append(record)
         logger.debug(f"Logged prediction to memory: ID={record.id}")
         return record.id
     
+    def log_predictions_batch(self, predictions: pd.DataFrame) -> np.ndarray:
+        """
+        Log many predictions at once, e.g. every commodity and horizon of a run.
+        
+        In memory the column arrays are grown once for the whole batch and
+        the predictions get consecutive IDs. With a database manager each
+        prediction is saved as in log_prediction().
+        
+        Args:
+            predictions: DataFrame with columns 'model_version', 'commodity',
+                'horizon' and 'prediction', and optionally 'model_type' and
+                'timestamp' (missing timestamps default to now)
+        
+        Returns:
+            Array of prediction IDs, in the order of the rows
+        
+        Raises:
+            ValueError: If DataFrame is missing required columns
+        """
+        required_cols = ['model_version', 'commodity', 'horizon', 'prediction']
+        missing_cols = [col for col in required_cols if col not in predictions.columns]
+        if missing_cols:
+            raise ValueError(f"Missing required columns: {missing_cols}")
+        
+        n = len(predictions)
+        now = datetime.now()
+        if 'timestamp' in predictions.columns:
+            timestamps = [
+                now if pd.isna(t) else (t.to_pydatetime() if isinstance(t, pd.Timestamp) else t)
+                for t in predictions['timestamp'].tolist()
+            ]
+        else:
+            timestamps = [now] * n
+        model_types = predictions['model_type'].tolist() if 'model_type' in predictions.columns else [None] * n
+        
+        rows = zip(
+            timestamps,
+            predictions['model_version'].tolist(),
+            predictions['commodity'].tolist(),
+            predictions['horizon'].tolist(),
+            predictions['prediction'].astype(np.float64).tolist(),
+            model_types
+        )
+        
+        if self.db_manager:
+            return np.array([
+                self.log_prediction(model_version, commodity, horizon, prediction, model_type, timestamp)
+                for timestamp, model_version, commodity, horizon, prediction, model_type in rows
+            ], dtype=np.int64)
+        
+        first_id = len(self._in_memory_storage)
+        records = [
+            PredictionRecord(
+                id=first_id + i,
+                timestamp=timestamp,
+                model_version=model_version,
+                commodity=commodity,
+                horizon=horizon,
+                prediction=prediction,
+                model_type=model_type
+            )
+            for i, (timestamp, model_version, commodity, horizon, prediction, model_type) in enumerate(rows)
+        ]
+        self._columns.append_many(
+            [record.prediction for record in records],
+            [record.timestamp for record in records],
+            [record.model_version for record in records],
+            [record.commodity for record in records]
+        )
+        if not self._columns.timestamps_sorted:
+            self._windows.clear()
+        self._in_memory_storage.extend(records)
+        logger.debug(f"Logged {n} predictions to memory: IDs={first_id}..{first_id + n - 1}")
+        return np.arange(first_id, first_id + n, dtype=np.int64)
+    
     def update_actual(
         self,
         prediction_id: int,
@@ -138,14 +259,50 @@ class PredictionLogger:
         # Fallback to in-memory storage
         if 0 <= prediction_id < len(self._in_memory_storage):
             record = self._in_memory_storage[prediction_id]
+            old_contribution = self._row_contribution(prediction_id)
             record.actual = actual
             record.error = abs(record.prediction - actual)
+            self._columns.set_actual(prediction_id, actual, record.error)
+            self._update_windows(prediction_id, old_contribution)
             logger.debug(f"Updated prediction {prediction_id} with actual: {actual}")
             return True
         
         logger.warning(f"Prediction ID {prediction_id} not found")
         return False
     
+    def _append_row(self, record: PredictionRecord):
+        """Append a record to the columns (kept window sums are dropped once rows are out of order)."""
+        self._columns.append(
+            record.prediction, record.actual, record.error, record.timestamp,
+            record.model_version, record.commodity
+        )
+        if not self._columns.timestamps_sorted:
+            self._windows.clear()
+    
+    def _row_contribution(self, i: int) -> np.ndarray:
+        """_WINDOW_SUMS contribution of row i (zeros without an actual value)."""
+        actual = self._columns.actuals[i]
+        if np.isnan(actual):
+            return np.zeros(len(self._WINDOW_SUMS))
+        error = self._columns.errors[i]
+        return np.array([
+            1.0, error, error * error, abs(error / actual) if actual else 0.0,
+            1.0 if actual else 0.0, self._columns.predictions[i], actual
+        ])
+    
+    def _update_windows(self, i: int, old_contribution: np.ndarray):
+        """Replace row i's old contribution in the kept window sums containing it."""
+        if not self._windows:
+            return
+        delta = self._row_contribution(i) - old_contribution
+        record = self._in_memory_storage[i]
+        model_version = record.model_version
+        commodity = record.commodity
+        for (window_model_version, window_commodity, _), (lo, hi, sums) in self._windows.items():
+            if (lo <= i < hi and window_model_version in (None, model_version)
+                    and window_commodity in (None, commodity)):
+                sums += delta
+    
     def _save_to_database(self, record: PredictionRecord) -> int:
         """Save prediction record to database."""
         # Placeholder - actual implementation would use database manager
@@ -190,24 +347,138 @@ class PredictionLogger:
         Returns:
             List of prediction records
         """
-        records = self._in_memory_storage.copy()
+        lo, hi, mask = self._columns.filter_rows(model_version, commodity, start_date, end_date, with_actual_only)
+        records = self._in_memory_storage
+        if mask.all():
+            # Contiguous match (e.g. only a date range): slice, no index list
+            return records[lo:hi]
+        return [records[i] for i in (np.flatnonzero(mask) + lo).tolist()]
+    
+    def get_arrays(
+        self,
+        model_version: Optional[str] = None,
+        commodity: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        with_actual_only: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get predictions matching criteria as arrays, without building records.
         
-        if model_version:
-            records = [r for r in records if r.model_version == model_version]
+        Takes the same filters as get_predictions().
+        
+        Returns:
+            Tuple of (predictions, actuals, errors) float64 arrays in logging
+            order, with NaN for missing actuals and errors
+        """
+        columns = self._columns
+        lo, hi, mask = columns.filter_rows(model_version, commodity, start_date, end_date, with_actual_only)
+        return columns.predictions[lo:hi][mask], columns.actuals[lo:hi][mask], columns.errors[lo:hi][mask]
+    
+    def get_window_stats(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        model_version: Optional[str] = None,
+        commodity: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        Get error sums and directional accuracy of predictions with actual values in a time window.
         
-        if commodity:
-            records = [r for r in records if r.commodity == commodity]
+        While predictions are logged in timestamp order, the sums of each
+        (model_version, commodity, window length) are kept between calls.
+        When the window has slid forward, only the rows that entered or left
+        it are added or subtracted, and update_actual() adjusts the sums of
+        windows containing the updated row. Otherwise they are summed anew.
         
-        if start_date:
-            records = [r for r in records if r.timestamp >= start_date]
+        Args:
+            start_date: Window start (inclusive)
+            end_date: Window end (inclusive)
+            model_version: Filter by model version
+            commodity: Filter by commodity
+            
+        Returns:
+            Dictionary with the _WINDOW_SUMS ('count' and 'count_nonzero' as
+            ints; percentage errors only cover non-zero actuals), plus
+            'directional_accuracy' if the window has at least two predictions
+        """
+        return self.get_windows_stats([start_date], end_date, model_version, commodity)[0]
+    
+    def get_windows_stats(
+        self,
+        start_dates: List[datetime],
+        end_date: datetime,
+        model_version: Optional[str] = None,
+        commodity: Optional[str] = None
+    ) -> List[Dict[str, float]]:
+        """
+        Get the get_window_stats() of several windows ending at the same time.
         
-        if end_date:
-            records = [r for r in records if r.timestamp <= end_date]
+        The rows of the widest window are filtered once; each window uses
+        the part of that filter covering its own rows.
         
-        if with_actual_only:
-            records = [r for r in records if r.actual is not None]
+        Args:
+            start_dates: Window starts (inclusive)
+            end_date: End of every window (inclusive)
+            model_version: Filter by model version
+            commodity: Filter by commodity
+            
+        Returns:
+            Window statistics in the order of start_dates
+        """
+        model_version = model_version or None
+        commodity = commodity or None
+        columns = self._columns
+        
+        if columns.timestamps_sorted:
+            ranges = [columns.time_range(start_date, end_date) for start_date in start_dates]
+            outer_lo = min((lo for lo, _ in ranges), default=0)
+            outer_hi = max((hi for _, hi in ranges), default=0)
+            outer_mask = columns.label_mask(model_version, commodity, outer_lo, outer_hi, True)
+        
+        all_stats = []
+        for i, start_date in enumerate(start_dates):
+            if columns.timestamps_sorted:
+                lo, hi = ranges[i]
+                mask = outer_mask[lo - outer_lo:hi - outer_lo]
+                
+                key = (model_version, commodity, timestamp_ns(end_date) - timestamp_ns(start_date))
+                window = self._windows.get(key)
+                if window is not None and window[0] <= lo <= window[1] <= hi:
+                    old_lo, old_hi, old_sums = window
+                    sums = (
+                        old_sums
+                        + self._range_sums(old_hi, hi, columns.label_mask(model_version, commodity, old_hi, hi, True))
+                        - self._range_sums(old_lo, lo, columns.label_mask(model_version, commodity, old_lo, lo, True))
+                    )
+                else:
+                    sums = self._range_sums(lo, hi, mask)
+                    if window is None and len(self._windows) >= self.MAX_SLIDING_WINDOWS:
+                        self._windows.clear()
+                self._windows[key] = (lo, hi, sums)
+            else:
+                lo, hi, mask = columns.filter_rows(model_version, commodity, start_date, end_date, True)
+                sums = self._range_sums(lo, hi, mask)
+            
+            stats = dict(zip(self._WINDOW_SUMS, sums.tolist()))
+            stats['count'] = int(round(stats['count']))
+            stats['count_nonzero'] = int(round(stats['count_nonzero']))
+            
+            if stats['count'] > 1:
+                matches, pairs = direction_matches(columns.predictions[lo:hi], columns.actuals[lo:hi], mask)
+                stats['directional_accuracy'] = matches / pairs
+            
+            all_stats.append(stats)
         
-        return records
+        return all_stats
+    
+    def _range_sums(self, lo: int, hi: int, mask: np.ndarray) -> np.ndarray:
+        """_WINDOW_SUMS of the masked rows lo:hi (all of which have actual values)."""
+        columns = self._columns
+        return np.array(
+            window_sums(columns.predictions[lo:hi], columns.actuals[lo:hi], columns.errors[lo:hi], mask),
+            dtype=np.float64
+        )
 
 
 class RollingMetricsCalculator:
@@ -226,7 +497,8 @@ class RollingMetricsCalculator:
             logger: PredictionLogger instance
         """
         self.logger = logger
-        logger.info("RollingMetricsCalculator initialized")
+        # The logger argument shadows the module logger here
+        logging.getLogger(__name__).info("RollingMetricsCalculator initialized")
     
     def calculate_rolling_metrics(
         self,
@@ -252,16 +524,26 @@ class RollingMetricsCalculator:
         
         start_date = end_date - timedelta(days=window_days)
         
-        # Get predictions with actuals
-        predictions = self.logger.get_predictions(
+        # Sums over predictions with actuals, kept up to date by the logger
+        stats = self.logger.get_window_stats(
+            start_date,
+            end_date,
             model_version=model_version,
-            commodity=commodity,
-            start_date=start_date,
-            end_date=end_date,
-            with_actual_only=True
+            commodity=commodity
         )
+        return self._metrics_from_stats(window_days, start_date, end_date, stats)
+    
+    @staticmethod
+    def _metrics_from_stats(
+        window_days: int,
+        start_date: datetime,
+        end_date: datetime,
+        stats: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Build the metrics of a window from PredictionLogger.get_window_stats()."""
+        sample_count = stats['count']
         
-        if len(predictions) == 0:
+        if sample_count == 0:
             return {
                 'window_days': window_days,
                 'start_date': start_date.isoformat(),
@@ -270,33 +552,22 @@ class RollingMetricsCalculator:
                 'message': 'No predictions with actual values in window'
             }
         
-        # Extract values
-        pred_values = [p.prediction for p in predictions]
-        actual_values = [p.actual for p in predictions]
-        errors = [p.error for p in predictions if p.error is not None]
-        
-        # Calculate metrics
+        # Calculate metrics (zero actuals are left out of MAPE; NaN if all are zero)
+        count_nonzero = stats['count_nonzero']
         metrics = {
             'window_days': window_days,
             'start_date': start_date.isoformat(),
             'end_date': end_date.isoformat(),
-            'sample_count': len(predictions),
-            'mae': np.mean(errors) if errors else None,
-            'rmse': np.sqrt(np.mean([e**2 for e in errors])) if errors else None,
-            'mape': np.mean([abs(e / a) for e, a in zip(errors, actual_values) if a != 0]) if actual_values else None,
-            'mean_prediction': np.mean(pred_values) if pred_values else None,
-            'mean_actual': np.mean(actual_values) if actual_values else None,
+            'sample_count': sample_count,
+            'mae': stats['sum_error'] / sample_count,
+            'rmse': math.sqrt(max(stats['sum_squared_error'], 0.0) / sample_count),
+            'mape': stats['sum_abs_pct_error'] / count_nonzero if count_nonzero else float('nan'),
+            'mean_prediction': stats['sum_prediction'] / sample_count,
+            'mean_actual': stats['sum_actual'] / sample_count,
         }
         
-        # Calculate directional accuracy
-        if len(predictions) > 1:
-            directional_correct = 0
-            for i in range(1, len(predictions)):
-                pred_dir = pred_values[i] > pred_values[i-1]
-                actual_dir = actual_values[i] > actual_values[i-1]
-                if pred_dir == actual_dir:
-                    directional_correct += 1
-            metrics['directional_accuracy'] = directional_correct / (len(predictions) - 1)
+        if 'directional_accuracy' in stats:
+            metrics['directional_accuracy'] = stats['directional_accuracy']
         
         return metrics
     
@@ -304,26 +575,38 @@ class RollingMetricsCalculator:
         self,
         windows: List[int] = [7, 30],
         model_version: Optional[str] = None,
-        commodity: Optional[str] = None
+        commodity: Optional[str] = None,
+        end_date: Optional[datetime] = None
     ) -> Dict[str, Dict[str, Any]]:
         """
         Calculate metrics for multiple rolling windows.
         
+        All windows end at the same time, and their predictions are
+        filtered in a single pass over the widest window.
+        
         Args:
             windows: List of window sizes in days
             model_version: Filter by model version
             commodity: Filter by commodity
+            end_date: End date for every window (default: now)
             
         Returns:
             Dictionary with metrics for each window
         """
+        if end_date is None:
+            end_date = datetime.now()
+        
+        start_dates = [end_date - timedelta(days=window) for window in windows]
+        all_stats = self.logger.get_windows_stats(
+            start_dates,
+            end_date,
+            model_version=model_version,
+            commodity=commodity
+        )
+        
         results = {}
-        for window in windows:
-            results[f'{window}_day'] = self.calculate_rolling_metrics(
-                window_days=window,
-                model_version=model_version,
-                commodity=commodity
-            )
+        for window, start_date, stats in zip(windows, start_dates, all_stats):
+            results[f'{window}_day'] = self._metrics_from_stats(window, start_date, end_date, stats)
         return results
 
 
@@ -344,7 +627,10 @@ class DriftDetector:
         """
         self.logger = logger
         self.baseline_metrics: Dict[str, Any] = {}
-        logger.info("DriftDetector initialized")
+        # Reused by every performance drift check
+        self._calculator = RollingMetricsCalculator(logger)
+        # The logger argument shadows the module logger here
+        logging.getLogger(__name__).info("DriftDetector initialized")
     
     def set_baseline(
         self,
@@ -394,8 +680,7 @@ class DriftDetector:
             }
         
         # Calculate recent metrics
-        calculator = RollingMetricsCalculator(self.logger)
-        recent_metrics = calculator.calculate_rolling_metrics(
+        recent_metrics = self._calculator.calculate_rolling_metrics(
             window_days=window_days,
             model_version=model_version,
             commodity=commodity
@@ -460,8 +745,8 @@ class DriftDetector:
         Detect data distribution drift using statistical tests.
         
         Args:
-            recent_data: Recent data distribution
-            baseline_data: Baseline (training) data distribution
+            recent_data: Recent data distribution (NaNs are ignored)
+            baseline_data: Baseline (training) data distribution (NaNs are ignored)
             test_type: Type of statistical test ('ks' or 'chi2')
             
         Returns:
@@ -478,8 +763,11 @@ class DriftDetector:
             }
         
         if test_type == 'ks':
-            # Kolmogorov-Smirnov test
-            statistic, p_value = stats.ks_2samp(baseline_data, recent_data)
+            # Kolmogorov-Smirnov test, on plain contiguous arrays so scipy
+            # does not copy again
+            baseline_values = _finite_values(baseline_data)
+            recent_values = _finite_values(recent_data)
+            statistic, p_value = stats.ks_2samp(baseline_values, recent_values)
             drift_detected = p_value < 0.05  # Significance level
             
             return {
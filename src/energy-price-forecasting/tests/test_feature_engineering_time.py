@@ -243,6 +243,19 @@ class TestDateFeatures:
         assert (df['quarter'] >= 1).all()
         assert (df['quarter'] <= 4).all()
 
+    def test_date_features_week_of_year_iso(self):
+        """Test week of year matches ISO 8601 across year boundaries."""
+        df = pd.DataFrame({
+            'date': pd.date_range('2019-12-20', '2027-01-10')
+        })
+
+        result = create_date_features(df)
+        expected = df['date'].dt.isocalendar().week.astype(int)
+
+        np.testing.assert_array_equal(result['week_of_year'], expected)
+        assert result.loc[df['date'] == '2021-01-01', 'week_of_year'].iloc[0] == 53
+        assert result.loc[df['date'] == '2024-12-30', 'week_of_year'].iloc[0] == 1
+
 
 class TestAddAllTimeFeatures:
     """Tests for add_all_time_features."""
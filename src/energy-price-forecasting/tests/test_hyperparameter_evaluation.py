@@ -0,0 +1,149 @@
+"""
+Unit tests for hyperparameter tuning trial evaluation.
+
+Tests calculate_score and the single-pass error accumulation.
+
+Author: AI Assistant
+Date: December 14, 2025
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from hyperparameter_tuning.evaluation import PredictionAdapter, calculate_score, results_to_dataframe
+    from hyperparameter_tuning import fast_metrics
+    EVALUATION_AVAILABLE = True
+except ImportError:
+    EVALUATION_AVAILABLE = False
+    pytest.skip("Hyperparameter tuning module not available", allow_module_level=True)
+
+
+@pytest.fixture
+def sample_arrays():
+    """Create true/predicted arrays with NaNs and a zero target."""
+    np.random.seed(42)
+    y_true = 100 + np.random.randn(50)
+    y_pred = y_true + np.random.randn(50) * 0.5
+    y_true[3] = np.nan
+    y_pred[7] = np.nan
+    y_true[10] = 0.0
+    return y_true, y_pred
+
+
+def reference_score(y_true, y_pred, metric):
+    """Straightforward NumPy implementation of each metric."""
+    mask = ~(np.isnan(y_true) | np.isnan(y_pred))
+    t, p = y_true[mask], y_pred[mask]
+    if metric == 'rmse':
+        return np.sqrt(np.mean((t - p) ** 2))
+    if metric == 'mae':
+        return np.mean(np.abs(t - p))
+    if metric == 'mape':
+        nz = t != 0
+        return np.mean(np.abs((t[nz] - p[nz]) / t[nz])) * 100
+    if metric == 'r2':
+        return 1 - np.sum((t - p) ** 2) / np.sum((t - t.mean()) ** 2)
+
+
+class TestCalculateScore:
+    """Tests for calculate_score."""
+
+    @pytest.mark.parametrize('metric', ['rmse', 'mae', 'mape', 'r2'])
+    def test_matches_reference(self, sample_arrays, metric):
+        """Test each metric against a direct NumPy computation."""
+        y_true, y_pred = sample_arrays
+
+        score = calculate_score(y_true, y_pred, metric)
+
+        assert score == pytest.approx(reference_score(y_true, y_pred, metric), rel=1e-9)
+
+    @pytest.mark.parametrize('metric', ['rmse', 'mae', 'mape', 'r2'])
+    def test_numpy_fallback_matches(self, sample_arrays, metric, monkeypatch):
+        """Test the NumPy accumulation path gives the same scores."""
+        y_true, y_pred = sample_arrays
+        expected = calculate_score(y_true, y_pred, metric)
+
+        monkeypatch.setattr(fast_metrics, '_error_sums', fast_metrics._error_sums_numpy)
+
+        assert calculate_score(y_true, y_pred, metric) == pytest.approx(expected, rel=1e-9)
+
+    @pytest.mark.parametrize('metric', ['rmse', 'mae', 'mape', 'r2'])
+    def test_skip_nan_validation_on_clean_data(self, metric):
+        """Test validate_nans=False gives the same scores on NaN-free data."""
+        np.random.seed(0)
+        y_true = 100 + np.random.randn(50)
+        y_pred = y_true + np.random.randn(50) * 0.5
+
+        expected = calculate_score(y_true, y_pred, metric)
+
+        assert calculate_score(y_true, y_pred, metric, validate_nans=False) == pytest.approx(expected, rel=1e-9)
+
+    def test_all_nan_returns_worst(self):
+        """Test that no valid pairs gives the worst possible score."""
+        y = np.array([np.nan, np.nan])
+
+        assert calculate_score(y, y, 'rmse', minimize=True) == float('inf')
+        assert calculate_score(y, y, 'r2', minimize=False) == float('-inf')
+
+    def test_r2_constant_target(self):
+        """Test R² on a constant target is -inf rather than a division artefact."""
+        y_true = np.full(10, 3.0)
+        y_pred = y_true + 0.1
+
+        assert calculate_score(y_true, y_pred, 'r2') == float('-inf')
+
+    def test_unknown_metric(self, sample_arrays):
+        """Test unknown metric raises ValueError."""
+        y_true, y_pred = sample_arrays
+
+        with pytest.raises(ValueError, match="Unknown scoring metric"):
+            calculate_score(y_true, y_pred, 'invalid')
+
+
+class TestPredictionAdapter:
+    """Tests for PredictionAdapter."""
+
+    def test_converts_each_format(self):
+        """Test each prediction format converts, including a change of type."""
+        adapter = PredictionAdapter()
+        expected = np.array([1.0, 2.0])
+
+        np.testing.assert_array_equal(adapter(expected.reshape(-1, 1)), expected)
+        np.testing.assert_array_equal(adapter(pd.DataFrame({'ds': [0, 1], 'yhat': expected})), expected)
+        np.testing.assert_array_equal(adapter(pd.DataFrame({'pred': expected})), expected)
+        np.testing.assert_array_equal(adapter((expected.reshape(-1, 1), None)), expected)
+
+
+class TestResultsToDataframe:
+    """Tests for results_to_dataframe."""
+
+    def test_keeps_columns_from_every_record(self):
+        """Test that a failed trial's error column survives conversion."""
+        records = [
+            {'params': {'a': 1}, 'score': 0.5, 'trial': 1},
+            {'params': {'a': 2}, 'score': None, 'error': 'boom', 'trial': 2},
+        ]
+
+        df = results_to_dataframe(records)
+
+        assert list(df.columns) == ['params', 'score', 'trial', 'error']
+        assert df['params'].iloc[1] == {'a': 2}
+        assert df['error'].iloc[1] == 'boom'
+        assert pd.isna(df['score'].iloc[1])
+
+    def test_mixed_types_fall_back(self):
+        """Test that records pyarrow cannot type still produce a DataFrame."""
+        df = results_to_dataframe([{'params': {'a': 1}}, {'params': {'a': 'x'}}])
+
+        assert df['params'].tolist() == [{'a': 1}, {'a': 'x'}]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -132,6 +132,50 @@ class TestGridSearchTunerSearch:
         assert tuner.best_score is not None
 
 
+    def test_search_parallel(self, sample_data, mock_model_factory):
+        """Test that parallel search evaluates every combination in order."""
+        tuner = GridSearchTuner(n_jobs=2)
+        
+        param_grid = {
+            'noise_factor': [0.1, 0.2],
+            'param2': [1, 2]
+        }
+        
+        train_data = sample_data[:70]
+        val_data = sample_data[70:]
+        
+        best_params, best_model = tuner.search(
+            mock_model_factory,
+            param_grid,
+            train_data,
+            val_data,
+            target_column='price',
+            verbose=0
+        )
+        
+        assert best_params is not None
+        assert best_model is not None
+        assert [r['trial'] for r in tuner.results] == [1, 2, 3, 4]
+    
+    @pytest.mark.parametrize('joblib_version', ['1.2.0', '1.3.2'])
+    def test_search_parallel_older_joblib(self, sample_data, mock_model_factory, monkeypatch, joblib_version):
+        """Test that parallel search still runs on joblib versions without return_as generators."""
+        from hyperparameter_tuning import parallel
+        monkeypatch.setattr(parallel.joblib, '__version__', joblib_version)
+        tuner = GridSearchTuner(n_jobs=2)
+        
+        tuner.search(
+            mock_model_factory,
+            {'noise_factor': [0.1, 0.2], 'param2': [1, 2]},
+            sample_data[:70],
+            sample_data[70:],
+            target_column='price',
+            verbose=0
+        )
+        
+        assert sorted(r['trial'] for r in tuner.results) == [1, 2, 3, 4]
+
+
 class TestGridSearchTunerResults:
     """Tests for GridSearchTuner results."""
     
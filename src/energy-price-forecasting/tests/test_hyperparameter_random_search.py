@@ -74,6 +74,16 @@ class TestRandomSearchTunerInitialization:
         tuner = RandomSearchTuner(n_iter=10, random_state=42)
         
         assert tuner.random_state == 42
+    
+    def test_init_leaves_global_random_state(self):
+        """Test that a seeded tuner does not reseed the global NumPy random state."""
+        np.random.seed(0)
+        expected = np.random.rand()
+        np.random.seed(0)
+        
+        RandomSearchTuner(n_iter=10, random_state=42)
+        
+        assert np.random.rand() == expected
 
 
 class TestRandomSearchTunerSearch:
@@ -108,7 +118,7 @@ class TestRandomSearchTunerSearch:
         """Test that n_iter trials are run."""
         tuner = RandomSearchTuner(n_iter=3, random_state=42)
         
-        param_distributions = {'noise_factor': [0.1, 0.2]}
+        param_distributions = {'noise_factor': [0.1, 0.2, 0.3, 0.4]}
         
         train_data = sample_data[:70]
         val_data = sample_data[70:]
@@ -123,6 +133,55 @@ class TestRandomSearchTunerSearch:
         )
         
         assert len(tuner.results) == 3
+    
+    def test_search_skips_duplicates(self, sample_data, mock_model_factory):
+        """Test that each combination is trained once and small spaces stop early."""
+        tuner = RandomSearchTuner(n_iter=10, random_state=42)
+        
+        param_distributions = {
+            'noise_factor': [0.1, 0.2],
+            'param2': [1, 2]
+        }
+        
+        tuner.search(
+            mock_model_factory,
+            param_distributions,
+            sample_data[:70],
+            sample_data[70:],
+            target_column='price',
+            verbose=0
+        )
+        
+        combinations = {tuple(sorted(r['params'].items())) for r in tuner.results}
+        assert len(tuner.results) == 4
+        assert len(combinations) == 4
+    
+    def test_search_results_path(self, sample_data, mock_model_factory, tmp_path):
+        """Test that results are streamed to a JSON Lines file."""
+        results_path = tmp_path / 'results.jsonl'
+        tuner = RandomSearchTuner(n_iter=4, random_state=42, results_path=str(results_path))
+        
+        param_distributions = {
+            'noise_factor': [0.1, 0.2, 0.3],
+            'param2': [1, 2, 3]
+        }
+        
+        tuner.search(
+            mock_model_factory,
+            param_distributions,
+            sample_data[:70],
+            sample_data[70:],
+            target_column='price',
+            verbose=0
+        )
+        
+        assert tuner.results == []
+        assert len(results_path.read_text().splitlines()) == 4
+        
+        results_df = tuner.get_results_dataframe()
+        assert len(results_df) == 4
+        assert 'params' in results_df.columns
+        assert 'score' in results_df.columns
 
 
 if __name__ == '__main__':
@@ -8,6 +8,7 @@ Date: December 14, 2025
 """
 
 import pytest
+import numpy as np
 import tempfile
 import os
 import yaml
@@ -53,6 +54,26 @@ class TestHyperparameterSearchSpaceInitialization:
             assert space.get_search_space('lstm')['lstm_units'] == [50, 64]
         finally:
             os.unlink(config_path)
+    
+    def test_init_with_file_uses_cache(self):
+        """Test the parsed file is cached in memory and the cache is invalidated on edit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = os.path.join(tmpdir, 'spaces.yaml')
+            with open(config_path, 'w') as f:
+                yaml.dump({'lstm': {'lstm_units': [50, 64]}}, f)
+            
+            first = HyperparameterSearchSpace(config_path=config_path)
+            first.search_spaces['lstm']['lstm_units'].append(128)
+            assert os.listdir(tmpdir) == ['spaces.yaml']
+            
+            cached = HyperparameterSearchSpace(config_path=config_path)
+            assert cached.get_search_space('lstm')['lstm_units'] == [50, 64]
+            
+            with open(config_path, 'w') as f:
+                yaml.dump({'lstm': {'lstm_units': [32, 64, 128]}}, f)
+            
+            edited = HyperparameterSearchSpace(config_path=config_path)
+            assert edited.get_search_space('lstm')['lstm_units'] == [32, 64, 128]
 
 
 class TestHyperparameterSearchSpaceGet:
@@ -82,6 +103,18 @@ class TestHyperparameterSearchSpaceGet:
         
         with pytest.raises(ValueError, match="Unknown model type"):
             space.get_search_space('unknown_model')
+    
+    def test_get_space_read_only(self):
+        """Test the returned space is a read-only view and the mutable copy is independent."""
+        space = HyperparameterSearchSpace()
+        
+        with pytest.raises(TypeError):
+            space.get_search_space('lstm')['lstm_units'] = [1]
+        
+        mutable = space.get_search_space_mutable('lstm')
+        mutable['lstm_units'].append(256)
+        
+        assert space.get_search_space('lstm')['lstm_units'] == [50, 64, 128]
 
 
 class TestHyperparameterSearchSpaceAdd:
@@ -113,10 +146,37 @@ class TestHyperparameterSearchSpaceSave:
             space.save(config_path)
             
             assert os.path.exists(config_path)
+            assert not os.path.exists(config_path + '.tmp')
             
             # Verify it can be loaded
             loaded_space = HyperparameterSearchSpace(config_path=config_path)
             assert 'lstm' in loaded_space.search_spaces
+    
+    def test_save_tuples_and_numpy_values(self, tmp_path):
+        """Test tuples and NumPy scalars are saved as plain YAML lists and numbers."""
+        space = HyperparameterSearchSpace()
+        space.add_search_space('custom', {
+            'units': list(np.arange(32, 97, 32)),
+            'dropout': list(np.linspace(0.1, 0.3, 3)),
+            'kernel': (3, 5),
+            'shapes': [(1, 2), (3, 4)],
+            'shuffle': [np.bool_(True), False],
+            'activation': [np.str_('relu'), 'tanh']
+        })
+        config_path = tmp_path / 'config.yaml'
+        
+        space.save(str(config_path))
+        
+        loaded = HyperparameterSearchSpace(config_path=str(config_path)).get_search_space('custom')
+        assert loaded['units'] == [32, 64, 96]
+        assert loaded['dropout'] == pytest.approx([0.1, 0.2, 0.3])
+        assert loaded['kernel'] == [3, 5]
+        assert loaded['shapes'] == [[1, 2], [3, 4]]
+        assert loaded['shuffle'] == [True, False]
+        assert loaded['activation'] == ['relu', 'tanh']
+        assert type(loaded['units'][0]) is int
+        # The in-memory space keeps its original values
+        assert space.get_search_space('custom')['kernel'] == (3, 5)
 
 
 if __name__ == '__main__':
@@ -75,6 +75,66 @@ class TestHyperparameterTunerInitialization:
         assert tuner.method == 'random'
         assert tuner.tuner.n_iter == 10
     
+    def test_init_bayesian_gp_sampler_unavailable(self, monkeypatch):
+        """Test that the 'gp' sampler fails clearly on optuna versions without GPSampler."""
+        optuna = pytest.importorskip('optuna')
+        monkeypatch.delattr(optuna.samplers, 'GPSampler', raising=False)
+
+        with pytest.raises(ValueError, match="requires optuna>=3.6"):
+            HyperparameterTuner(method='bayesian', n_trials=5, sampler='gp')
+
+    def test_init_bayesian_pruner(self):
+        """Test that the pruner is forwarded to the Bayesian optimizer."""
+        optuna = pytest.importorskip('optuna')
+        tuner = HyperparameterTuner(method='bayesian', n_trials=5, pruner='median')
+        
+        assert isinstance(tuner.tuner.study.pruner, optuna.pruners.MedianPruner)
+    
+    def test_init_bayesian_persists_long_study(self, tmp_path, monkeypatch, caplog):
+        """Test that long Bayesian searches default to a new SQLite study per run."""
+        pytest.importorskip('optuna')
+        monkeypatch.chdir(tmp_path)
+        caplog.set_level('INFO', logger='hyperparameter_tuning.tuner')
+        
+        first = HyperparameterTuner(method='bayesian', n_trials=100, study_name='lstm_sweep')
+        first.tuner.study.enqueue_trial({})
+        second = HyperparameterTuner(method='bayesian', n_trials=100, study_name='lstm_sweep')
+        
+        assert first.tuner.storage == second.tuner.storage == 'sqlite:///lstm_sweep.db'
+        assert (tmp_path / 'lstm_sweep.db').exists()
+        assert not second.tuner.load_if_exists
+        assert first.tuner.study_name.startswith('lstm_sweep_')
+        assert first.tuner.study_name != second.tuner.study_name
+        assert second.tuner.study.trials == []
+        assert f"resume with study_name='{first.tuner.study_name}'" in caplog.text
+    
+    def test_init_bayesian_in_memory(self, tmp_path, monkeypatch):
+        """Test that short searches, or storage=None, keep the study in memory."""
+        pytest.importorskip('optuna')
+        monkeypatch.chdir(tmp_path)
+        
+        short = HyperparameterTuner(method='bayesian', n_trials=50, study_name='lstm_sweep')
+        in_memory = HyperparameterTuner(method='bayesian', n_trials=100, study_name='lstm_sweep', storage=None)
+        
+        assert short.tuner.storage is None
+        assert in_memory.tuner.storage is None
+        assert in_memory.tuner.study_name == 'lstm_sweep'
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_init_bayesian_warns_on_resume(self, tmp_path, caplog):
+        """Test that loading a stored study with trials is logged as a warning."""
+        optuna = pytest.importorskip('optuna')
+        storage = f"sqlite:///{tmp_path / 'study.db'}"
+        study = optuna.create_study(study_name='lstm_sweep', storage=storage)
+        study.optimize(lambda trial: trial.suggest_float('x', 0, 1), n_trials=2)
+        
+        tuner = HyperparameterTuner(
+            method='bayesian', study_name='lstm_sweep', storage=storage, load_if_exists=True
+        )
+        
+        assert len(tuner.tuner.study.trials) == 2
+        assert "Resuming study 'lstm_sweep' with 2 existing trials" in caplog.text
+    
     def test_init_invalid_method(self):
         """Test initialization with invalid method."""
         with pytest.raises(ValueError, match="Unknown tuning method"):
@@ -134,6 +194,156 @@ class TestHyperparameterTunerTune:
         
         assert best_params is not None
         assert best_model is not None
+    
+    def test_tune_bayesian_early_stopping(self, sample_data, mock_model_factory):
+        """Test that Bayesian tuning stops once the best score plateaus."""
+        pytest.importorskip('optuna')
+        tuner = HyperparameterTuner(
+            method='bayesian', n_trials=100, random_state=42, early_stopping_rounds=5, storage=None
+        )
+        
+        tuner.tune(
+            mock_model_factory,
+            'lstm',
+            sample_data[:70],
+            sample_data[70:],
+            target_column='price',
+            param_space={'lstm_units': [50, 64, 128]},
+            verbose=0
+        )
+        
+        n_trials = len(tuner.tuner.study.trials)
+        assert n_trials < 100
+        assert n_trials - 1 - tuner.tuner.study.best_trial.number == 5
+
+    def test_tune_bayesian_skips_duplicate_trials(self, sample_data, mock_model_factory):
+        """Test that re-proposed configurations reuse the earlier score."""
+        pytest.importorskip('optuna')
+        trained = []
+        
+        def counting_factory(**params):
+            trained.append(params)
+            return mock_model_factory(**params)
+        
+        tuner = HyperparameterTuner(method='bayesian', n_trials=8, random_state=42)
+        tuner.tune(
+            counting_factory,
+            'lstm',
+            sample_data[:70],
+            sample_data[70:],
+            target_column='price',
+            param_space={'activation': ['relu', 'tanh']},
+            verbose=0
+        )
+        
+        trials = tuner.tuner.study.trials
+        duplicates = [t for t in trials if t.user_attrs.get('duplicate')]
+        assert len(trials) == 8
+        assert len(trained) == len(trials) - len(duplicates)
+        assert len(trained) <= 3  # two configurations, plus a possible refit of the best
+
+    def test_tune_bayesian_resumed_trials_not_reused(self, sample_data, mock_model_factory, tmp_path):
+        """Test that trials of a resumed study (scored on earlier data) are retrained."""
+        pytest.importorskip('optuna')
+        storage = f"sqlite:///{tmp_path / 'study.db'}"
+        trained = []
+
+        def counting_factory(**params):
+            trained.append(params)
+            return mock_model_factory(**params)
+
+        for _ in range(2):
+            trained.clear()
+            tuner = HyperparameterTuner(
+                method='bayesian', n_trials=2, random_state=42, study_name='resumed',
+                storage=storage, load_if_exists=True
+            )
+            tuner.tune(
+                counting_factory,
+                'lstm',
+                sample_data[:70],
+                sample_data[70:],
+                target_column='price',
+                param_space={'activation': ['relu']},
+                verbose=0
+            )
+
+        trials = tuner.tuner.study.trials
+        assert len(trials) == 4
+        assert not trials[2].user_attrs.get('duplicate')
+        assert trials[3].user_attrs.get('duplicate')
+        assert len(trained) == 1
+
+    def test_tune_bayesian_warm_start_with_failed_trials(self, sample_data, mock_model_factory):
+        """Test warm starting from random-search results that include a failed trial."""
+        pytest.importorskip('optuna')
+        
+        def flaky_factory(**params):
+            if params['lstm_units'] == 128:
+                raise ValueError("out of memory")
+            return mock_model_factory(**params)
+        
+        param_space = {'lstm_units': [50, 64, 128]}
+        random_tuner = HyperparameterTuner(method='random', n_iter=3, random_state=42)
+        random_tuner.tune(
+            flaky_factory,
+            'lstm',
+            sample_data[:70],
+            sample_data[70:],
+            target_column='price',
+            param_space=param_space,
+            verbose=0
+        )
+        results = random_tuner.get_results()
+        assert results['score'].isna().sum() == 1
+        
+        tuner = HyperparameterTuner(method='bayesian', n_trials=2, random_state=42)
+        tuner.tuner.optimize(
+            mock_model_factory,
+            HyperparameterTuner._to_optuna_space(param_space),
+            sample_data[:70],
+            sample_data[70:],
+            target_column='price',
+            verbose=0,
+            warm_start_from=results
+        )
+        
+        trials = tuner.tuner.study.trials
+        assert len(trials) == 4
+        assert sorted(t.params['lstm_units'] for t in trials[:2]) == [50, 64]
+    
+    def test_optuna_space_conversion(self):
+        """Test list-based spaces are classified as int, float or categorical."""
+        optuna_space = HyperparameterTuner._to_optuna_space({
+            'units': [32, 64],
+            'dropout': [0.1, 0.3],
+            'lr': [1, 0.5],
+            'activation': ['relu', 'tanh'],
+            'shuffle': [True, False]
+        })
+        
+        assert optuna_space['units'] == {'type': 'int', 'low': 32, 'high': 64}
+        assert optuna_space['dropout']['type'] == 'float'
+        assert (optuna_space['lr']['low'], optuna_space['lr']['high']) == (0.5, 1.0)
+        assert optuna_space['activation']['type'] == 'categorical'
+        assert optuna_space['shuffle']['type'] == 'categorical'
+    
+    def test_optuna_space_conversion_numpy_values(self):
+        """Test NumPy scalars (e.g. from np.linspace or np.arange) are classified as numbers."""
+        optuna_space = HyperparameterTuner._to_optuna_space({
+            'units': list(np.arange(32, 129, 32)),
+            'dropout': list(np.linspace(0.1, 0.5, 5)),
+            'mixed': [np.int64(1), 0.5],
+            'shuffle': [np.bool_(True), np.bool_(False)]
+        })
+        
+        assert optuna_space['units'] == {'type': 'int', 'low': 32, 'high': 128}
+        assert type(optuna_space['units']['low']) is int
+        assert optuna_space['dropout']['type'] == 'float'
+        assert optuna_space['dropout']['low'] == pytest.approx(0.1)
+        assert optuna_space['dropout']['high'] == pytest.approx(0.5)
+        assert optuna_space['mixed']['type'] == 'float'
+        assert optuna_space['shuffle']['type'] == 'categorical'
 
 
 if __name__ == '__main__':
@@ -96,7 +96,7 @@ class TestExperimentTrackerLogging:
         params = {'learning_rate': 0.001, 'batch_size': 32}
         tracker.log_params(params)
         
-        mock_mlflow.log_params.assert_called_once()
+        mock_manager.log_batch.assert_called_once_with(params=params, run_id=tracker.run_id)
     
     @patch('mlflow_tracking.experiment_tracker.MLflowManager')
     @patch('mlflow_tracking.experiment_tracker.mlflow')
@@ -110,9 +110,37 @@ class TestExperimentTrackerLogging:
         tracker.active_run = mock_run
         
         metrics = {'rmse': 2.5, 'mae': 1.8}
-        tracker.log_metrics(metrics)
+        tracker.log_metrics(metrics, step=3)
         
-        mock_mlflow.log_metrics.assert_called_once()
+        mock_manager.log_batch.assert_called_once_with(metrics=metrics, step=3, run_id=tracker.run_id)
+    
+    @patch('mlflow_tracking.mlflow_manager.mlflow')
+    @patch('mlflow_tracking.mlflow_manager.MlflowClient')
+    @patch('mlflow_tracking.experiment_tracker.mlflow')
+    def test_async_logging_flushed_on_end_run(self, mock_mlflow, mock_client, mock_manager_mlflow):
+        """Test background logging calls go through the manager's queue and complete before the run ends."""
+        mock_manager_mlflow.get_tracking_uri.return_value = 'file:./mlruns'
+        mock_manager_mlflow.get_experiment_by_name.return_value.experiment_id = 'exp_123'
+        
+        tracker = ExperimentTracker('test_experiment', async_logging=True)
+        tracker.active_run = MagicMock()
+        tracker.run_id = 'run_123'
+        thread = tracker.manager._log_thread
+        
+        tracker.log_params({'learning_rate': 0.001})
+        tracker.log_metrics({'rmse': 2.5})
+        tracker.set_tag('stage', 'tuning')
+        tracker.end_run()
+        
+        client = mock_client.return_value
+        sent = client.log_batch.call_args_list
+        assert [p.key for call in sent for p in call.kwargs['params']] == ['learning_rate']
+        assert [m.key for call in sent for m in call.kwargs['metrics']] == ['rmse']
+        client.set_tag.assert_called_once_with('run_123', 'stage', 'tuning')
+        mock_mlflow.end_run.assert_called_once()
+        
+        tracker.close()
+        assert not thread.is_alive()
     
     @patch('mlflow_tracking.experiment_tracker.MLflowManager')
     @patch('mlflow_tracking.experiment_tracker.mlflow')
@@ -127,6 +155,26 @@ class TestExperimentTrackerLogging:
             tracker.log_params({'param': 'value'})
 
 
+class TestExperimentTrackerSearch:
+    """Tests for ExperimentTracker run search."""
+    
+    @patch('mlflow_tracking.experiment_tracker.MLflowManager')
+    @patch('mlflow_tracking.experiment_tracker.mlflow')
+    def test_search_runs_uses_cached_experiment_id(self, mock_mlflow, mock_manager_class):
+        """Test that searches reuse the experiment ID instead of looking it up."""
+        mock_manager = Mock()
+        mock_manager.experiment_id = 'exp_123'
+        mock_manager_class.return_value = mock_manager
+        mock_mlflow.search_runs.return_value.to_dict.return_value = [{'run_id': 'run_1'}]
+        
+        tracker = ExperimentTracker('test_experiment')
+        
+        assert tracker.get_best_run('rmse') == {'run_id': 'run_1'}
+        assert tracker.get_best_run('rmse') == {'run_id': 'run_1'}
+        mock_mlflow.get_experiment_by_name.assert_not_called()
+        assert mock_mlflow.search_runs.call_args.kwargs['experiment_ids'] == ['exp_123']
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
 
@@ -16,7 +16,7 @@ from unittest.mock import Mock, patch, MagicMock
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
-    from mlflow_tracking.mlflow_manager import MLflowManager
+    from mlflow_tracking.mlflow_manager import MLflowManager, get_default_manager
     MANAGER_AVAILABLE = True
 except ImportError:
     MANAGER_AVAILABLE = False
@@ -75,6 +75,7 @@ class TestMLflowManagerSetupExperiment:
         experiment_id = manager.setup_experiment('new_experiment')
         
         assert experiment_id == 'exp_123'
+        assert manager.experiment_id == 'exp_123'
         mock_mlflow.create_experiment.assert_called_once()
     
     @patch('mlflow_tracking.mlflow_manager.mlflow')
@@ -91,6 +92,204 @@ class TestMLflowManagerSetupExperiment:
         
         assert experiment_id == 'exp_456'
         mock_mlflow.create_experiment.assert_not_called()
+    
+    @patch('mlflow_tracking.mlflow_manager.mlflow')
+    @patch('mlflow_tracking.mlflow_manager.MlflowClient')
+    def test_setup_experiment_cached(self, mock_client, mock_mlflow):
+        """Test repeated setup reuses the cached ID until the experiment is deleted."""
+        mock_experiment = Mock()
+        mock_experiment.experiment_id = 'exp_456'
+        mock_mlflow.get_tracking_uri.return_value = 'file:./mlruns'
+        mock_mlflow.get_experiment_by_name.return_value = mock_experiment
+        
+        manager = MLflowManager()
+        manager.setup_experiment('existing_experiment')
+        assert manager.setup_experiment('existing_experiment') == 'exp_456'
+        assert mock_mlflow.get_experiment_by_name.call_count == 1
+        mock_mlflow.set_experiment.assert_called_with(experiment_id='exp_456')
+        
+        manager.delete_experiment('existing_experiment')
+        manager.setup_experiment('existing_experiment')
+        assert mock_mlflow.get_experiment_by_name.call_count == 3
+
+
+
+class TestMLflowManagerGetExperiment:
+    """Tests for MLflowManager.get_experiment()."""
+    
+    @patch('mlflow_tracking.mlflow_manager.mlflow')
+    @patch('mlflow_tracking.mlflow_manager.MlflowClient')
+    def test_get_current_experiment(self, mock_client, mock_mlflow):
+        """Test the current experiment is fetched with a single lookup by ID."""
+        mock_mlflow.get_tracking_uri.return_value = 'file:./mlruns'
+        mock_mlflow.active_run.return_value = None
+        mock_experiment = Mock()
+        mock_experiment.experiment_id = 'exp_123'
+        mock_experiment.name = 'test_experiment'
+        mock_client.return_value.get_experiment.return_value = mock_experiment
+        
+        manager = MLflowManager()
+        manager.experiment_id = 'exp_123'
+        info = manager.get_experiment()
+        
+        assert info['experiment_id'] == 'exp_123'
+        assert info['name'] == 'test_experiment'
+        mock_client.return_value.get_experiment.assert_called_once_with('exp_123')
+        mock_mlflow.get_experiment_by_name.assert_not_called()
+    
+    @patch('mlflow_tracking.mlflow_manager.mlflow')
+    @patch('mlflow_tracking.mlflow_manager.MlflowClient')
+    def test_list_experiments_paginates(self, mock_client, mock_mlflow):
+        """Test experiments past the first page are listed."""
+        mock_mlflow.get_tracking_uri.return_value = 'file:./mlruns'
+        first_page = MagicMock()
+        first_page.__iter__.return_value = iter([Mock(experiment_id='1')])
+        first_page.token = 'next'
+        second_page = MagicMock()
+        second_page.__iter__.return_value = iter([Mock(experiment_id='2')])
+        second_page.token = None
+        mock_client.return_value.search_experiments.side_effect = [first_page, second_page]
+        
+        manager = MLflowManager()
+        experiments = manager.list_experiments()
+        
+        assert [exp['experiment_id'] for exp in experiments] == ['1', '2']
+        calls = mock_client.return_value.search_experiments.call_args_list
+        assert calls[1].kwargs['page_token'] == 'next'
+
+
+
+class TestMLflowManagerLogging:
+    """Tests for MLflowManager logging helpers."""
+    
+    @patch('mlflow_tracking.mlflow_manager.mlflow')
+    @patch('mlflow_tracking.mlflow_manager.MlflowClient')
+    def test_log_batch_single_request(self, mock_client, mock_mlflow):
+        """Test metrics, params and tags are sent in one log_batch call."""
+        mock_mlflow.get_tracking_uri.return_value = 'file:./mlruns'
+        
+        manager = MLflowManager()
+        manager.active_run = Mock()
+        manager.run_id = 'run_123'
+        manager.log_batch(metrics={'rmse': 2.5}, params={'units': 64}, tags={'stage': 'dev'}, step=3)
+        
+        mock_client.return_value.log_batch.assert_called_once()
+        args, kwargs = mock_client.return_value.log_batch.call_args
+        assert args == ('run_123',)
+        assert [(m.key, m.value, m.step) for m in kwargs['metrics']] == [('rmse', 2.5, 3)]
+        assert [(p.key, p.value) for p in kwargs['params']] == [('units', '64')]
+        assert [(t.key, t.value) for t in kwargs['tags']] == [('stage', 'dev')]
+        mock_mlflow.log_params.assert_not_called()
+        mock_mlflow.log_metrics.assert_not_called()
+    
+    @patch('mlflow_tracking.mlflow_manager.mlflow')
+    @patch('mlflow_tracking.mlflow_manager.MlflowClient')
+    def test_log_batch_splits_oversized_batches(self, mock_client, mock_mlflow):
+        """Test batches over the server limits are split into several requests."""
+        mock_mlflow.get_tracking_uri.return_value = 'file:./mlruns'
+        
+        manager = MLflowManager()
+        manager.active_run = Mock()
+        manager.run_id = 'run_123'
+        manager.log_batch(
+            metrics={f'm{i}': float(i) for i in range(1500)},
+            params={f'p{i}': i for i in range(150)}
+        )
+        
+        calls = mock_client.return_value.log_batch.call_args_list
+        assert len(calls) == 2
+        for call in calls:
+            assert len(call.kwargs['params']) + len(call.kwargs['tags']) <= 100
+            assert len(call.kwargs['metrics']) + len(call.kwargs['params']) <= 1000
+        assert sum(len(call.kwargs['metrics']) for call in calls) == 1500
+        assert sum(len(call.kwargs['params']) for call in calls) == 150
+    
+    @patch('mlflow_tracking.mlflow_manager.mlflow')
+    @patch('mlflow_tracking.mlflow_manager.MlflowClient')
+    def test_async_logging_flushed_on_end_run(self, mock_client, mock_mlflow):
+        """Test queued metrics are all sent before the run ends."""
+        mock_mlflow.get_tracking_uri.return_value = 'file:./mlruns'
+        
+        manager = MLflowManager(async_logging=True)
+        manager.active_run = Mock()
+        manager.run_id = 'run_123'
+        for epoch in range(5):
+            manager.log_metrics({'loss': 1.0 / (epoch + 1)}, step=epoch)
+        manager.log_params({'units': 64})
+        manager.end_run()
+        
+        sent = mock_client.return_value.log_batch.call_args_list
+        assert sorted(m.step for call in sent for m in call.kwargs['metrics']) == [0, 1, 2, 3, 4]
+        assert [p.key for call in sent for p in call.kwargs['params']] == ['units']
+        mock_mlflow.end_run.assert_called_once()
+    
+    @patch('mlflow_tracking.mlflow_manager.mlflow')
+    @patch('mlflow_tracking.mlflow_manager.MlflowClient')
+    def test_async_logging_close(self, mock_client, mock_mlflow):
+        """Test close() sends queued calls, stops the thread and is registered for exit."""
+        from mlflow_tracking import mlflow_manager
+        mock_mlflow.get_tracking_uri.return_value = 'file:./mlruns'
+        
+        manager = MLflowManager(async_logging=True)
+        thread = manager._log_thread
+        assert manager in mlflow_manager._async_managers
+        manager.active_run = Mock()
+        manager.run_id = 'run_123'
+        for epoch in range(5):
+            manager.log_metrics({'loss': 1.0 / (epoch + 1)}, step=epoch)
+        
+        mlflow_manager._close_async_managers()
+        
+        sent = mock_client.return_value.log_batch.call_args_list
+        assert sorted(m.step for call in sent for m in call.kwargs['metrics']) == [0, 1, 2, 3, 4]
+        assert not thread.is_alive()
+        assert manager not in mlflow_manager._async_managers
+        assert manager.close() == 0
+        
+        # Sent synchronously once the background logger is stopped
+        n_sent = len(sent)
+        manager.log_metrics({'loss': 0.1}, step=5)
+        assert mock_client.return_value.log_batch.call_count == n_sent + 1
+    
+    @patch('mlflow_tracking.mlflow_manager.mlflow')
+    @patch('mlflow_tracking.mlflow_manager.MlflowClient')
+    def test_async_submit_ordered_with_batches(self, mock_client, mock_mlflow):
+        """Test submitted calls run after earlier batches and failures are counted."""
+        mock_mlflow.get_tracking_uri.return_value = 'file:./mlruns'
+        calls = []
+        client = mock_client.return_value
+        client.log_batch.side_effect = lambda run_id, **kwargs: calls.append('batch')
+        
+        def failing_upload():
+            calls.append('upload')
+            raise IOError("disk full")
+        
+        manager = MLflowManager(async_logging=True)
+        manager.log_batch(metrics={'loss': 0.5}, run_id='run_123')
+        manager.submit(failing_upload)
+        manager.log_batch(metrics={'loss': 0.4}, run_id='run_123')
+        
+        assert manager.flush() == 1
+        assert calls == ['batch', 'upload', 'batch']
+        manager.close()
+
+
+
+class TestGetDefaultManager:
+    """Tests for get_default_manager()."""
+    
+    @patch.dict('mlflow_tracking.mlflow_manager._default_managers', clear=True)
+    @patch('mlflow_tracking.mlflow_manager.mlflow')
+    @patch('mlflow_tracking.mlflow_manager.MlflowClient')
+    def test_manager_shared_per_tracking_uri(self, mock_client, mock_mlflow):
+        """Test one manager (and client) is built per tracking URI."""
+        mock_mlflow.get_tracking_uri.return_value = 'file:./mlruns'
+        
+        first = get_default_manager('file:./mlruns')
+        second = get_default_manager('file:./mlruns')
+        
+        assert first is second
+        assert mock_client.call_count == 1
 
 
 if __name__ == '__main__':
@@ -37,6 +37,17 @@ class TestModelRegistryInitialization:
         
         assert registry.manager is not None
         assert registry.client is not None
+    
+    @patch('mlflow_tracking.model_registry.MLflowManager')
+    def test_init_with_shared_manager(self, mock_manager_class):
+        """Test that a given manager is reused instead of building a new one."""
+        shared_manager = Mock()
+        
+        first = ModelRegistry(manager=shared_manager)
+        second = ModelRegistry(manager=shared_manager)
+        
+        mock_manager_class.assert_not_called()
+        assert first.client is second.client is shared_manager.client
 
 
 class TestModelRegistryOperations:
@@ -61,6 +72,21 @@ class TestModelRegistryOperations:
         assert version == '1'
         mock_mlflow.register_model.assert_called_once()
     
+    @patch('mlflow_tracking.model_registry.MLflowManager')
+    @patch('mlflow_tracking.model_registry.mlflow')
+    def test_register_model_with_tags(self, mock_mlflow, mock_manager_class):
+        """Test tags are sent with the registration instead of one call per tag."""
+        mock_manager = Mock()
+        mock_manager_class.return_value = mock_manager
+        mock_mlflow.register_model.return_value = Mock(version='2')
+        
+        registry = ModelRegistry()
+        tags = {'commodity': 'WTI', 'model_type': 'lstm'}
+        registry.register_model('runs:/run_123/model', 'test_model', tags=tags)
+        
+        mock_mlflow.register_model.assert_called_once_with('runs:/run_123/model', 'test_model', tags=tags)
+        mock_manager.client.set_model_version_tag.assert_not_called()
+    
     @patch('mlflow_tracking.model_registry.MLflowManager')
     def test_get_model_versions(self, mock_manager_class):
         """Test getting model versions."""
@@ -85,6 +111,31 @@ class TestModelRegistryOperations:
         assert len(versions) == 1
         assert versions[0]['version'] == '1'
     
+    @patch('mlflow_tracking.model_registry.MLflowManager')
+    def test_iter_model_versions_paginates(self, mock_manager_class):
+        """Test versions are fetched page by page with a quoted name filter."""
+        mock_manager = Mock()
+        mock_client = Mock()
+        
+        first_page = MagicMock()
+        first_page.__iter__.return_value = iter([Mock(version='2'), Mock(version='1')])
+        first_page.token = 'next'
+        second_page = MagicMock()
+        second_page.__iter__.return_value = iter([Mock(version='0')])
+        second_page.token = None
+        
+        mock_client.search_model_versions.side_effect = [first_page, second_page]
+        mock_manager.client = mock_client
+        mock_manager_class.return_value = mock_manager
+        
+        registry = ModelRegistry()
+        versions = list(registry.iter_model_versions("trader's_model", page_size=2))
+        
+        assert [v['version'] for v in versions] == ['2', '1', '0']
+        calls = mock_client.search_model_versions.call_args_list
+        assert calls[0].args == ('name="trader\'s_model"',)
+        assert calls[1].kwargs['page_token'] == 'next'
+    
     @patch('mlflow_tracking.model_registry.MLflowManager')
     def test_transition_model(self, mock_manager_class):
         """Test transitioning a model stage."""
@@ -99,6 +150,106 @@ class TestModelRegistryOperations:
         registry.transition_model('test_model', 'Production', version=1)
         
         mock_client.transition_model_version_stage.assert_called_once()
+    
+    @patch('mlflow_tracking.model_registry.MLflowManager')
+    def test_transition_latest_model(self, mock_manager_class):
+        """Test the latest version is found with one ordered, single-result query."""
+        mock_manager = Mock()
+        mock_client = Mock()
+        mock_client.search_model_versions.return_value = [Mock(version='7')]
+        mock_manager.client = mock_client
+        mock_manager_class.return_value = mock_manager
+        
+        registry = ModelRegistry()
+        registry.transition_model('test_model', 'Staging')
+        
+        mock_client.search_model_versions.assert_called_once_with(
+            "name='test_model'", max_results=1, order_by=['version_number DESC']
+        )
+        mock_client.get_latest_versions.assert_not_called()
+        assert mock_client.transition_model_version_stage.call_args.kwargs['version'] == '7'
+    
+    @patch('mlflow_tracking.model_registry.MLflowManager')
+    def test_get_latest_model_cached(self, mock_manager_class):
+        """Test the latest version lookup is reused until a version is registered."""
+        mock_manager = Mock()
+        mock_client = Mock()
+        mock_client.search_model_versions.return_value = [Mock(version='7')]
+        mock_manager.client = mock_client
+        mock_manager_class.return_value = mock_manager
+        
+        registry = ModelRegistry()
+        
+        assert registry.get_model('test_model') == 'models:/test_model/7'
+        assert registry.get_model('test_model') == 'models:/test_model/7'
+        assert mock_client.search_model_versions.call_count == 1
+        
+        registry.delete_model_version('test_model', 7)
+        mock_client.search_model_versions.return_value = [Mock(version='6')]
+        
+        assert registry.get_model('test_model') == 'models:/test_model/6'
+        assert mock_client.search_model_versions.call_count == 2
+
+    
+    @patch('mlflow_tracking.model_registry.MLflowManager')
+    def test_get_model_lineages(self, mock_manager_class):
+        """Test lineages for several versions are returned in order."""
+        mock_manager = Mock()
+        mock_client = Mock()
+        mock_client.get_model_version.side_effect = lambda name, version: Mock(
+            run_id=f'run_{version}', current_stage='None', creation_timestamp=0
+        )
+        mock_client.get_run.side_effect = lambda run_id: Mock(
+            info=Mock(run_name=run_id, experiment_id='exp_1'),
+            data=Mock(params={}, metrics={}, tags={})
+        )
+        mock_manager.client = mock_client
+        mock_manager_class.return_value = mock_manager
+        
+        registry = ModelRegistry()
+        lineages = registry.get_model_lineages('test_model', [1, 2, 3])
+        
+        assert [lineage['run_id'] for lineage in lineages] == ['run_1', 'run_2', 'run_3']
+        assert mock_client.get_run.call_count == 3
+    
+    @patch('mlflow_tracking.model_registry.MLflowManager')
+    def test_transition_model_retries_transient_error(self, mock_manager_class):
+        """Test a dropped connection is retried instead of failing the call."""
+        from mlflow.exceptions import MlflowException
+        
+        mock_manager = Mock()
+        mock_client = Mock()
+        mock_client.transition_model_version_stage.side_effect = [
+            MlflowException("API request failed with exception Connection aborted"),
+            Mock()
+        ]
+        mock_manager.client = mock_client
+        mock_manager_class.return_value = mock_manager
+        
+        registry = ModelRegistry()
+        registry.transition_model('test_model', 'Production', version=1)
+        
+        assert mock_client.transition_model_version_stage.call_count == 2
+    
+    @patch('mlflow_tracking.model_registry.MLflowManager')
+    def test_missing_model_not_retried(self, mock_manager_class):
+        """Test structural errors are raised without retrying."""
+        from mlflow.exceptions import MlflowException
+        from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+        
+        mock_manager = Mock()
+        mock_client = Mock()
+        mock_client.set_model_version_tag.side_effect = MlflowException(
+            "Registered Model with name=test_model not found", error_code=RESOURCE_DOES_NOT_EXIST
+        )
+        mock_manager.client = mock_client
+        mock_manager_class.return_value = mock_manager
+        
+        registry = ModelRegistry()
+        with pytest.raises(MlflowException):
+            registry.set_model_version_tag('test_model', 1, 'key', 'value')
+        
+        assert mock_client.set_model_version_tag.call_count == 1
 
 
 if __name__ == '__main__':
@@ -0,0 +1,408 @@
+"""
+Unit tests for the A/B testing framework.
+
+Tests ABTestTracker storage (JSON Lines persistence, legacy file
+conversion, compaction) and metrics.
+
+Author: AI Assistant
+Date: December 15, 2025
+"""
+
+import pytest
+import json
+import math
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from mlops.ab_testing import ABTestTracker, ABTestResult
+    AB_TESTING_AVAILABLE = True
+except ImportError:
+    AB_TESTING_AVAILABLE = False
+    pytest.skip("MLOps module not available", allow_module_level=True)
+
+
+BASE_TIME = datetime(2025, 1, 1, 9, 0)
+
+
+def reference_metrics(results, model_version=None, commodity=None, start_date=None, end_date=None):
+    """Compute get_metrics() with plain Python loops over the results."""
+    selected = [
+        r for r in results
+        if (not model_version or r.model_version == model_version)
+        and (not commodity or r.commodity == commodity)
+        and (not start_date or r.timestamp >= start_date)
+        and (not end_date or r.timestamp <= end_date)
+    ]
+    with_actual = [r for r in selected if r.actual is not None]
+    if not with_actual:
+        return {
+            'total_predictions': len(selected),
+            'predictions_with_actual': 0,
+            'message': 'No results with actual values'
+        }
+    
+    n = len(with_actual)
+    errors = [abs(r.prediction - r.actual) for r in with_actual]
+    # Zero actuals are left out of MAPE
+    pct_errors = [abs(e / r.actual) for e, r in zip(errors, with_actual) if r.actual]
+    metrics = {
+        'total_predictions': len(selected),
+        'predictions_with_actual': n,
+        'mae': sum(errors) / n,
+        'rmse': (sum(e * e for e in errors) / n) ** 0.5,
+        'mape': sum(pct_errors) / len(pct_errors) if pct_errors else float('nan'),
+        'mean_prediction': sum(r.prediction for r in with_actual) / n,
+        'mean_actual': sum(r.actual for r in with_actual) / n,
+    }
+    if n > 1:
+        same_direction = [
+            (cur.prediction > prev.prediction) == (cur.actual > prev.actual)
+            for prev, cur in zip(with_actual, with_actual[1:])
+        ]
+        metrics['directional_accuracy'] = sum(same_direction) / len(same_direction)
+    return metrics
+
+
+def assert_metrics_equal(metrics, expected):
+    """Compare metrics dictionaries, floats approximately."""
+    assert metrics.keys() == expected.keys()
+    for name, value in expected.items():
+        if isinstance(value, float):
+            assert metrics[name] == pytest.approx(value, rel=1e-9, nan_ok=True), name
+        else:
+            assert metrics[name] == value, name
+
+
+def record_results(tracker, n, seed=0, with_actual_every=2):
+    """Record n predictions (every with_actual_every-th with an actual value), one minute apart."""
+    rng = np.random.default_rng(seed)
+    for i in range(n):
+        prediction = float(rng.uniform(60, 90))
+        actual = float(rng.uniform(60, 90)) if i % with_actual_every == 0 else None
+        tracker.record_prediction(
+            f'user_{i}',
+            'champion' if i % 3 else 'challenger',
+            'WTI' if i % 4 else 'NG',
+            prediction,
+            actual=actual,
+            timestamp=BASE_TIME + timedelta(minutes=i)
+        )
+
+
+def stored_results(tracker):
+    """Results of a tracker as dictionaries, for comparison."""
+    return [result.to_dict() for result in tracker.results]
+
+
+class TestABTestTrackerStorage:
+    """Tests for ABTestTracker persistence."""
+    
+    def test_save_load_round_trip(self, tmp_path):
+        """Test that recorded results and updated actuals are reloaded."""
+        path = str(tmp_path / 'results.jsonl')
+        tracker = ABTestTracker(storage_path=path)
+        record_results(tracker, 20)
+        tracker.update_actual('user_1', BASE_TIME + timedelta(minutes=1), 75.0)
+        tracker.close()
+        
+        loaded = ABTestTracker(storage_path=path)
+        
+        assert stored_results(loaded) == stored_results(tracker)
+        assert loaded.results[1].actual == 75.0
+        assert_metrics_equal(loaded.get_metrics(), tracker.get_metrics())
+    
+    def test_update_written_as_appended_line(self, tmp_path):
+        """Test that update_actual appends an update line instead of rewriting the file."""
+        path = tmp_path / 'results.jsonl'
+        tracker = ABTestTracker(storage_path=str(path))
+        record_results(tracker, 3)
+        tracker.update_actual('user_1', BASE_TIME + timedelta(minutes=1), 70.0)
+        tracker.close()
+        
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        
+        assert len(lines) == 4
+        assert lines[-1] == {'update': 1, 'actual': 70.0}
+    
+    def test_legacy_json_array_converted(self, tmp_path):
+        """Test that a file in the older JSON array format is loaded and rewritten as JSON Lines."""
+        path = tmp_path / 'results.json'
+        results = [
+            ABTestResult('user_0', BASE_TIME, 'champion', 'WTI', 70.0, 72.0, 2.0),
+            ABTestResult('user_1', BASE_TIME + timedelta(minutes=1), 'challenger', 'WTI', 71.0),
+        ]
+        path.write_text(json.dumps([result.to_dict() for result in results]))
+        
+        tracker = ABTestTracker(storage_path=str(path))
+        
+        assert stored_results(tracker) == [result.to_dict() for result in results]
+        assert not path.read_text().lstrip().startswith('[')
+        assert len(path.read_text().splitlines()) == 2
+        assert stored_results(ABTestTracker(storage_path=str(path))) == stored_results(tracker)
+    
+    def test_unreadable_line_skipped(self, tmp_path):
+        """Test that a line cut short by a crash is skipped and compacted away."""
+        path = tmp_path / 'results.jsonl'
+        tracker = ABTestTracker(storage_path=str(path))
+        record_results(tracker, 3)
+        tracker.close()
+        with open(path, 'a') as f:
+            f.write('{"user_id": "user_3", "times')
+        
+        loaded = ABTestTracker(storage_path=str(path))
+        
+        assert stored_results(loaded) == stored_results(tracker)
+        assert len(path.read_text().splitlines()) == 3
+    
+    def test_update_actual_before_and_after_compaction(self, tmp_path):
+        """Test that updates are folded in by compact() and later updates still apply."""
+        path = tmp_path / 'results.jsonl'
+        tracker = ABTestTracker(storage_path=str(path))
+        record_results(tracker, 10)
+        tracker.update_actual('user_1', BASE_TIME + timedelta(minutes=1), 70.0)
+        
+        tracker.compact()
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(lines) == 10
+        assert lines[1]['actual'] == 70.0
+        
+        tracker.update_actual('user_3', BASE_TIME + timedelta(minutes=3), 80.0)
+        tracker.close()
+        
+        loaded = ABTestTracker(storage_path=str(path))
+        assert loaded.results[1].actual == 70.0
+        assert loaded.results[3].actual == 80.0
+        assert stored_results(loaded) == stored_results(tracker)
+    
+    def test_background_compaction_triggered(self, tmp_path):
+        """Test that enough update lines start a background compaction."""
+        path = tmp_path / 'results.jsonl'
+        tracker = ABTestTracker(storage_path=str(path))
+        tracker.COMPACT_MIN_UPDATES = 1
+        record_results(tracker, 4, with_actual_every=100)
+        
+        for i in range(4):
+            tracker.update_actual(f'user_{i}', BASE_TIME + timedelta(minutes=i), 70.0 + i)
+        tracker.wait_for_compaction()
+        tracker.close()
+        
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(lines) == 4
+        assert [line['actual'] for line in lines] == [70.0, 71.0, 72.0, 73.0]
+    
+    def test_appends_racing_compaction(self, tmp_path):
+        """Test that results and updates written during a background compaction are kept."""
+        path = tmp_path / 'results.jsonl'
+        tracker = ABTestTracker(storage_path=str(path))
+        record_results(tracker, 500, with_actual_every=100)
+        
+        for round_number in range(5):
+            tracker._start_compaction()
+            start = len(tracker.results)
+            for i in range(start, start + 200):
+                tracker.record_prediction(
+                    f'user_{i}', 'champion', 'WTI', 70.0, timestamp=BASE_TIME + timedelta(minutes=i)
+                )
+                updated = (i * 7 + round_number) % i
+                tracker.update_actual(
+                    f'user_{updated}', BASE_TIME + timedelta(minutes=updated), float(i)
+                )
+        tracker.wait_for_compaction()
+        tracker.close()
+        
+        loaded = ABTestTracker(storage_path=str(path))
+        
+        assert len(loaded.results) == 1500
+        assert stored_results(loaded) == stored_results(tracker)
+
+
+class TestABTestTrackerMetrics:
+    """Tests for ABTestTracker metrics."""
+    
+    @pytest.mark.parametrize('filters', [
+        {},
+        {'model_version': 'champion'},
+        {'model_version': 'challenger', 'commodity': 'WTI'},
+        {'commodity': 'NG', 'start_date': BASE_TIME + timedelta(minutes=30)},
+        {'start_date': BASE_TIME + timedelta(minutes=10), 'end_date': BASE_TIME + timedelta(minutes=90)},
+        {'model_version': 'unknown'},
+    ])
+    def test_get_metrics_matches_reference(self, filters):
+        """Test vectorized metrics against a plain Python implementation."""
+        tracker = ABTestTracker()
+        record_results(tracker, 200)
+        
+        assert_metrics_equal(tracker.get_metrics(**filters), reference_metrics(tracker.results, **filters))
+    
+    def test_get_metrics_out_of_order_timestamps(self):
+        """Test date filters when the clock stepped back between predictions."""
+        tracker = ABTestTracker()
+        rng = np.random.default_rng(1)
+        for i in range(100):
+            tracker.record_prediction(
+                f'user_{i}', 'champion', 'WTI', float(rng.uniform(60, 90)),
+                actual=float(rng.uniform(60, 90)),
+                timestamp=BASE_TIME + timedelta(minutes=int(rng.integers(0, 120)))
+            )
+        start_date = BASE_TIME + timedelta(minutes=20)
+        end_date = BASE_TIME + timedelta(minutes=80)
+        
+        assert not tracker._columns.timestamps_sorted
+        assert_metrics_equal(
+            tracker.get_metrics(start_date=start_date, end_date=end_date),
+            reference_metrics(tracker.results, start_date=start_date, end_date=end_date)
+        )
+    
+    def test_aware_timestamps(self, tmp_path):
+        """Test that time zone aware timestamps are recorded, updated, filtered and reloaded."""
+        path = str(tmp_path / 'results.jsonl')
+        tracker = ABTestTracker(storage_path=path)
+        utc_plus_2 = timezone(timedelta(hours=2))
+        timestamp = datetime(2025, 1, 1, 11, 0, tzinfo=utc_plus_2)
+        tracker.record_prediction('user_0', 'champion', 'WTI', 70.0, timestamp=timestamp)
+        tracker.record_prediction('user_1', 'champion', 'WTI', 75.0, timestamp=timestamp + timedelta(minutes=5))
+        
+        tracker.update_actual('user_0', datetime(2025, 1, 1, 9, 0, 30, tzinfo=timezone.utc), 72.0)
+        
+        assert len(tracker.results) == tracker._columns.n_rows == 2
+        assert tracker.results[0].actual == 72.0
+        metrics = tracker.get_metrics(end_date=datetime(2025, 1, 1, 9, 1, tzinfo=timezone.utc))
+        assert metrics['total_predictions'] == 1
+        
+        tracker.close()
+        assert stored_results(ABTestTracker(storage_path=path)) == stored_results(tracker)
+    
+    def test_invalid_timestamp_leaves_state_unchanged(self):
+        """Test that a timestamp that cannot be converted is rejected before anything is recorded."""
+        tracker = ABTestTracker()
+        record_results(tracker, 3)
+        
+        with pytest.raises((TypeError, AttributeError)):
+            tracker.record_prediction('user_3', 'champion', 'WTI', 70.0, timestamp='2025-01-01')
+        
+        assert len(tracker.results) == tracker._columns.n_rows == 3
+        assert tracker.get_metrics_fast()['total_predictions'] == 3
+
+
+class TestABTestTrackerIncrementalState:
+    """Tests for the metrics cache, running sums and update index."""
+    
+    FILTERS = [
+        {},
+        {'model_version': 'champion'},
+        {'model_version': 'challenger', 'commodity': 'NG'},
+        {'commodity': 'WTI', 'start_date': BASE_TIME + timedelta(minutes=25)},
+    ]
+    
+    def test_cached_metrics_refreshed_after_update_actual(self):
+        """Test that cached filtered metrics reflect later actual values and predictions."""
+        tracker = ABTestTracker()
+        record_results(tracker, 100)
+        for filters in self.FILTERS:
+            tracker.get_metrics(**filters)
+        
+        for i in range(1, 100, 2):
+            tracker.update_actual(f'user_{i}', BASE_TIME + timedelta(minutes=i), 50.0 + i)
+            if i % 10 == 1:
+                for filters in self.FILTERS:
+                    assert_metrics_equal(tracker.get_metrics(**filters), reference_metrics(tracker.results, **filters))
+        
+        tracker.record_prediction(
+            'user_new', 'challenger', 'NG', 80.0, actual=60.0, timestamp=BASE_TIME + timedelta(minutes=200)
+        )
+        for filters in self.FILTERS:
+            assert_metrics_equal(tracker.get_metrics(**filters), reference_metrics(tracker.results, **filters))
+    
+    def test_cached_metrics_not_shared_between_callers(self):
+        """Test that changing a returned metrics dictionary does not change the cache."""
+        tracker = ABTestTracker()
+        record_results(tracker, 20)
+        
+        metrics = tracker.get_metrics('champion')
+        metrics['mae'] = -1.0
+        
+        assert tracker.get_metrics('champion')['mae'] > 0
+    
+    def test_metrics_cache_bounded(self):
+        """Test that distinct queries beyond MAX_CACHED_METRICS are still answered correctly."""
+        tracker = ABTestTracker()
+        tracker.MAX_CACHED_METRICS = 4
+        record_results(tracker, 60)
+        
+        for minutes in range(0, 60, 5):
+            start_date = BASE_TIME + timedelta(minutes=minutes)
+            assert_metrics_equal(
+                tracker.get_metrics(start_date=start_date),
+                reference_metrics(tracker.results, start_date=start_date)
+            )
+            assert len(tracker._metrics_cache) <= 4
+    
+    @pytest.mark.parametrize('model_version, commodity', [
+        (None, None), ('champion', None), (None, 'NG'), ('challenger', 'WTI'), ('unknown', None)
+    ])
+    def test_get_metrics_fast_matches_reference(self, model_version, commodity):
+        """Test running-sum metrics after actual values are set and overwritten."""
+        tracker = ABTestTracker()
+        record_results(tracker, 120)
+        for i in range(0, 120, 3):
+            tracker.update_actual(f'user_{i}', BASE_TIME + timedelta(minutes=i), 65.0 + i % 7)
+        
+        expected = reference_metrics(tracker.results, model_version, commodity)
+        expected.pop('directional_accuracy', None)
+        
+        assert_metrics_equal(tracker.get_metrics_fast(model_version, commodity), expected)
+    
+    def test_update_actual_matches_within_one_minute(self):
+        """Test that the earliest of the user's predictions within one minute is updated."""
+        tracker = ABTestTracker()
+        for seconds in (0, 50, 100):
+            tracker.record_prediction(
+                'user_0', 'champion', 'WTI', 70.0, timestamp=BASE_TIME + timedelta(seconds=seconds)
+            )
+        tracker.record_prediction('user_1', 'champion', 'WTI', 70.0, timestamp=BASE_TIME + timedelta(seconds=40))
+        
+        tracker.update_actual('user_0', BASE_TIME + timedelta(seconds=45), 71.0)
+        tracker.update_actual('user_0', BASE_TIME + timedelta(seconds=150), 72.0)
+        tracker.update_actual('user_0', BASE_TIME + timedelta(seconds=300), 73.0)
+        
+        assert [result.actual for result in tracker.results] == [71.0, None, 72.0, None]
+        assert tracker.get_metrics_fast()['predictions_with_actual'] == 2
+    
+    def test_zero_actual_corrected(self):
+        """Test that correcting a zero actual value leaves MAPE finite and matching the reference."""
+        tracker = ABTestTracker()
+        record_results(tracker, 10)
+        tracker.record_prediction('user_z', 'champion', 'WTI', 6.0, timestamp=BASE_TIME + timedelta(minutes=30))
+        
+        tracker.update_actual('user_z', BASE_TIME + timedelta(minutes=30), 0.0)
+        expected = reference_metrics(tracker.results, model_version='champion')
+        assert_metrics_equal(tracker.get_metrics('champion'), expected)
+        expected.pop('directional_accuracy')
+        assert_metrics_equal(tracker.get_metrics_fast('champion'), expected)
+        
+        tracker.update_actual('user_z', BASE_TIME + timedelta(minutes=30), 5.0)
+        expected = reference_metrics(tracker.results, model_version='champion')
+        assert_metrics_equal(tracker.get_metrics('champion'), expected)
+        expected.pop('directional_accuracy')
+        assert_metrics_equal(tracker.get_metrics_fast('champion'), expected)
+        assert math.isfinite(tracker.get_metrics_fast('champion')['mape'])
+    
+    def test_mape_nan_when_all_actuals_zero(self):
+        """Test that MAPE is NaN, not infinite, when every actual value is zero."""
+        tracker = ABTestTracker()
+        tracker.record_prediction('user_0', 'champion', 'WTI', 1.0, actual=0.0, timestamp=BASE_TIME)
+        
+        assert math.isnan(tracker.get_metrics()['mape'])
+        assert math.isnan(tracker.get_metrics_fast()['mape'])
+        assert tracker.get_metrics_fast()['mae'] == 1.0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,391 @@
+"""
+Unit tests for model performance monitoring.
+
+Tests the window-sum kernels, PredictionLogger (column storage, sliding
+window sums, batch logging) and RollingMetricsCalculator.
+
+Author: AI Assistant
+Date: December 15, 2025
+"""
+
+import pytest
+import math
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from mlops import _kernels, performance_monitoring
+    from mlops._columns import PredictionColumns, timestamp_ns
+    from mlops.performance_monitoring import PredictionLogger, RollingMetricsCalculator
+    PERFORMANCE_MONITORING_AVAILABLE = True
+except ImportError:
+    PERFORMANCE_MONITORING_AVAILABLE = False
+    pytest.skip("MLOps module not available", allow_module_level=True)
+
+
+BASE_TIME = datetime(2025, 1, 1)
+
+
+def reference_metrics(records, start_date, end_date, model_version=None, commodity=None):
+    """Compute calculate_rolling_metrics() with plain Python loops over the records."""
+    window = [
+        r for r in records
+        if r.actual is not None and start_date <= r.timestamp <= end_date
+        and (not model_version or r.model_version == model_version)
+        and (not commodity or r.commodity == commodity)
+    ]
+    if not window:
+        return {'sample_count': 0}
+    
+    n = len(window)
+    errors = [r.prediction - r.actual for r in window]
+    nonzero = [(e, r.actual) for e, r in zip(errors, window) if r.actual != 0]
+    metrics = {
+        'sample_count': n,
+        'mae': sum(abs(e) for e in errors) / n,
+        'rmse': math.sqrt(sum(e * e for e in errors) / n),
+        'mape': sum(abs(e / a) for e, a in nonzero) / len(nonzero) if nonzero else float('nan'),
+        'mean_prediction': sum(r.prediction for r in window) / n,
+        'mean_actual': sum(r.actual for r in window) / n,
+    }
+    if n > 1:
+        same_direction = [
+            (cur.prediction > prev.prediction) == (cur.actual > prev.actual)
+            for prev, cur in zip(window, window[1:])
+        ]
+        metrics['directional_accuracy'] = sum(same_direction) / len(same_direction)
+    return metrics
+
+
+def assert_metrics_match(metrics, expected):
+    """Compare rolling metrics with reference_metrics(), floats approximately."""
+    assert metrics['sample_count'] == expected['sample_count']
+    for name, value in expected.items():
+        if name == 'sample_count':
+            continue
+        if math.isnan(value):
+            assert math.isnan(metrics[name]), name
+        else:
+            assert metrics[name] == pytest.approx(value, rel=1e-9, abs=1e-12), name
+    assert ('directional_accuracy' in metrics) == ('directional_accuracy' in expected)
+
+
+def make_rows(n, seed=0, shuffle_every=None):
+    """Rows of predictions one hour apart (optionally with some timestamps moved back)."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(n):
+        timestamp = BASE_TIME + timedelta(hours=i)
+        if shuffle_every and i % shuffle_every == 0:
+            timestamp -= timedelta(hours=int(rng.integers(1, 100)))
+        rows.append({
+            'model_version': 'v1' if i % 3 else 'v2',
+            'commodity': 'WTI' if i % 4 else 'NG',
+            'horizon': int(rng.integers(1, 30)),
+            'prediction': float(rng.uniform(60, 90)),
+            'model_type': 'lstm' if i % 2 else None,
+            'timestamp': timestamp,
+        })
+    return rows
+
+
+def log_rows(prediction_logger, rows):
+    """Log rows one prediction at a time."""
+    return [prediction_logger.log_prediction(**row) for row in rows]
+
+
+class TestKernels:
+    """Tests for the window-sum kernels."""
+    
+    @staticmethod
+    def make_arrays(n=500, seed=0):
+        rng = np.random.default_rng(seed)
+        predictions = rng.uniform(60, 90, n)
+        actuals = rng.uniform(60, 90, n)
+        actuals[::7] = 0.0
+        mask = rng.random(n) < 0.6
+        # Unselected rows may hold NaN actuals and errors
+        actuals[~mask & (rng.random(n) < 0.5)] = np.nan
+        errors = predictions - actuals
+        return predictions, actuals, errors, mask
+    
+    def kernel_pairs(self):
+        pairs = [(_kernels._window_sums_loop, _kernels._direction_matches_loop)]
+        if _kernels.NUMBA_AVAILABLE:
+            pairs.append((_kernels.window_sums, _kernels.direction_matches))
+        return pairs
+    
+    @pytest.mark.parametrize('seed', [0, 1, 2])
+    def test_window_sums_match_numpy(self, seed):
+        """Test the loop (and compiled) window sums against the NumPy fallback."""
+        arrays = self.make_arrays(seed=seed)
+        expected = _kernels._window_sums_numpy(*arrays)
+        
+        for window_sums, _ in self.kernel_pairs():
+            sums = window_sums(*arrays)
+            assert sums[0] == expected[0]
+            assert sums[4] == expected[4]
+            assert np.allclose(sums, expected, rtol=1e-12)
+    
+    @pytest.mark.parametrize('seed', [0, 1, 2])
+    def test_direction_matches_match_numpy(self, seed):
+        """Test the loop (and compiled) directional matches against the NumPy fallback."""
+        predictions, actuals, _, mask = self.make_arrays(seed=seed)
+        expected = _kernels._direction_matches_numpy(predictions, actuals, mask)
+        
+        for _, direction_matches in self.kernel_pairs():
+            assert tuple(direction_matches(predictions, actuals, mask)) == expected
+    
+    def test_empty_mask(self):
+        """Test that kernels return zeros when no row is selected."""
+        predictions, actuals, errors, mask = self.make_arrays(n=10)
+        mask[:] = False
+        
+        for window_sums, direction_matches in self.kernel_pairs() + [
+            (_kernels._window_sums_numpy, _kernels._direction_matches_numpy)
+        ]:
+            assert tuple(window_sums(predictions, actuals, errors, mask)) == (0, 0.0, 0.0, 0.0, 0, 0.0, 0.0)
+            assert tuple(direction_matches(predictions, actuals, mask)) == (0, 0)
+
+
+class TestPredictionColumns:
+    """Tests for the column store shared by PredictionLogger and ABTestTracker."""
+    
+    @staticmethod
+    def make_columns(rows):
+        columns = PredictionColumns()
+        for i, row in enumerate(rows):
+            actual = 70.0 + i if i % 2 else None
+            error = abs(row['prediction'] - actual) if actual is not None else None
+            columns.append(
+                row['prediction'], actual, error, row['timestamp'], row['model_version'], row['commodity']
+            )
+        return columns
+    
+    def test_timestamp_ns(self):
+        """Test that naive timestamps are taken as they are and aware ones converted to UTC."""
+        naive = datetime(2025, 1, 1, 12, 0, 0, 1)
+        
+        assert timestamp_ns(naive) == (naive - datetime(1970, 1, 1)) // timedelta(microseconds=1) * 1000
+        assert timestamp_ns(naive.replace(tzinfo=timezone.utc)) == timestamp_ns(naive)
+        assert timestamp_ns(naive.replace(tzinfo=timezone(timedelta(hours=2)))) == (
+            timestamp_ns(naive) - 2 * 3600 * 10**9
+        )
+    
+    @pytest.mark.parametrize('shuffle_every', [None, 5])
+    @pytest.mark.parametrize('filters', [
+        {},
+        {'model_version': 'v2', 'start_date': BASE_TIME + timedelta(hours=20)},
+        {'commodity': 'NG', 'end_date': BASE_TIME + timedelta(hours=150), 'with_actual_only': True},
+        {'model_version': 'unknown'},
+    ])
+    def test_filter_rows_matches_reference(self, shuffle_every, filters):
+        """Test row filters, by binary search on ordered rows and by masks otherwise."""
+        rows = make_rows(200, shuffle_every=shuffle_every)
+        columns = self.make_columns(rows)
+        assert columns.timestamps_sorted == (shuffle_every is None)
+        
+        lo, hi, mask = columns.filter_rows(
+            filters.get('model_version'), filters.get('commodity'),
+            filters.get('start_date'), filters.get('end_date'), filters.get('with_actual_only', False)
+        )
+        
+        expected = [
+            i for i, row in enumerate(rows)
+            if filters.get('model_version', row['model_version']) == row['model_version']
+            and filters.get('commodity', row['commodity']) == row['commodity']
+            and filters.get('start_date', row['timestamp']) <= row['timestamp']
+            and row['timestamp'] <= filters.get('end_date', row['timestamp'])
+            and not (filters.get('with_actual_only') and i % 2 == 0)
+        ]
+        assert (np.flatnonzero(mask) + lo).tolist() == expected
+    
+    def test_append_bad_timestamp_leaves_columns_unchanged(self):
+        """Test that a row with an invalid timestamp is rejected before anything changes."""
+        columns = self.make_columns(make_rows(3))
+        
+        with pytest.raises(AttributeError):
+            columns.append(70.0, None, None, None, 'v3', 'HO')
+        with pytest.raises(AttributeError):
+            columns.append_many([70.0, 71.0], [BASE_TIME, 'not a datetime'], ['v3', 'v3'], ['HO', 'HO'])
+        
+        assert columns.n_rows == 3
+        assert 'v3' not in columns.model_version_vocab
+        assert 'HO' not in columns.commodity_vocab
+
+
+class TestPredictionLoggerWindows:
+    """Tests for PredictionLogger window sums and RollingMetricsCalculator."""
+    
+    FILTERS = [
+        {},
+        {'model_version': 'v1'},
+        {'model_version': 'v2', 'commodity': 'NG'},
+        {'commodity': 'unknown'},
+    ]
+    
+    @pytest.mark.parametrize('numpy_kernels', [False, True])
+    @pytest.mark.parametrize('shuffle_every', [None, 10])
+    def test_sliding_windows_after_update_actual(self, shuffle_every, numpy_kernels, monkeypatch):
+        """Test rolling metrics as the window slides and actual values arrive and change."""
+        if numpy_kernels:
+            monkeypatch.setattr(performance_monitoring, 'window_sums', _kernels._window_sums_numpy)
+            monkeypatch.setattr(performance_monitoring, 'direction_matches', _kernels._direction_matches_numpy)
+        prediction_logger = PredictionLogger()
+        calculator = RollingMetricsCalculator(prediction_logger)
+        rng = np.random.default_rng(3)
+        rows = make_rows(24 * 20, seed=3, shuffle_every=shuffle_every)
+        ids = []
+        
+        for step in range(0, len(rows), 24):
+            ids += log_rows(prediction_logger, rows[step:step + 24])
+            for prediction_id in rng.choice(ids, size=16):
+                actual = 0.0 if prediction_id % 11 == 0 else float(rng.uniform(60, 90))
+                prediction_logger.update_actual(int(prediction_id), actual)
+            
+            end_date = BASE_TIME + timedelta(hours=step + 23)
+            for filters in self.FILTERS:
+                metrics = calculator.calculate_rolling_metrics(window_days=3, end_date=end_date, **filters)
+                expected = reference_metrics(
+                    prediction_logger._in_memory_storage, end_date - timedelta(days=3), end_date, **filters
+                )
+                assert_metrics_match(metrics, expected)
+        
+        assert prediction_logger._columns.timestamps_sorted == (shuffle_every is None)
+        if shuffle_every is None:
+            assert prediction_logger._windows
+    
+    def test_out_of_order_timestamp_disables_sliding(self):
+        """Test that a timestamp logged out of order drops the kept window sums."""
+        prediction_logger = PredictionLogger()
+        calculator = RollingMetricsCalculator(prediction_logger)
+        for i, prediction_id in enumerate(log_rows(prediction_logger, make_rows(48))):
+            prediction_logger.update_actual(prediction_id, 70.0 + i % 5)
+        end_date = BASE_TIME + timedelta(hours=47)
+        calculator.calculate_rolling_metrics(window_days=1, end_date=end_date)
+        assert prediction_logger._windows
+        
+        late_id = prediction_logger.log_prediction('v1', 'WTI', 1, 90.0, timestamp=BASE_TIME + timedelta(hours=40))
+        prediction_logger.update_actual(late_id, 60.0)
+        
+        assert not prediction_logger._columns.timestamps_sorted
+        assert not prediction_logger._windows
+        assert_metrics_match(
+            calculator.calculate_rolling_metrics(window_days=1, end_date=end_date),
+            reference_metrics(prediction_logger._in_memory_storage, end_date - timedelta(days=1), end_date)
+        )
+        predictions = prediction_logger.get_predictions(
+            start_date=BASE_TIME + timedelta(hours=39), end_date=BASE_TIME + timedelta(hours=41)
+        )
+        assert [r.timestamp.hour for r in predictions] == [15, 16, 17, 16]
+    
+    @pytest.mark.parametrize('filters', FILTERS)
+    def test_multiple_windows_match_single_windows(self, filters):
+        """Test that calculate_multiple_windows() matches one window at a time."""
+        prediction_logger = PredictionLogger()
+        calculator = RollingMetricsCalculator(prediction_logger)
+        rng = np.random.default_rng(5)
+        for prediction_id in log_rows(prediction_logger, make_rows(24 * 40, seed=5)):
+            if rng.random() < 0.7:
+                prediction_logger.update_actual(prediction_id, float(rng.uniform(60, 90)))
+        end_date = BASE_TIME + timedelta(days=35)
+        
+        results = calculator.calculate_multiple_windows([1, 7, 30], end_date=end_date, **filters)
+        
+        for window in (1, 7, 30):
+            metrics = results[f'{window}_day']
+            assert metrics['end_date'] == end_date.isoformat()
+            expected = reference_metrics(
+                prediction_logger._in_memory_storage, end_date - timedelta(days=window), end_date, **filters
+            )
+            assert_metrics_match(metrics, expected)
+    
+    def test_get_predictions_filters(self):
+        """Test get_predictions() filters against filtering the records directly."""
+        prediction_logger = PredictionLogger()
+        records = prediction_logger._in_memory_storage
+        for prediction_id in log_rows(prediction_logger, make_rows(200, shuffle_every=9)):
+            if prediction_id % 2:
+                prediction_logger.update_actual(prediction_id, 70.0)
+        start_date = BASE_TIME + timedelta(hours=50)
+        end_date = BASE_TIME + timedelta(hours=150)
+        
+        assert prediction_logger.get_predictions() == records
+        assert prediction_logger.get_predictions(
+            model_version='v2', start_date=start_date, end_date=end_date, with_actual_only=True
+        ) == [
+            r for r in records
+            if r.model_version == 'v2' and start_date <= r.timestamp <= end_date and r.actual is not None
+        ]
+
+
+class TestPredictionLoggerBatch:
+    """Tests for PredictionLogger.log_predictions_batch."""
+    
+    @pytest.mark.parametrize('shuffle_every', [None, 7])
+    def test_batch_matches_single_logging(self, shuffle_every):
+        """Test that batches give the same records, columns and metrics as one call per row."""
+        single = PredictionLogger()
+        batched = PredictionLogger()
+        rows = make_rows(300, seed=7, shuffle_every=shuffle_every)
+        
+        for start in range(0, len(rows), 50):
+            chunk = rows[start:start + 50]
+            expected_ids = log_rows(single, chunk)
+            ids = batched.log_predictions_batch(pd.DataFrame(chunk))
+            assert ids.tolist() == expected_ids
+            for prediction_id in expected_ids[::3]:
+                single.update_actual(prediction_id, 75.0)
+                batched.update_actual(prediction_id, 75.0)
+        
+        assert [r.to_dict() for r in batched._in_memory_storage] == [r.to_dict() for r in single._in_memory_storage]
+        for name in PredictionColumns.COLUMNS:
+            assert np.array_equal(
+                getattr(batched._columns, name)[:batched._columns.n_rows],
+                getattr(single._columns, name)[:single._columns.n_rows],
+                equal_nan=True
+            ), name
+        assert batched._columns.timestamps_sorted == single._columns.timestamps_sorted
+        
+        end_date = BASE_TIME + timedelta(hours=299)
+        assert (
+            RollingMetricsCalculator(batched).calculate_multiple_windows([1, 7], end_date=end_date)
+            == RollingMetricsCalculator(single).calculate_multiple_windows([1, 7], end_date=end_date)
+        )
+    
+    def test_batch_defaults(self):
+        """Test that model_type and timestamp are optional and Python types are stored."""
+        prediction_logger = PredictionLogger()
+        before = datetime.now()
+        
+        ids = prediction_logger.log_predictions_batch(pd.DataFrame({
+            'model_version': ['v1', 'v1'],
+            'commodity': ['WTI', 'NG'],
+            'horizon': [1, 7],
+            'prediction': [70.0, 3.5],
+        }))
+        
+        records = prediction_logger.get_predictions()
+        assert ids.tolist() == [0, 1]
+        assert all(r.model_type is None and r.timestamp >= before for r in records)
+        assert all(type(r.horizon) is int and type(r.timestamp) is datetime for r in records)
+    
+    def test_batch_missing_columns(self):
+        """Test that a batch without required columns is rejected."""
+        prediction_logger = PredictionLogger()
+        
+        with pytest.raises(ValueError, match="Missing required columns"):
+            prediction_logger.log_predictions_batch(pd.DataFrame({'model_version': ['v1']}))
+        
+        assert prediction_logger.get_predictions() == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])